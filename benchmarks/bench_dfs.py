@@ -0,0 +1,296 @@
+'''
+Benchmark of the DFS read and write hot paths, on synthetic files.
+
+Files are generated in a temporary folder with DfsBuilder, DfsuBuilder and
+MeshBuilder, at the sizes given by --sizes. For each size, the following
+operations are timed, reporting the median of --repeat runs:
+
+    dfs2 write        Create a dfs2 file, WriteItemTimeStepNext of all item-timesteps
+    dfs2 read next    Sequential ReadItemTimeStepNext of all item-timesteps
+    dfs2 read random  ReadItemTimeStep of random item-timesteps
+    dfs0 write        Create a non-equidistant dfs0 file, WriteDfs0DataDouble
+    dfs0 read         ReadDfs0DataDouble
+    dfs0 time index   TimeIndex of the non-equidistant dfs0 file
+    mesh write        MeshFile.Write
+    mesh read         MeshFile.ReadMesh
+    dfsu write        Create a dfsu file, WriteItemTimeStepNext of all item-timesteps
+    dfsu open         DfsuFile.Open
+    element centers   CalculateElementCenterCoordinates, on a newly opened file
+    projection        Cartography.Geo2ProjArray and Proj2GeoArray of all mesh nodes
+
+Results can be saved with --json, and compared with a previously saved
+baseline with --baseline, flagging operations slower than the baseline by
+more than --threshold.
+
+Usage:
+    python benchmarks/bench_dfs.py [--sizes small,medium] [--repeat N]
+                                   [--json FILE] [--baseline FILE] [--threshold 0.1]
+'''
+import argparse
+import datetime
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from mikecore.DfsBuilder import DfsBuilder
+from mikecore.DfsFactory import DfsFactory
+from mikecore.DfsFile import DfsSimpleType, DataValueType, StatType
+from mikecore.DfsFileFactory import DfsFileFactory
+from mikecore.DfsuBuilder import DfsuBuilder
+from mikecore.DfsuFile import DfsuFile, DfsuFileType
+from mikecore.MeshBuilder import MeshBuilder
+from mikecore.MeshFile import MeshFile
+from mikecore.Projections import Cartography
+from mikecore.eum import eumItem, eumUnit, eumQuantity
+
+# Size of the synthetic files:
+#   dfs2: grid points in x and y, number of time steps (3 items)
+#   dfs0: number of time steps (4 items)
+#   mesh: nodes in x and y, of a mesh of triangles. The dfsu file has 2 items.
+SIZES = {
+    "small":  dict(dfs2=(100, 100, 20),  dfs0=10000,   mesh=(50, 50),   dfsuSteps=20),
+    "medium": dict(dfs2=(400, 400, 20),  dfs0=200000,  mesh=(200, 200), dfsuSteps=20),
+    "large":  dict(dfs2=(1000, 1000, 20), dfs0=2000000, mesh=(500, 500), dfsuSteps=10),
+}
+
+NUM_RANDOM_READS = 200
+
+
+def Measure(func, repeat, setup=None):
+    '''
+    Median time in seconds of repeat calls to func. When setup is given, it
+    is called before each call, untimed, and its result is passed to func.
+    '''
+    times = []
+    for i in range(repeat):
+        arg = setup() if setup is not None else None
+        t0 = time.perf_counter()
+        if setup is not None:
+            func(arg)
+        else:
+            func()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times)
+
+
+def CreateDfs2(filename, nx, ny, numTimeSteps):
+    factory = DfsFactory()
+    builder = DfsBuilder.Create("bench", "bench_dfs", 0)
+    builder.SetDataType(1)
+    builder.SetGeographicalProjection(factory.CreateProjectionGeoOrigin("UTM-33", 12.4, 55.2, 0))
+    builder.SetTemporalAxis(factory.CreateTemporalEqCalendarAxis(eumUnit.eumUsec, datetime.datetime(2020, 1, 1), 0, 3600))
+    builder.SetSpatialAxis(factory.CreateAxisEqD2(eumUnit.eumUmeter, nx, 0, 100, ny, 0, 100))
+    builder.SetItemStatisticsType(StatType.NoStat)
+    builder.AddCreateDynamicItem("H", eumQuantity.Create(eumItem.eumIWaterLevel, eumUnit.eumUmeter), DfsSimpleType.Float, DataValueType.Instantaneous)
+    builder.AddCreateDynamicItem("P", eumQuantity.Create(eumItem.eumIFlowFlux, eumUnit.eumUm3PerSecPerM), DfsSimpleType.Float, DataValueType.Instantaneous)
+    builder.AddCreateDynamicItem("Q", eumQuantity.Create(eumItem.eumIFlowFlux, eumUnit.eumUm3PerSecPerM), DfsSimpleType.Float, DataValueType.Instantaneous)
+    builder.CreateFile(filename)
+    dfsFile = builder.GetFile()
+    data = np.random.default_rng(0).random(nx * ny, dtype=np.float32)
+    for i in range(numTimeSteps):
+        for j in range(3):
+            dfsFile.WriteItemTimeStepNext(0, data)
+    dfsFile.Close()
+
+
+def ReadDfs2Next(filename):
+    dfsFile = DfsFileFactory.DfsGenericOpen(filename)
+    itemData = dfsFile.ItemInfo[0].CreateEmptyItemData()
+    while dfsFile.ReadItemTimeStepNext(itemData) is not None:
+        pass
+    dfsFile.Close()
+
+
+def ReadDfs2Random(filename, numTimeSteps):
+    rng = np.random.default_rng(0)
+    items = rng.integers(1, 4, NUM_RANDOM_READS)
+    timesteps = rng.integers(0, numTimeSteps, NUM_RANDOM_READS)
+    dfsFile = DfsFileFactory.DfsGenericOpen(filename)
+    for item, timestep in zip(items, timesteps):
+        dfsFile.ReadItemTimeStep(int(item), int(timestep))
+    dfsFile.Close()
+
+
+def CreateDfs0(filename, numTimeSteps):
+    factory = DfsFactory()
+    builder = DfsBuilder.Create("bench", "bench_dfs", 0)
+    builder.SetDataType(1)
+    builder.SetGeographicalProjection(factory.CreateProjectionUndefined())
+    builder.SetTemporalAxis(factory.CreateTemporalNonEqCalendarAxis(eumUnit.eumUsec, datetime.datetime(2020, 1, 1)))
+    builder.SetItemStatisticsType(StatType.NoStat)
+    for i in range(4):
+        item = builder.CreateDynamicItemBuilder()
+        item.Set("Rain {}".format(i + 1), eumQuantity.Create(eumItem.eumIRainfall, eumUnit.eumUmillimeter), DfsSimpleType.Float)
+        item.SetValueType(DataValueType.Instantaneous)
+        item.SetAxis(factory.CreateAxisEqD0())
+        builder.AddDynamicItem(item.GetDynamicItemInfo())
+    builder.CreateFile(filename)
+    dfsFile = builder.GetFile()
+    rng = np.random.default_rng(0)
+    data = np.empty((numTimeSteps, 5))
+    data[:, 0] = np.cumsum(rng.integers(1, 600, numTimeSteps))
+    data[:, 1:] = rng.random((numTimeSteps, 4))
+    dfsFile.WriteDfs0DataDouble(data)
+    dfsFile.Close()
+
+
+def ReadDfs0(filename):
+    dfsFile = DfsFileFactory.DfsGenericOpen(filename)
+    dfsFile.ReadDfs0DataDouble()
+    dfsFile.Close()
+
+
+def ReadDfs0TimeIndex(filename):
+    dfsFile = DfsFileFactory.DfsGenericOpen(filename)
+    dfsFile.TimeIndex
+    dfsFile.Close()
+
+
+def CreateMesh(nx, ny):
+    x, y = np.meshgrid(12.0 + 0.001 * np.arange(nx), 55.0 + 0.001 * np.arange(ny), indexing='ij')
+    x = x.ravel()
+    y = y.ravel()
+    z = -10.0 * np.ones(x.size)
+    code = np.zeros(x.size, dtype=np.int32)
+    # Node numbers (1-based) of the lower left node of each grid cell, two triangles per cell
+    node = (np.arange(nx - 1)[:, None] * ny + np.arange(ny - 1)[None, :]).ravel() + 1
+    elements = np.empty((2 * node.size, 3), dtype=np.int32)
+    elements[0::2] = np.stack((node, node + ny, node + ny + 1), axis=1)
+    elements[1::2] = np.stack((node, node + ny + 1, node + 1), axis=1)
+    builder = MeshBuilder()
+    builder.SetProjection("LONG/LAT")
+    builder.SetNodes(x, y, z, code)
+    builder.SetElements(elements)
+    return builder.CreateMesh()
+
+
+def CreateDfsu(filename, mesh, numTimeSteps):
+    builder = DfsuBuilder.Create(DfsuFileType.Dfsu2D)
+    builder.SetFromMeshFile(mesh)
+    builder.SetTimeInfo(datetime.datetime(2020, 1, 1), 3600)
+    builder.AddDynamicItem("Surface elevation", eumQuantity.Create(eumItem.eumIWaterLevel, eumUnit.eumUmeter))
+    builder.AddDynamicItem("Current speed", eumQuantity.Create(eumItem.eumICurrentSpeed, eumUnit.eumUmeterPerSec))
+    dfsuFile = builder.CreateFile(filename)
+    data = np.random.default_rng(0).random(mesh.NumberOfElements, dtype=np.float32)
+    for i in range(numTimeSteps):
+        for j in range(2):
+            dfsuFile.WriteItemTimeStepNext(0, data)
+    dfsuFile.Close()
+
+
+def ElementCenters(dfsuFile):
+    dfsuFile.CalculateElementCenterCoordinates()
+    dfsuFile.Close()
+
+
+def Projection(cart, lon, lat):
+    east, north = cart.Geo2ProjArray(lon, lat)
+    cart.Proj2GeoArray(east, north)
+
+
+def RunSize(folder, size, repeat):
+    '''
+    Run all benchmarks for one size. Returns a list of (name, seconds, megabytes)
+    where megabytes is the amount of item data processed, or None.
+    '''
+    params = SIZES[size]
+    results = []
+    MB = 1.0 / (1024 * 1024)
+
+    nx, ny, numTimeSteps = params["dfs2"]
+    dfs2Filename = os.path.join(folder, size + ".dfs2")
+    dfs2MB = 3 * numTimeSteps * nx * ny * 4 * MB
+    randomMB = NUM_RANDOM_READS * nx * ny * 4 * MB
+    results.append(("dfs2 write", Measure(lambda: CreateDfs2(dfs2Filename, nx, ny, numTimeSteps), repeat), dfs2MB))
+    results.append(("dfs2 read next", Measure(lambda: ReadDfs2Next(dfs2Filename), repeat), dfs2MB))
+    results.append(("dfs2 read random", Measure(lambda: ReadDfs2Random(dfs2Filename, numTimeSteps), repeat), randomMB))
+
+    numTimeSteps = params["dfs0"]
+    dfs0Filename = os.path.join(folder, size + ".dfs0")
+    dfs0MB = numTimeSteps * (8 + 4 * 4) * MB
+    results.append(("dfs0 write", Measure(lambda: CreateDfs0(dfs0Filename, numTimeSteps), repeat), dfs0MB))
+    results.append(("dfs0 read", Measure(lambda: ReadDfs0(dfs0Filename), repeat), dfs0MB))
+    results.append(("dfs0 time index", Measure(lambda: ReadDfs0TimeIndex(dfs0Filename), repeat), None))
+
+    nx, ny = params["mesh"]
+    mesh = CreateMesh(nx, ny)
+    meshFilename = os.path.join(folder, size + ".mesh")
+    dfsuFilename = os.path.join(folder, size + ".dfsu")
+    numTimeSteps = params["dfsuSteps"]
+    dfsuMB = 2 * numTimeSteps * mesh.NumberOfElements * 4 * MB
+    results.append(("mesh write", Measure(lambda: mesh.Write(meshFilename), repeat), None))
+    results.append(("mesh read", Measure(lambda: MeshFile.ReadMesh(meshFilename), repeat), None))
+    results.append(("dfsu write", Measure(lambda: CreateDfsu(dfsuFilename, mesh, numTimeSteps), repeat), dfsuMB))
+    results.append(("dfsu open", Measure(lambda: DfsuFile.Open(dfsuFilename).Close(), repeat), None))
+    results.append(("element centers", Measure(ElementCenters, repeat, lambda: DfsuFile.Open(dfsuFilename)), None))
+
+    cart = Cartography("UTM-33")
+    lon = np.array(mesh.X)
+    lat = np.array(mesh.Y)
+    results.append(("projection", Measure(lambda: Projection(cart, lon, lat), repeat), None))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="small,medium", help="Comma separated sizes, of: " + ", ".join(SIZES))
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs for each measurement")
+    parser.add_argument("--json", help="Save results to this file")
+    parser.add_argument("--baseline", help="Compare with results saved with --json")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Relative slowdown reported as a regression")
+    args = parser.parse_args()
+
+    sizes = args.sizes.split(",")
+    for size in sizes:
+        if size not in SIZES:
+            parser.error("Unknown size: " + size)
+
+    baseline = {}
+    if (args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    allResults = {}
+    regressions = []
+    print("{:<8}{:<20}{:>12}{:>12}{:>14}".format("size", "", "time [ms]", "[MB/s]", "vs baseline"))
+    with tempfile.TemporaryDirectory() as folder:
+        for size in sizes:
+            for name, seconds, megabytes in RunSize(folder, size, args.repeat):
+                key = size + "/" + name
+                allResults[key] = seconds
+                rate = "{:>12.1f}".format(megabytes / seconds) if megabytes else "{:>12}".format("")
+                change = ""
+                if key in baseline:
+                    relative = seconds / baseline[key] - 1
+                    change = "{:+.1%}".format(relative)
+                    if relative > args.threshold:
+                        regressions.append(key)
+                        change += " !"
+                print("{:<8}{:<20}{:>12.2f}{}{:>14}".format(size, name, 1000 * seconds, rate, change))
+
+    if (args.json):
+        import mikecore
+        with open(args.json, "w") as f:
+            json.dump({"python": sys.version.split()[0],
+                       "numpy": np.__version__,
+                       "mikecore": getattr(mikecore, "__version__", None),
+                       "repeat": args.repeat,
+                       "results": allResults}, f, indent=2)
+
+    if (regressions):
+        print("Slower than baseline by more than {:.0%}: {}".format(args.threshold, ", ".join(regressions)))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+'''
+Benchmark of the table backed eumItem and eumUnit enums against IntEnum.
+
+Two modules with the eumItem and eumUnit tables of mikecore.eum are
+generated in a temporary folder, one defining them as IntEnum and one as
+TableEnum. Each is imported in a fresh interpreter (after byte compiling),
+measuring import time and allocated memory, and the time of the first and
+of repeated member lookups by name and by value.
+
+Usage:
+    python benchmarks/bench_eum.py [--repeat N]
+'''
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from mikecore.eum import eumItem, eumUnit
+
+# Code run in a fresh interpreter, printing import time, import memory,
+# first lookup time and repeated lookup time. The enum base class is
+# imported first, so only the enum definitions are measured.
+SCRIPT = '''
+import time, tracemalloc
+{preimport}
+tracemalloc.start()
+t0 = time.perf_counter()
+from {module} import eumItem, eumUnit
+t1 = time.perf_counter()
+memory = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+t2 = time.perf_counter()
+eumItem.eumIWaterLevel; eumUnit(1000)
+t3 = time.perf_counter()
+for i in range(100000):
+    eumItem.eumIWaterLevel; eumUnit(1000)
+t4 = time.perf_counter()
+print(t1 - t0, memory, t3 - t2, (t4 - t3) / 100000)
+'''
+
+
+def WriteModule(filename, baseClass, importLine, itemFormat):
+    with open(filename, "w") as f:
+        f.write(importLine + "\n\n")
+        for enum in (eumItem, eumUnit):
+            f.write("class {}({}):\n".format(enum.__name__, baseClass))
+            if (baseClass == "TableEnum"):
+                f.write('    _table = """\n')
+            for member in enum:
+                f.write(itemFormat.format(member.name, member.value))
+            if (baseClass == "TableEnum"):
+                f.write('    """\n')
+            f.write("\n")
+
+
+def Measure(folder, module, preimport, repeat):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = folder + os.pathsep + REPO_ROOT
+    results = []
+    for i in range(repeat):
+        res = subprocess.run([sys.executable, "-c", SCRIPT.format(module=module, preimport=preimport)],
+                             env=env, capture_output=True, text=True)
+        if (res.returncode != 0):
+            raise Exception("Benchmark script failed:\n" + res.stderr)
+        results.append([float(v) for v in res.stdout.split()])
+    return [statistics.median(r[i] for r in results) for i in range(4)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10, help="Number of runs for each measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        WriteModule(os.path.join(folder, "eum_intenum.py"), "IntEnum",
+                    "from enum import IntEnum", "    {} = {}\n")
+        WriteModule(os.path.join(folder, "eum_tableenum.py"), "TableEnum",
+                    "from mikecore.TableEnum import TableEnum", "    {} {}\n")
+        # Byte compile, so the measurements do not include compilation
+        subprocess.run([sys.executable, "-m", "compileall", "-q", folder], check=True)
+
+        print("{:<12}{:>14}{:>14}{:>18}{:>18}".format(
+            "", "import [ms]", "memory [kB]", "first lookup [us]", "lookup [ns]"))
+        for name, module, preimport in (("IntEnum", "eum_intenum", "import enum"),
+                                        ("TableEnum", "eum_tableenum", "import mikecore.TableEnum")):
+            importTime, memory, firstLookup, lookup = Measure(folder, module, preimport, args.repeat)
+            print("{:<12}{:>14.2f}{:>14.0f}{:>18.1f}{:>18.0f}".format(
+                name, 1000 * importTime, memory / 1024, 1e6 * firstLookup, 1e9 * lookup))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+'''
+Benchmark of the time to import mikecore, in a fresh interpreter for each run.
+
+Compares the default lazy loading of the native libraries with loading all
+of them at import (MIKECORE_EAGER_INIT=1), and with the time to first use of
+each native subsystem.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat N]
+'''
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Code run in a fresh interpreter. Prints the time in seconds spent in the code.
+SCRIPTS = {
+    "import mikecore":
+        "import mikecore",
+    "import + eum":
+        "import mikecore\n"
+        "from mikecore.eum import eumUnit, eumWrapper\n"
+        "eumWrapper.eumGetUnitAbbreviation(eumUnit.eumUmeter)",
+    "import + projections":
+        "import mikecore\n"
+        "from mikecore.Projections import MzCartDLL\n"
+        "MzCartDLL.Init()",
+    "import + dfs":
+        "import mikecore\n"
+        "from mikecore.DfsDLL import DfsDLL\n"
+        "DfsDLL.Init()",
+}
+
+TIMER = "import time\nt0 = time.perf_counter()\n{}\nprint(time.perf_counter() - t0)\n"
+
+
+def TimeScript(script, eager, repeat):
+    env = dict(os.environ)
+    env["MIKECORE_EAGER_INIT"] = "1" if eager else "0"
+    repoRoot = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = repoRoot + os.pathsep + env.get("PYTHONPATH", "")
+    times = []
+    for i in range(repeat):
+        res = subprocess.run([sys.executable, "-c", TIMER.format(script)],
+                             env=env, capture_output=True, text=True)
+        if (res.returncode != 0):
+            raise Exception("Benchmark script failed:\n" + res.stderr)
+        times.append(float(res.stdout.strip().splitlines()[-1]))
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10, help="Number of runs for each measurement")
+    args = parser.parse_args()
+
+    print("{:<22}{:>12}{:>12}".format("", "lazy [ms]", "eager [ms]"))
+    for name, script in SCRIPTS.items():
+        lazy = TimeScript(script, False, args.repeat)
+        eager = TimeScript(script, True, args.repeat)
+        print("{:<22}{:>12.1f}{:>12.1f}".format(name, 1000 * lazy, 1000 * eager))
+
+
+if __name__ == "__main__":
+    main()
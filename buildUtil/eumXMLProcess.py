@@ -39,15 +39,19 @@ print("# Predefined enums of EUM item types.");
 print("#");
 print("# Must be updated with every new release, or if the EUM.xml is updated");
 print("# Run buildUtil\eumXMLProcess.py to create the lists");
-print("class eumItem(IntEnum):");
+print("class eumItem(TableEnum):");
+print('    _table = """')
 for key in itemKeys:
-    print("    {} = {}".format(itemDict[key], key))
+    print("    {} {}".format(itemDict[key], key))
+print('    """')
 
 print("")
 print("# Predefined enums of EUM units.")
 print("#")
 print("# Must be updated with every new release, or if the EUM.xml is updated")
-print("class eumUnit(IntEnum):")
+print("class eumUnit(TableEnum):")
+print('    _table = """')
 for key in unitKeys:
-    print("    {} = {}".format(unitDict[key], key))
+    print("    {} {}".format(unitDict[key], key))
+print('    """')
         
\ No newline at end of file
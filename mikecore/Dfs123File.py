@@ -1,4 +1,5 @@
-from mikecore.DfsFile import DfsFile, DfsFileMode
+import numpy as np
+from mikecore.DfsFile import DfsFile, DfsFileMode, DfsSimpleType
 
 class Dfs123File(DfsFile):
     def __init__(self):
@@ -24,7 +25,71 @@ class Dfs123File(DfsFile):
         return res;
 
 class Dfs2File(Dfs123File):
-    pass
+
+    def GetSampleWeights(self, lon, lat, method = "nearest"):
+        '''
+        Weights for sampling the grid at geographical coordinates, as a
+        Dfs2RegridWeights from the grid cells to the points. Points outside
+        the grid have no weights.
+
+        :param lon: Longitudes of points
+        :param lat: Latitudes of points
+        :param method: "nearest" for the value of the cell containing the point,
+                       "bilinear" for bilinear interpolation between cell centers.
+        '''
+        from mikecore.Dfs2Reprojector import Dfs2RegridWeights
+        from mikecore.Projections import Cartography
+        if (method not in ("nearest", "bilinear")):
+            raise Exception("Unknown sample method '{}'. Must be 'nearest' or 'bilinear'".format(method))
+        axis = self.SpatialAxis
+        projection = self.FileInfo.Projection
+        cart = Cartography(projection.WKTString, projection.Longitude, projection.Latitude, projection.Orientation)
+        x, y = cart.Geo2XyArray(lon, lat)
+        # Fractional cell indices, cell (j,k) has its center at (X0 + j*Dx, Y0 + k*Dy)
+        fj = (x - axis.X0) / axis.Dx
+        fk = (y - axis.Y0) / axis.Dy
+        if (method == "bilinear"):
+            return Dfs2RegridWeights.Bilinear(fj, fk, axis.XCount, axis.YCount)
+        return Dfs2RegridWeights.Nearest(fj, fk, axis.XCount, axis.YCount)
+
+    def Sample(self, lon, lat, items = None, timesteps = None, method = "nearest"):
+        '''
+        Sample items at geographical coordinates, for a number of timesteps.
+
+        Coordinates are converted to grid cells once, see GetSampleWeights.
+        Cell values equal to the delete value of the item, DeleteValueDouble for
+        double items, else DeleteValueFloat, are not used. Points outside the
+        grid, or without any valid cell values, get the delete value of the item.
+
+        The result is double if any of the items are double, otherwise float.
+
+        :param lon: Longitudes of points
+        :param lat: Latitudes of points
+        :param items: Item numbers (1-based) to sample, default all items
+        :param timesteps: Timestep indices to sample, default all timesteps
+        :param method: "nearest" or "bilinear"
+        :returns: Array of size (number of timesteps, number of items, number of points)
+        '''
+        weights = self.GetSampleWeights(lon, lat, method)
+        if (items is None):
+            items = range(1, len(self.ItemInfo) + 1)
+        if (timesteps is None):
+            timesteps = range(self.FileInfo.TimeAxis.NumberOfTimeSteps)
+        items = list(items)
+        timesteps = list(timesteps)
+        isDouble = [self.ItemInfo[item - 1].DataType == DfsSimpleType.Double for item in items]
+        deleteValues = [self.FileInfo.DeleteValueDouble if double else self.FileInfo.DeleteValueFloat for double in isDouble]
+        dtype = np.float64 if any(isDouble) else np.float32
+
+        res = np.empty((len(timesteps), len(items), weights.TargetCount), dtype=dtype)
+        # One read buffer for each item, reused for all timesteps
+        itemDatas = [None] * len(items)
+        for i in range(len(timesteps)):
+            for j in range(len(items)):
+                itemData = self.ReadItemTimeStep(itemDatas[j] if itemDatas[j] is not None else items[j], timesteps[i])
+                itemDatas[j] = itemData
+                weights.Apply(itemData.Data, deleteValues[j], res[i, j])
+        return res
 
 class Dfs3File(Dfs123File):
     pass
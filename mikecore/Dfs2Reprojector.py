@@ -0,0 +1,247 @@
+import numpy as np
+from mikecore.DfsFile import *
+from mikecore.DfsBuilder import DfsBuilder
+from mikecore.Projections import Cartography
+
+
+class Dfs2RegridWeights:
+    '''
+    Interpolation weights from the cells of a source dfs2 grid to the cells of
+    a target dfs2 grid, for nearest cell or bilinear interpolation.
+
+    The weights are stored as a sparse matrix with a fixed number of source
+    cells for each target cell, in Indices and Weights, both of size
+    (number of target cells, entries per target cell). Target cells outside
+    the source grid have zero weights. The weights are calculated once for a
+    grid pair, and applied to the data of each timestep using Apply.
+
+    Cell values are stored x-index fastest, i.e. the value of cell (j,k) is
+    at index j + k*XCount.
+    '''
+
+    def __init__(self, indices, weights, sourceCount):
+        self.Indices = indices
+        self.Weights = weights
+        self.SourceCount = sourceCount
+
+    @property
+    def TargetCount(self):
+        return self.Indices.shape[0]
+
+    @staticmethod
+    def Create(sourceAxis, sourceProjection, targetAxis, targetProjection, interpolate = True):
+        '''
+        Calculate weights between two grids with DfsAxisEqD2 spatial axes.
+
+        :param sourceAxis: Spatial axis of the source grid
+        :param sourceProjection: DfsProjection of the source grid
+        :param targetAxis: Spatial axis of the target grid
+        :param targetProjection: DfsProjection of the target grid
+        :param interpolate: True for bilinear interpolation, False for nearest cell value.
+        '''
+        j, k = np.meshgrid(np.arange(targetAxis.XCount), np.arange(targetAxis.YCount), indexing='xy')
+        x = targetAxis.X0 + j.ravel() * targetAxis.Dx
+        y = targetAxis.Y0 + k.ravel() * targetAxis.Dy
+        x, y = Dfs2RegridWeights.ConvertXY(targetProjection, sourceProjection, x, y)
+        # Fractional source cell indices of the target cell centers
+        fj = (x - sourceAxis.X0) / sourceAxis.Dx
+        fk = (y - sourceAxis.Y0) / sourceAxis.Dy
+        if (interpolate):
+            return Dfs2RegridWeights.Bilinear(fj, fk, sourceAxis.XCount, sourceAxis.YCount)
+        return Dfs2RegridWeights.Nearest(fj, fk, sourceAxis.XCount, sourceAxis.YCount)
+
+    @staticmethod
+    def Nearest(fj, fk, xCount, yCount):
+        '''
+        Weights of the nearest source cell for points at fractional source cell indices (fj,fk).
+        '''
+        j = np.floor(fj + 0.5).astype(np.int64)
+        k = np.floor(fk + 0.5).astype(np.int64)
+        inside = (j >= 0) & (j < xCount) & (k >= 0) & (k < yCount)
+        indices = np.where(inside, j + k * xCount, 0).reshape(-1, 1)
+        weights = inside.astype(np.float64).reshape(-1, 1)
+        return Dfs2RegridWeights(indices, weights, xCount * yCount)
+
+    @staticmethod
+    def Bilinear(fj, fk, xCount, yCount):
+        '''
+        Bilinear weights of the 4 surrounding source cell centers for points at
+        fractional source cell indices (fj,fk). Points in the outer half of the
+        boundary cells use the values of the boundary cells.
+        '''
+        inside = (fj >= -0.5) & (fj < xCount - 0.5) & (fk >= -0.5) & (fk < yCount - 0.5)
+        j0 = np.clip(np.floor(fj), 0, max(xCount - 2, 0)).astype(np.int64)
+        k0 = np.clip(np.floor(fk), 0, max(yCount - 2, 0)).astype(np.int64)
+        tx = np.clip(fj - j0, 0, 1)
+        ty = np.clip(fk - k0, 0, 1)
+        j1 = np.minimum(j0 + 1, xCount - 1)
+        k1 = np.minimum(k0 + 1, yCount - 1)
+
+        indices = np.stack((j0 + k0 * xCount, j1 + k0 * xCount, j0 + k1 * xCount, j1 + k1 * xCount), axis=1)
+        weights = np.stack(((1 - tx) * (1 - ty), tx * (1 - ty), (1 - tx) * ty, tx * ty), axis=1)
+        indices[~inside] = 0
+        weights[~inside] = 0
+        return Dfs2RegridWeights(indices, weights, xCount * yCount)
+
+    @staticmethod
+    def ConvertXY(sourceProjection, targetProjection, x, y):
+        '''
+        Convert arrays of model coordinates of one projection to model coordinates
+        of another projection. When the projections are identical, the coordinates
+        are returned as is.
+        '''
+        if (Dfs2RegridWeights.__IsSameProjection(sourceProjection, targetProjection)):
+            return x, y
+        sourceCart = Cartography(sourceProjection.WKTString, sourceProjection.Longitude, sourceProjection.Latitude, sourceProjection.Orientation)
+        targetCart = Cartography(targetProjection.WKTString, targetProjection.Longitude, targetProjection.Latitude, targetProjection.Orientation)
+        lon, lat = sourceCart.Xy2GeoArray(x, y)
+        return targetCart.Geo2XyArray(lon, lat)
+
+    @staticmethod
+    def __IsSameProjection(projection1, projection2):
+        return (projection1.WKTString == projection2.WKTString and
+                projection1.Longitude == projection2.Longitude and
+                projection1.Latitude == projection2.Latitude and
+                projection1.Orientation == projection2.Orientation)
+
+    def Apply(self, data, deleteValue = None, out = None):
+        '''
+        Interpolate the source cell values in data to the target cells.
+
+        Source values equal to the delete value are not used, and the weights of
+        the remaining source cells are scaled to sum to one. Target cells without
+        any source values get the delete value.
+
+        :param data: Values of the source cells, of size SourceCount
+        :param deleteValue: Delete value of the data, None if data has no delete values
+        :param out: Optional array of size TargetCount for the result
+        '''
+        values = data.reshape(-1, order='F')[self.Indices]
+        weights = self.Weights
+        if (deleteValue is not None):
+            weights = np.where(values != deleteValue, weights, 0)
+        weightSum = weights.sum(axis=1)
+        hasValue = weightSum > 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            res = np.einsum('ij,ij->i', np.where(weights > 0, values, 0), weights) / weightSum
+        res[~hasValue] = np.nan if deleteValue is None else deleteValue
+        if (out is None):
+            return res.astype(data.dtype)
+        out[:] = res
+        return out
+
+
+class Dfs2Reprojector:
+    '''
+    Resample and reproject all items of a dfs2 file to a new grid,
+    possibly in a different projection.
+
+    Example: Reduce the resolution of a file by a factor of 2, keeping
+    the lower left corner of the grid:
+    ```
+    reproj = Dfs2Reprojector(dfs2File, outputFilename)
+    reproj.SetTarget(projection.WKTString, lonOrigin, latOrigin, projection.Orientation,
+                     axis.XCount//2, 0, 2*axis.Dx, axis.YCount//2, 0, 2*axis.Dy)
+    reproj.Interpolate = True
+    reproj.Process()
+    ```
+
+    The interpolation weights are calculated once, when first needed, and reused
+    for all items and timesteps.
+    '''
+
+    def __init__(self, dfs2File, outputFilename = None):
+        self.Dfs2File = dfs2File
+        self.OutputFilename = outputFilename
+        self.TargetProjection = dfs2File.FileInfo.Projection
+        self.TargetAxis = dfs2File.SpatialAxis
+        self.__interpolate = False
+        self.__weights = None
+
+    def __getInterpolate(self):
+        return self.__interpolate
+    def __setInterpolate(self, value):
+        if (value != self.__interpolate):
+            self.__weights = None
+        self.__interpolate = value
+    # True for bilinear interpolation, False for nearest cell value
+    Interpolate = property(__getInterpolate, __setInterpolate)
+
+    def SetTarget(self, projectionString, lonOrigin, latOrigin, orientation, xCount, x0, dx, yCount, y0, dy):
+        '''
+        Set the projection and grid of the target.
+
+        :param projectionString: Projection string of the target
+        :param lonOrigin: Longitude of the origin of the target model coordinates
+        :param latOrigin: Latitude of the origin of the target model coordinates
+        :param orientation: Orientation of the target grid, in degrees clockwise from true north
+        '''
+        self.TargetProjection = DfsProjection.CreateWithGeoOrigin(projectionString, lonOrigin, latOrigin, orientation)
+        self.TargetAxis = DfsAxisEqD2(self.Dfs2File.SpatialAxis.AxisUnit, xCount, x0, dx, yCount, y0, dy)
+        self.__weights = None
+
+    @property
+    def Weights(self):
+        '''
+        Dfs2RegridWeights from the source to the target grid.
+        '''
+        if (self.__weights is None):
+            sourceAxis = self.Dfs2File.SpatialAxis
+            if (sourceAxis.AxisType != SpaceAxisType.EqD2):
+                raise Exception("Only dfs2 files with an EqD2 spatial axis can be resampled")
+            self.__weights = Dfs2RegridWeights.Create(sourceAxis, self.Dfs2File.FileInfo.Projection, self.TargetAxis, self.TargetProjection, self.__interpolate)
+        return self.__weights
+
+    def Regrid(self, data):
+        '''
+        Interpolate the data of one item and timestep to the target grid.
+        Double data uses the double delete value of the file, other data
+        the float delete value.
+        '''
+        fileInfo = self.Dfs2File.FileInfo
+        deleteValue = fileInfo.DeleteValueDouble if data.dtype == np.float64 else fileInfo.DeleteValueFloat
+        return self.Weights.Apply(data, deleteValue)
+
+    def Process(self):
+        '''
+        Create the output file, with all items and timesteps of the source file
+        interpolated to the target grid. Custom blocks are copied, static items
+        are not. Double items remain double, all other items are written as float.
+        '''
+        source = self.Dfs2File
+        fileInfo = source.FileInfo
+        weights = self.Weights
+
+        builder = DfsBuilder.Create(fileInfo.FileTitle, fileInfo.ApplicationTitle, fileInfo.ApplicationVersion);
+        builder.SetDataType(fileInfo.DataType);
+        builder.SetGeographicalProjection(self.TargetProjection);
+        builder.SetTemporalAxis(fileInfo.TimeAxis);
+        builder.SetSpatialAxis(self.TargetAxis);
+        builder.DeleteValueFloat = fileInfo.DeleteValueFloat;
+        builder.SetDeleteValueDouble(fileInfo.DeleteValueDouble);
+        for customBlock in fileInfo.CustomBlocks:
+            builder.AddCustomBlock(customBlock);
+        # Buffers, delete value and target data for each item, reused for all timesteps
+        itemDatas = []
+        deleteValues = []
+        targetDatas = []
+        for itemInfo in source.ItemInfo:
+            if (itemInfo.DataType == DfsSimpleType.Double):
+                dataType, deleteValue, dtype = DfsSimpleType.Double, fileInfo.DeleteValueDouble, np.float64
+            else:
+                dataType, deleteValue, dtype = DfsSimpleType.Float, fileInfo.DeleteValueFloat, np.float32
+            builder.AddCreateDynamicItem(itemInfo.Name, itemInfo.Quantity, dataType, itemInfo.ValueType);
+            itemDatas.append(itemInfo.CreateEmptyItemData())
+            deleteValues.append(deleteValue)
+            targetDatas.append(np.zeros(weights.TargetCount, dtype=dtype))
+
+        builder.CreateFile(self.OutputFilename);
+        dfsFile = builder.GetFile();
+
+        source.Reset()
+        for i in range(fileInfo.TimeAxis.NumberOfTimeSteps):
+            for j in range(len(source.ItemInfo)):
+                itemData = source.ReadItemTimeStepNext(itemDatas[j])
+                weights.Apply(itemData.Data, deleteValues[j], targetDatas[j])
+                dfsFile.WriteItemTimeStepNext(itemData.Time, targetDatas[j]);
+        dfsFile.Close()
@@ -0,0 +1,296 @@
+import asyncio
+import collections
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from mikecore.DfsFile import DfsFile, DfsFileMode
+
+
+class DfsFilePool:
+    '''
+    Thread safe pool of DfsFile objects opened for reading, by file name.
+
+    A file is opened, and its header parsed, only when no idle DfsFile of
+    the file is available. A DfsFile is used by one thread at a time: it is
+    acquired, used and released again to the pool. Hence the number of open
+    DfsFile objects of a file does not exceed the number of threads using
+    the pool concurrently.
+
+    The file pointer of a DfsFile is reset when it is released, such that a
+    position left by one user does not affect the next one.
+
+    Up to maxIdleHandles idle DfsFile objects are kept open, the least
+    recently used are closed first. A DfsFile of a file that has been modified
+    (modification time or size changed) since it was opened is closed instead
+    of being reused.
+
+    :param maxIdleHandles: Maximum number of idle open files
+    :param parameters: Optional DfsParameters used when opening files
+    '''
+
+    def __init__(self, maxIdleHandles = 16, parameters = None):
+        self.MaxIdleHandles = maxIdleHandles
+        self.Parameters = parameters
+        # Number of files opened by the pool, for monitoring handle reuse
+        self.OpenCount = 0
+        self._lock = threading.Lock()
+        # Idle files, as lists of (stamp, DfsFile) by path, least recently used path first
+        self._idle = collections.OrderedDict()
+        self._idleCount = 0
+        # Path and stamp of files in use, by id of DfsFile
+        self._inUse = {}
+        self._closed = False
+
+    @property
+    def IdleCount(self) -> int:
+        """Number of idle open files in the pool"""
+        return self._idleCount
+
+    @staticmethod
+    def _Key(filename):
+        path = os.path.abspath(filename)
+        stat = os.stat(path)
+        return path, (stat.st_mtime_ns, stat.st_size)
+
+    def Acquire(self, filename) -> DfsFile:
+        """
+        Get an open DfsFile of the file, from the pool when available, otherwise
+        the file is opened. Call Release when done using the DfsFile.
+
+        :param filename str: Name of file
+        :returns DfsFile: File opened for reading
+        """
+        path, stamp = DfsFilePool._Key(filename)
+        stale = []
+        dfsFile = None
+        with self._lock:
+            if (self._closed):
+                raise Exception("DfsFilePool is closed")
+            handles = self._idle.get(path)
+            while (handles and dfsFile is None):
+                handleStamp, handle = handles.pop()
+                self._idleCount -= 1
+                if (handleStamp == stamp):
+                    dfsFile = handle
+                else:
+                    stale.append(handle)
+            if (handles is not None and not handles):
+                del self._idle[path]
+            if (dfsFile is not None):
+                self._inUse[id(dfsFile)] = (path, stamp)
+        for handle in stale:
+            handle.Close()
+        if (dfsFile is not None):
+            return dfsFile
+
+        dfsFile = DfsFile()
+        dfsFile.Open(path, DfsFileMode.Read, self.Parameters)
+        with self._lock:
+            self.OpenCount += 1
+            self._inUse[id(dfsFile)] = (path, stamp)
+        return dfsFile
+
+    def Release(self, dfsFile, discard = False):
+        """
+        Return a DfsFile, obtained by Acquire, to the pool.
+
+        :param dfsFile DfsFile: File to return
+        :param discard bool: Close the file instead of keeping it open for reuse
+        """
+        if (not discard and dfsFile.FileInfo.TimeAxis.NumberOfTimeSteps > 0):
+            try:
+                dfsFile.Reset()
+            except Exception:
+                discard = True
+        toClose = []
+        with self._lock:
+            path, stamp = self._inUse.pop(id(dfsFile))
+            if (discard or self._closed):
+                toClose.append(dfsFile)
+            else:
+                self._idle.setdefault(path, []).append((stamp, dfsFile))
+                self._idle.move_to_end(path)
+                self._idleCount += 1
+                while (self._idleCount > self.MaxIdleHandles):
+                    oldestPath, handles = next(iter(self._idle.items()))
+                    toClose.append(handles.pop(0)[1])
+                    self._idleCount -= 1
+                    if (not handles):
+                        del self._idle[oldestPath]
+        for handle in toClose:
+            handle.Close()
+
+    def Run(self, filename, function, *args):
+        """
+        Call function(dfsFile, *args) with a DfsFile of the file from the pool,
+        and return the result. If the function raises an exception, the DfsFile
+        is closed instead of returned to the pool.
+
+        :param filename str: Name of file
+        :param function: Function taking the DfsFile as first argument
+        """
+        dfsFile = self.Acquire(filename)
+        try:
+            res = function(dfsFile, *args)
+        except BaseException:
+            self.Release(dfsFile, discard=True)
+            raise
+        self.Release(dfsFile)
+        return res
+
+    def Close(self):
+        """Close all idle files. Files in use are closed when released."""
+        with self._lock:
+            self._closed = True
+            handles = [handle for entries in self._idle.values() for stamp, handle in entries]
+            self._idle.clear()
+            self._idleCount = 0
+        for handle in handles:
+            handle.Close()
+
+
+def _ReadHeader(dfsFile):
+    # Detach header data from native memory, such that it can be used from the
+    # event loop while the file is used by, and eventually closed in, a worker thread.
+    for item in dfsFile.ItemInfo:
+        item.SpatialAxis
+    for customBlock in dfsFile.FileInfo.CustomBlocks:
+        customBlock._Detach()
+    return dfsFile.FileInfo, dfsFile.ItemInfo
+
+def _ReadItemTimeStep(dfsFile, itemNumber, timestepIndex, reshape):
+    return dfsFile.ReadItemTimeStep(itemNumber, timestepIndex, reshape)
+
+def _ReadItemTimeSteps(dfsFile, itemNumber, timestepIndices):
+    return dfsFile.ReadItemTimeSteps(itemNumber, timestepIndices)
+
+def _ReadDfs0DataDouble(dfsFile, itemsToLoad):
+    return dfsFile.ReadDfs0DataDouble(itemsToLoad)
+
+def _ReadTimeIndex(dfsFile):
+    return dfsFile.TimeIndex
+
+
+class DfsAsyncReader:
+    '''
+    Reading dfs files from asyncio code, without blocking the event loop.
+
+    Native work, opening files and reading data, is done in a thread pool of
+    maxWorkers threads, using open files from a DfsFilePool. Concurrent requests
+    for the same file reuse the open files and their parsed headers, and each
+    open file keeps its own cached data, like TimeIndex.
+
+    Example:
+
+        reader = DfsAsyncReader(maxWorkers = 8)
+        dfsFile = await reader.OpenAsync("data.dfs0")
+        data = await dfsFile.ReadItemTimeStepsAsync(1)
+        ...
+        await reader.CloseAsync()
+
+    :param maxWorkers: Number of threads doing native work
+    :param maxIdleHandles: Maximum number of idle open files, default is 4 times maxWorkers
+    :param parameters: Optional DfsParameters used when opening files
+    '''
+
+    def __init__(self, maxWorkers = 4, maxIdleHandles = None, parameters = None):
+        if (maxIdleHandles is None):
+            maxIdleHandles = 4 * maxWorkers
+        self.Pool = DfsFilePool(maxIdleHandles, parameters)
+        self._executor = ThreadPoolExecutor(max_workers=maxWorkers, thread_name_prefix="DfsAsync")
+
+    async def RunAsync(self, filename, function, *args):
+        """
+        Call function(dfsFile, *args) in a worker thread, with a DfsFile of the
+        file from the pool, see DfsFilePool.Run. The function must not keep
+        references to the DfsFile, it is reused by other requests.
+
+        :param filename str: Name of file
+        :param function: Function taking the DfsFile as first argument
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(self.Pool.Run, filename, function, *args))
+
+    async def OpenAsync(self, filename):
+        """
+        Open the file for reading, reusing an open file from the pool when available.
+
+        :param filename str: Name of file
+        :returns DfsAsyncFile: File, with header information and async read methods
+        """
+        fileInfo, itemInfo = await self.RunAsync(filename, _ReadHeader)
+        return DfsAsyncFile(self, filename, fileInfo, itemInfo)
+
+    def Close(self):
+        """Wait for running requests to finish, stop the worker threads and close all files."""
+        self._executor.shutdown(wait=True)
+        self.Pool.Close()
+
+    async def CloseAsync(self):
+        """Close, without blocking the event loop while waiting for running requests."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.Close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.CloseAsync()
+
+
+class DfsAsyncFile:
+    '''
+    A dfs file for reading from asyncio code, returned by DfsAsyncReader.OpenAsync.
+
+    Header information is available as FileInfo and ItemInfo. Data is read by
+    awaiting the async methods, which read using an open file from the pool of
+    the reader. The object holds no open file itself, and need not be closed.
+    '''
+
+    def __init__(self, reader, filename, fileInfo, itemInfo):
+        self.Reader = reader
+        self.FileName = filename
+        self.FileInfo = fileInfo
+        self.ItemInfo = itemInfo
+
+    async def ReadItemTimeStepAsync(self, itemNumber: int, timestepIndex: int, reshape: bool = False):
+        """
+        Reads the dynamic item-timestep, see DfsFile.ReadItemTimeStep.
+
+        :param itemNumber int: Item number (1-based)
+        :param timestepIndex int: Time step index (0-based)
+        :param reshape bool: Reshape data array to dimension of data, 2D or 3D depending on spatial axis.
+        :returns DfsItemData: The dynamic item-timestep as specified
+        """
+        return await self.Reader.RunAsync(self.FileName, _ReadItemTimeStep, itemNumber, timestepIndex, reshape)
+
+    async def ReadItemTimeStepsAsync(self, itemNumber: int, timestepIndices = None):
+        """
+        Reads the data of a dynamic item for a number of time steps, see DfsFile.ReadItemTimeSteps.
+
+        :param itemNumber int: Item number (1-based)
+        :param timestepIndices: Time step indices (0-based), as a slice or sequence. Default is all time steps.
+        :returns numpy.ndarray: Item data, one row for each time step
+        """
+        return await self.Reader.RunAsync(self.FileName, _ReadItemTimeSteps, itemNumber, timestepIndices)
+
+    async def ReadDfs0DataDoubleAsync(self, itemsToLoad = None):
+        """
+        Bulk read the times and data for a dfs0 file, see DfsFile.ReadDfs0DataDouble.
+
+        :param itemsToLoad: npArray of item numbers (1-based, integers) to store in data array. Can be null to store all items.
+        """
+        return await self.Reader.RunAsync(self.FileName, _ReadDfs0DataDouble, itemsToLoad)
+
+    async def ReadTimeIndexAsync(self):
+        """
+        Times of all time steps, see DfsFile.TimeIndex. The array is shared, do not modify it.
+        """
+        return await self.Reader.RunAsync(self.FileName, _ReadTimeIndex)
+
+    async def RunAsync(self, function, *args):
+        """
+        Call function(dfsFile, *args) in a worker thread with an open DfsFile, see DfsAsyncReader.RunAsync.
+        """
+        return await self.Reader.RunAsync(self.FileName, function, *args)
@@ -1,7 +1,9 @@
 import os
 import ctypes
+import threading
 import numpy as np
 from enum import IntEnum
+from mikecore.LazyLibrary import LazyLibrary
 
 class DfsError(IntEnum):
     F_NO_ERROR            = 0
@@ -36,190 +38,310 @@ class DfsError(IntEnum):
     F_ERR_PLUGIN          = 2022
 
 
+# Shorthands for the signature table below
+_P  = ctypes.c_void_p
+_I  = ctypes.c_int32
+_F  = ctypes.c_float
+_D  = ctypes.c_double
+_S  = ctypes.c_char_p
+_PP = ctypes.POINTER(ctypes.c_void_p)
+_PI = ctypes.POINTER(ctypes.c_int32)
+_PF = ctypes.POINTER(ctypes.c_float)
+_PD = ctypes.POINTER(ctypes.c_double)
+_PS = ctypes.POINTER(ctypes.c_char_p)
+
+# Signatures, (restype, argtypes), of ufs functions not set up individually in DfsDLL.Init.
+# With argtypes set, arguments can be passed as plain Python values, and ctypes
+# converts them without creating ctypes objects for each call.
+_dfsSignatures = {
+    # Files and headers
+    "dfsFileRead"               : (_I, [_S, _PP, _PP]),
+    "dfsFileEdit"               : (_I, [_S, _PP, _PP]),
+    "dfsFileAppend"             : (_I, [_S, _PP, _PP]),
+    "dfsFileCreate"             : (_I, [_S, _P, _PP]),
+    "dfsFileClose"              : (_I, [_P, _PP]),
+    "dfsFileFlush"              : (_I, [_P, _P]),
+    "dfsFileFlushTimeStep"      : (_I, [_P, _P]),
+    "dfsHeaderCreate"           : (_I, [_I, _S, _S, _I, _I, _I, _PP]),
+    "dfsHeaderDestroy"          : (_I, [_PP]),
+    "dfsParamModifyTimes"       : (_I, [_P, _I]),
+    "dfsWriteStartBlockDynamic" : (_I, [_P, _P]),
+
+    # File pointer positioning, called for every item-timestep when not reading sequentially
+    "dfsFindBlockDynamic"       : (_I, [_P, _P]),
+    "dfsFindBlockStatic"        : (_I, [_P, _P]),
+    "dfsFindItemDynamic"        : (_I, [_P, _P, _I, _I]),
+    "dfsFindItemStatic"         : (_I, [_P, _P, _I]),
+    "dfsFindTimeStep"           : (_I, [_P, _P, _I]),
+
+    # Header data
+    "dfsGetAppVersionNo"        : (_I, [_P]),
+    "dfsGetDataType"            : (_I, [_P]),
+    "dfsGetEncodeKeySize"       : (_I, [_P]),
+    "dfsGetNoOfItems"           : (_I, [_P]),
+    "dfsIsFileCompressed"       : (_I, [_P]),
+    "dfsGetTimeAxisType"        : (_I, [_P]),
+    "dfsGetGeoInfoType"         : (_I, [_P]),
+    "dfsGetGeoInfoUTMProj"      : (_I, [_P, _PS, _PD, _PD, _PD]),
+    "dfsGetCustomBlock"         : (_I, [_P, _PI, _PS, _PI, _PP, _PP]),
+    "dfsSetDataType"            : (_I, [_P, _I]),
+    "dfsSetDeleteValFloat"      : (_I, [_P, _F]),
+    "dfsSetDeleteValDouble"     : (_I, [_P, _D]),
+    "dfsSetDeleteValByte"       : (_I, [_P, ctypes.c_int8]),
+    "dfsSetDeleteValInt"        : (_I, [_P, _I]),
+    "dfsSetDeleteValUnsignedInt": (_I, [_P, ctypes.c_uint32]),
+    "dfsSetGeoInfoUndefined"    : (_I, [_P]),
+    "dfsSetGeoInfoUTMProj"      : (_I, [_P, _S, _D, _D, _D]),
+    "dfsSetEqTimeAxis"          : (_I, [_P, _I, _D, _D, _I]),
+    "dfsSetNeqTimeAxis"         : (_I, [_P, _I, _D, _I]),
+    "dfsSetEqCalendarAxis"      : (_I, [_P, _S, _S, _I, _D, _D, _I]),
+    "dfsSetNeqCalendarAxis"     : (_I, [_P, _S, _S, _I, _D, _I]),
+    "dfsSetTimeStartEnd"        : (_I, [_P, _D, _D]),
+    "dfsSetAssocStatic"         : (_I, [_P, _I, _I]),
+
+    # Items
+    "dfsGetItemAxisType"        : (_I, [_P]),
+    "dfsGetItemAxisEqD0"        : (_I, [_P, _PI, _PS]),
+    "dfsGetItemAxisEqD1"        : (_I, [_P, _PI, _PS, _PI, _PF, _PF]),
+    "dfsGetItemAxisEqD2"        : (_I, [_P, _PI, _PS, _PI, _PI, _PF, _PF, _PF, _PF]),
+    "dfsGetItemAxisEqD3"        : (_I, [_P, _PI, _PS, _PI, _PI, _PI, _PF, _PF, _PF, _PF, _PF, _PF]),
+    "dfsSetItemInfo"            : (_I, [_P, _P, _I, _S, _I, _I]),
+    "dfsSetItemValueType"       : (_I, [_P, _I]),
+    "dfsSetItemUnitConversion"  : (_I, [_P, _I, _I]),
+    "dfsSetItemAxisUnitConversion": (_I, [_P, _I, _I]),
+    "dfsSetItemRefCoords"       : (_I, [_P, _F, _F, _F]),
+    "dfsSetItemAxisOrientation" : (_I, [_P, _F, _F, _F]),
+    "dfsSetItemAxisEqD0"        : (_I, [_P, _I]),
+    "dfsSetItemAxisEqD1"        : (_I, [_P, _I, _I, _F, _F]),
+    "dfsSetItemAxisEqD2"        : (_I, [_P, _I, _I, _I, _F, _F, _F, _F]),
+    "dfsSetItemAxisEqD3"        : (_I, [_P, _I, _I, _I, _I, _F, _F, _F, _F, _F, _F]),
+
+    # Static items
+    "dfsStaticCreate"           : (_I, [_PP]),
+    "dfsStaticDestroy"          : (_I, [_PP]),
+}
+
+
 class DfsDLL:
-    """description of class"""
+    """Access to the native ufs library.
+
+    Thread safety: The ufs library keeps all state of an open file in its
+    header and file pointers. Calls working on separate header/file pointers,
+    i.e. separate DfsFile objects, can be issued from separate threads at
+    the same time. A single DfsFile object must not be used from more than
+    one thread at a time.
+
+    The library is loaded as a ctypes.CDLL, which releases the GIL for the
+    duration of every native call, hence heavy calls like reading and writing
+    item time steps, static items and dfs0 bulk data run in parallel when
+    issued from a thread pool.
+
+    The library is loaded on first use of Wrapper, or by calling Init.
+    """
 
     # Static variables
-    Wrapper = None
+    Wrapper = LazyLibrary(lambda: DfsDLL.Init())
     MCCUWrapper = None
+    libfilepath = None
+    _initLock = threading.Lock()
 
     @staticmethod
     def Init(libfilepath=None):
 
         # ufs lib should be loaded only once
-        if DfsDLL.Wrapper is None:
-
-            DfsDLL.libfilepath = None
-            if not libfilepath is None:
-                DfsDLL.libfilepath = libfilepath
-
-            # TODO: On linux, this looks different!
-            if os.name == "nt":
-                DfsDLL.Wrapper = ctypes.CDLL(os.path.join(DfsDLL.libfilepath, "ufs.dll"))
-            else:
-                DfsDLL.Wrapper = ctypes.CDLL(os.path.join(DfsDLL.libfilepath, "libufs.so"))
-            DfsDLL.Wrapper.dfsInitSystem()
-
-            DfsDLL.Wrapper.dfsGetAppTitle.argtypes = [ctypes.c_void_p]
-            DfsDLL.Wrapper.dfsGetAppTitle.restype = ctypes.c_char_p
-            DfsDLL.Wrapper.dfsGetDeleteValFloat.restype = ctypes.c_float
-            DfsDLL.Wrapper.dfsGetDeleteValByte.restype = ctypes.c_int8
-            DfsDLL.Wrapper.dfsGetDeleteValDouble.restype = ctypes.c_double
-            DfsDLL.Wrapper.dfsGetDeleteValInt.restype = ctypes.c_int32
-            DfsDLL.Wrapper.dfsGetDeleteValUnsignedInt.restype = ctypes.c_uint32
-            DfsDLL.Wrapper.dfsGetFileTitle.argtypes = [ctypes.c_void_p]
-            DfsDLL.Wrapper.dfsGetFileTitle.restype = ctypes.c_char_p
-            DfsDLL.Wrapper.dfsGetItemValueType.argtypes = [
-                ctypes.c_void_p,
-                ctypes.POINTER(ctypes.c_int),
-            ]
-            DfsDLL.Wrapper.dfsGetCustomBlockRef.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p)]
-
-            DfsDLL.Wrapper.dfsItemD.argtypes = [ctypes.c_void_p, ctypes.c_int]
-            DfsDLL.Wrapper.dfsItemD.restype = ctypes.c_void_p
-            DfsDLL.Wrapper.dfsItemS.argtypes = [ctypes.c_void_p]
-            DfsDLL.Wrapper.dfsItemS.restype = ctypes.c_void_p
-            DfsDLL.Wrapper.dfsGetItemInfo.argtypes = [
-                ctypes.c_void_p,
-                ctypes.POINTER(ctypes.c_int),
-                ctypes.POINTER(ctypes.c_char_p),
-                ctypes.POINTER(ctypes.c_char_p),
-                ctypes.POINTER(ctypes.c_int),
-                ctypes.POINTER(ctypes.c_char_p),
-                ctypes.POINTER(ctypes.c_int),
-            ]
-            DfsDLL.Wrapper.dfsGetItemInfo_.argtypes = [
-                ctypes.c_void_p,
-                ctypes.POINTER(ctypes.c_int),
-                ctypes.POINTER(ctypes.c_char_p),
-                ctypes.POINTER(ctypes.c_char_p),
-                ctypes.POINTER(ctypes.c_int),
-            ]
-            DfsDLL.Wrapper.dfsGetItemElements.argtypes = [ctypes.c_void_p]
-
-            DfsDLL.Wrapper.dfsGetEqTimeAxis.argtypes = [
-                ctypes.c_void_p,
-                ctypes.POINTER(ctypes.c_int),
-                ctypes.POINTER(ctypes.c_char_p),
-                ctypes.POINTER(ctypes.c_double),
-                ctypes.POINTER(ctypes.c_double),
-                ctypes.POINTER(ctypes.c_int32),
-                ctypes.POINTER(ctypes.c_int32),
-            ]
-            DfsDLL.Wrapper.dfsGetNeqTimeAxis.argtypes = [
-                ctypes.c_void_p,
-                ctypes.POINTER(ctypes.c_int),
-                ctypes.POINTER(ctypes.c_char_p),
-                ctypes.POINTER(ctypes.c_double),
-                ctypes.POINTER(ctypes.c_double),
-                ctypes.POINTER(ctypes.c_int32),
-                ctypes.POINTER(ctypes.c_int32),
-            ]
-            DfsDLL.Wrapper.dfsGetEqCalendarAxis.argtypes = [
-                ctypes.c_void_p,
-                ctypes.POINTER(ctypes.c_char_p),
-                ctypes.POINTER(ctypes.c_char_p),
-                ctypes.POINTER(ctypes.c_int),
-                ctypes.POINTER(ctypes.c_char_p),
-                ctypes.POINTER(ctypes.c_double),
-                ctypes.POINTER(ctypes.c_double),
-                ctypes.POINTER(ctypes.c_int32),
-                ctypes.POINTER(ctypes.c_int32),
-            ]
-            DfsDLL.Wrapper.dfsGetNeqCalendarAxis.argtypes = [
-                ctypes.c_void_p,
-                ctypes.POINTER(ctypes.c_char_p),
-                ctypes.POINTER(ctypes.c_char_p),
-                ctypes.POINTER(ctypes.c_int),
-                ctypes.POINTER(ctypes.c_char_p),
-                ctypes.POINTER(ctypes.c_double),
-                ctypes.POINTER(ctypes.c_double),
-                ctypes.POINTER(ctypes.c_int32),
-                ctypes.POINTER(ctypes.c_int32),
-            ]
-
-            DfsDLL.Wrapper.dfsGetEncodeKey.argtypes = [
-                ctypes.c_void_p,
-                np.ctypeslib.ndpointer(dtype=np.int32,ndim=1),
-                np.ctypeslib.ndpointer(dtype=np.int32,ndim=1),
-                np.ctypeslib.ndpointer(dtype=np.int32,ndim=1)
-            ]
-            DfsDLL.Wrapper.dfsGetEncodeKey.restype = ctypes.c_int32
-            DfsDLL.Wrapper.dfsSetEncodeKey.argtypes = [
-                ctypes.c_void_p,
-                np.ctypeslib.ndpointer(dtype=np.int32,ndim=1),
-                np.ctypeslib.ndpointer(dtype=np.int32,ndim=1),
-                np.ctypeslib.ndpointer(dtype=np.int32,ndim=1),
-                ctypes.c_int32
-            ]
-            DfsDLL.Wrapper.dfsSetEncodeKey.restype = ctypes.c_int32
-
-            # Last argument is just a pointer to the memory that can be many different types, though mostly
-            DfsDLL.Wrapper.dfsReadItemTimeStep.argtypes = [
-                ctypes.c_void_p,
-                ctypes.c_void_p,
-                ctypes.POINTER(ctypes.c_double),
-                ctypes.c_void_p,
-            ]
-            DfsDLL.Wrapper.dfsReadItemTimeStep.restype = ctypes.c_int32
-            DfsDLL.Wrapper.dfsWriteItemTimeStep.argtypes = [
-                ctypes.c_void_p,
-                ctypes.c_void_p,
-                ctypes.c_double,
-                ctypes.c_void_p,
-            ]
-            DfsDLL.Wrapper.dfsWriteItemTimeStep.restype = ctypes.c_int32
-
-            DfsDLL.Wrapper.dfsStaticRead.argtypes = [
-                ctypes.c_void_p, 
-                ctypes.POINTER(ctypes.c_int)
-            ]
-            DfsDLL.Wrapper.dfsStaticRead.restype = ctypes.c_void_p
-            DfsDLL.Wrapper.dfsStaticSetHeader.argtypes = [
-                ctypes.c_void_p,
-                ctypes.c_void_p,
-            ]
-            DfsDLL.Wrapper.dfsStaticSetHeader.restype = ctypes.c_int32
-            DfsDLL.Wrapper.dfsStaticGetData.argtypes = [
-                ctypes.c_void_p,
-                ctypes.c_void_p,
-            ]
-            DfsDLL.Wrapper.dfsStaticGetData.restype = ctypes.c_int32
-            DfsDLL.Wrapper.dfsStaticWrite.argtypes = [
-                ctypes.c_void_p,
-                ctypes.c_void_p,
-                ctypes.c_void_p,
-            ]
-
-            DfsDLL.Wrapper.dfsAddCustomBlock.argtypes = [
-                ctypes.c_void_p,
-                ctypes.c_int32,
-                ctypes.c_char_p,
-                ctypes.c_int32,
-                ctypes.c_void_p,
-            ]
-
-            DfsDLL.Wrapper.dfsReadDfs0DataDouble.restype = ctypes.c_int32
-            DfsDLL.Wrapper.dfsReadDfs0DataDouble.argtypes = [
-                ctypes.c_void_p,
-                ctypes.c_void_p,
-                ctypes.c_void_p,
-            ]
-            DfsDLL.Wrapper.dfsReadDfs0ItemsDouble.restype = ctypes.c_int32
-            DfsDLL.Wrapper.dfsReadDfs0ItemsDouble.argtypes = [
-                ctypes.c_void_p,
-                ctypes.c_void_p,
-                ctypes.c_void_p,
-                ctypes.c_void_p,
-                ctypes.c_int32,
-            ]
-            DfsDLL.Wrapper.dfsWriteDfs0DataDouble.restype = ctypes.c_int32
-            DfsDLL.Wrapper.dfsWriteDfs0DataDouble.argtypes = [
-                ctypes.c_void_p,
-                ctypes.c_void_p,
-                ctypes.c_void_p,
-                ctypes.c_int32,
-            ]
+        if not LazyLibrary.IsLoaded(DfsDLL.Wrapper):
+            with DfsDLL._initLock:
+                if not LazyLibrary.IsLoaded(DfsDLL.Wrapper):
+                    DfsDLL.__Load(libfilepath)
+        return DfsDLL.Wrapper
+
+    @staticmethod
+    def __Load(libfilepath):
+
+        if not libfilepath is None:
+            DfsDLL.libfilepath = libfilepath
+
+        # ufs depends on the eum and MzCart libraries, load those first
+        from mikecore.eum import eumDLL
+        from mikecore.Projections import MzCartDLL
+        eumDLL.Init()
+        MzCartDLL.Init()
+
+        # TODO: On linux, this looks different!
+        if os.name == "nt":
+            wrapper = ctypes.CDLL(os.path.join(DfsDLL.libfilepath, "ufs.dll"))
+        else:
+            wrapper = ctypes.CDLL(os.path.join(DfsDLL.libfilepath, "libufs.so"))
+        wrapper.dfsInitSystem()
+
+        wrapper.dfsGetAppTitle.argtypes = [ctypes.c_void_p]
+        wrapper.dfsGetAppTitle.restype = ctypes.c_char_p
+        wrapper.dfsGetDeleteValFloat.restype = ctypes.c_float
+        wrapper.dfsGetDeleteValByte.restype = ctypes.c_int8
+        wrapper.dfsGetDeleteValDouble.restype = ctypes.c_double
+        wrapper.dfsGetDeleteValInt.restype = ctypes.c_int32
+        wrapper.dfsGetDeleteValUnsignedInt.restype = ctypes.c_uint32
+        wrapper.dfsGetFileTitle.argtypes = [ctypes.c_void_p]
+        wrapper.dfsGetFileTitle.restype = ctypes.c_char_p
+        wrapper.dfsGetItemValueType.argtypes = [
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_int),
+        ]
+        wrapper.dfsGetCustomBlockRef.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p)]
+
+        wrapper.dfsItemD.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        wrapper.dfsItemD.restype = ctypes.c_void_p
+        wrapper.dfsItemS.argtypes = [ctypes.c_void_p]
+        wrapper.dfsItemS.restype = ctypes.c_void_p
+        wrapper.dfsGetItemInfo.argtypes = [
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.POINTER(ctypes.c_int),
+        ]
+        wrapper.dfsGetItemInfo_.argtypes = [
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.POINTER(ctypes.c_int),
+        ]
+        wrapper.dfsGetItemElements.argtypes = [ctypes.c_void_p]
+
+        wrapper.dfsGetEqTimeAxis.argtypes = [
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.POINTER(ctypes.c_double),
+            ctypes.POINTER(ctypes.c_double),
+            ctypes.POINTER(ctypes.c_int32),
+            ctypes.POINTER(ctypes.c_int32),
+        ]
+        wrapper.dfsGetNeqTimeAxis.argtypes = [
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.POINTER(ctypes.c_double),
+            ctypes.POINTER(ctypes.c_double),
+            ctypes.POINTER(ctypes.c_int32),
+            ctypes.POINTER(ctypes.c_int32),
+        ]
+        wrapper.dfsGetEqCalendarAxis.argtypes = [
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.POINTER(ctypes.c_double),
+            ctypes.POINTER(ctypes.c_double),
+            ctypes.POINTER(ctypes.c_int32),
+            ctypes.POINTER(ctypes.c_int32),
+        ]
+        wrapper.dfsGetNeqCalendarAxis.argtypes = [
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.POINTER(ctypes.c_double),
+            ctypes.POINTER(ctypes.c_double),
+            ctypes.POINTER(ctypes.c_int32),
+            ctypes.POINTER(ctypes.c_int32),
+        ]
+
+        wrapper.dfsGetEncodeKey.argtypes = [
+            ctypes.c_void_p,
+            np.ctypeslib.ndpointer(dtype=np.int32,ndim=1),
+            np.ctypeslib.ndpointer(dtype=np.int32,ndim=1),
+            np.ctypeslib.ndpointer(dtype=np.int32,ndim=1)
+        ]
+        wrapper.dfsGetEncodeKey.restype = ctypes.c_int32
+        wrapper.dfsSetEncodeKey.argtypes = [
+            ctypes.c_void_p,
+            np.ctypeslib.ndpointer(dtype=np.int32,ndim=1),
+            np.ctypeslib.ndpointer(dtype=np.int32,ndim=1),
+            np.ctypeslib.ndpointer(dtype=np.int32,ndim=1),
+            ctypes.c_int32
+        ]
+        wrapper.dfsSetEncodeKey.restype = ctypes.c_int32
+
+        # Last argument is just a pointer to the memory that can be many different types, though mostly
+        wrapper.dfsReadItemTimeStep.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_double),
+            ctypes.c_void_p,
+        ]
+        wrapper.dfsReadItemTimeStep.restype = ctypes.c_int32
+        wrapper.dfsWriteItemTimeStep.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_double,
+            ctypes.c_void_p,
+        ]
+        wrapper.dfsWriteItemTimeStep.restype = ctypes.c_int32
+
+        wrapper.dfsStaticRead.argtypes = [
+            ctypes.c_void_p, 
+            ctypes.POINTER(ctypes.c_int)
+        ]
+        wrapper.dfsStaticRead.restype = ctypes.c_void_p
+        wrapper.dfsStaticSetHeader.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+        ]
+        wrapper.dfsStaticSetHeader.restype = ctypes.c_int32
+        wrapper.dfsStaticGetData.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+        ]
+        wrapper.dfsStaticGetData.restype = ctypes.c_int32
+        wrapper.dfsStaticWrite.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+        ]
+
+        wrapper.dfsAddCustomBlock.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_int32,
+            ctypes.c_char_p,
+            ctypes.c_int32,
+            ctypes.c_void_p,
+        ]
+
+        wrapper.dfsReadDfs0DataDouble.restype = ctypes.c_int32
+        wrapper.dfsReadDfs0DataDouble.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+        ]
+        wrapper.dfsReadDfs0ItemsDouble.restype = ctypes.c_int32
+        wrapper.dfsReadDfs0ItemsDouble.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_int32,
+        ]
+        wrapper.dfsWriteDfs0DataDouble.restype = ctypes.c_int32
+        wrapper.dfsWriteDfs0DataDouble.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_int32,
+        ]
+
+        for name, (restype, argtypes) in _dfsSignatures.items():
+            function = getattr(wrapper, name)
+            function.restype = restype
+            function.argtypes = argtypes
+
+        # Publish the wrapper only when fully set up, Init() checks it without locking
+        DfsDLL.Wrapper = wrapper
 
 
 #        # MIKE Core C Util should be loaded only once and only on Windows
@@ -2,12 +2,18 @@ import os.path
 from enum import IntEnum
 import datetime
 import ctypes
+import logging
+import mmap
+import weakref
 import numpy as np
 from mikecore.eum import *
 from mikecore.DfsDLL import DfsDLL
+from mikecore.DfsIOStatistics import DfsIOStatistics
 from typing import Union
 from mikecore.eum import eumQuantity
 
+_logger = logging.getLogger(__name__)
+
 class NotSupportedException(Exception):
     pass
 
@@ -71,6 +77,17 @@ class DfsSimpleType(IntEnum):
     Short = 6
     UShort = 7
 
+# Size in bytes of a value of each DfsSimpleType
+_dfsSimpleTypeSize = {
+    DfsSimpleType.Float: 4,
+    DfsSimpleType.Double: 8,
+    DfsSimpleType.Byte: 1,
+    DfsSimpleType.Int: 4,
+    DfsSimpleType.UInt: 4,
+    DfsSimpleType.Short: 2,
+    DfsSimpleType.UShort: 2,
+}
+
 
 class ProjectionType(IntEnum):
     """
@@ -452,7 +469,8 @@ class DfsDynamicItemInfo:
         self.AxisConversionType = UnitConversionType.NoConversion
         self.AxisConversionUnit = 0
         self.AssociatedStaticItemNumbers = []
-        self.SpatialAxis = None
+        self.__spatialAxis = None
+        self.__spatialAxisDeferred = False
 
     def __repr__(self):
         return (
@@ -469,6 +487,24 @@ class DfsDynamicItemInfo:
         self.Name     = itemName
         self.Quantity = eumQuantity
 
+    def __GetSpatialAxis(self):
+        if (self.__spatialAxisDeferred):
+            self.__spatialAxis = DfsDLLUtil.GetItemSpatialAxis(self.ItemPointer)
+            self.__spatialAxisDeferred = False
+        return self.__spatialAxis
+    def __SetSpatialAxis(self, value):
+        self.__spatialAxis = value
+        self.__spatialAxisDeferred = False
+    SpatialAxis = property(__GetSpatialAxis, __SetSpatialAxis)
+
+    def _DeferSpatialAxis(self):
+        """
+        Postpone decoding the spatial axis from the native item until it is
+        first accessed. The native item must stay valid until then, i.e. the
+        file header must not be destroyed.
+        """
+        self.__spatialAxisDeferred = True
+
     def SetReferenceCoordinates(self, x, y, z):
         self.ReferenceCoordinateX = x
         self.ReferenceCoordinateY = y
@@ -513,11 +549,39 @@ class DfsDynamicItemInfo:
         return values;
 
 class DfsStaticItem(DfsDynamicItemInfo):
+    """
+    Static item. When read from or written to a file, the static item can own
+    a native static vector (VectorPointer). The native vector is released 
+    by Dispose, when the item is garbage collected or when the file is closed,
+    whichever comes first. Item info and Data remain valid after that.
+    """
     def __init__(self, dfsFile = None, vectorPointer = None, itemPointer = None, itemNumber = None):
         super().__init__(itemPointer, itemNumber)
         self.DfsFile = dfsFile
         self.VectorPointer = vectorPointer
         self.Data = None
+        if (dfsFile is not None and vectorPointer is not None):
+            dfsFile._staticItems.add(self)
+
+    def __del__(self):
+        self.Dispose()
+
+    def Dispose(self):
+        """
+        Release the native static vector. The item can not be used for
+        updating the static item in the file after this.
+        """
+        vectorPointer = getattr(self, "VectorPointer", None)
+        if (vectorPointer is None):
+            return
+        self.VectorPointer = None
+        self.StaticVectorPointer = None
+        self.ItemPointer = None
+        if (not isinstance(vectorPointer, ctypes.c_void_p)):
+            vectorPointer = ctypes.c_void_p(vectorPointer)
+        if (vectorPointer.value is not None):
+            DfsDLL.Wrapper.dfsStaticDestroy(ctypes.byref(vectorPointer))
+
     @staticmethod
     def Create(name, quantity, data, spatialAxis = None):
         if (spatialAxis is None):
@@ -540,6 +604,16 @@ class DfsItemData:
         self.ItemNumber = itemNumber
         self.Time = time
         self.Data = data
+        self._pointerData = None
+        self._pointer = None
+
+    def _DataPointer(self):
+        # Address of the Data array, looked up again only when Data is set to another array
+        data = self.Data
+        if (self._pointerData is not data):
+            self._pointer = data.ctypes.data
+            self._pointerData = data
+        return self._pointer
 
     def __repr__(self):
         return (
@@ -611,7 +685,7 @@ class DfsFileInfo:
         # TODO: implement
         self.Projection = DfsDLLUtil.GetProjection(headerPointer)
         self.TimeAxis   = DfsDLLUtil.GetTemporalAxis(headerPointer)
-        self.CustomBlocks = DfsDLLUtil.BuildCustomBlocks(headerPointer)
+        self.CustomBlocks = DfsDLLUtil.BuildCustomBlocks(headerPointer, readOnly = (dfsFile.FileMode == DfsFileMode.Read))
         self.IsFileCompressed = (DfsDLL.Wrapper.dfsIsFileCompressed(headerPointer) != 0)
 
         self.TimeAxis._OnUpdate = self.__UpdateTemporalAxis;
@@ -655,6 +729,17 @@ class DfsFileInfo:
         DfsDLLUtil.dfsSetTemporalAxis(self.DfsFile.headPointer, self.TimeAxis)
 
 class DfsCustomBlock():
+    """
+    Custom block of a dfs file.
+
+    When read from a file, Values is a view on the custom block data in
+    the native file header, no data is copied. The view is read-only when 
+    the file is opened for reading, and writable when the file is opened 
+    for editing, in which case updates are written to the file when it is 
+    closed. The view is valid while the file is open. When the file is 
+    closed, Values is replaced by a copy. Use Copy() to get a custom block
+    owning its own data.
+    """
     def __init__(self, name, datatype, values):
         self.Name = name
         self.SimpleType = datatype
@@ -665,6 +750,15 @@ class DfsCustomBlock():
     def __setitem__(self, key, value):
         self.Values[key] = value
 
+    def Copy(self):
+        """Returns a copy of the custom block, owning its own data"""
+        return DfsCustomBlock(self.Name, self.SimpleType, self.Values.copy())
+
+    def _Detach(self):
+        """Replace a view on native memory by a copy, called before the native memory is released"""
+        if (self.Values.base is not None):
+            self.Values = self.Values.copy()
+
 
 class DfsFilePointerState(IntEnum):
     StaticItem = 0
@@ -682,17 +776,69 @@ class DfsFile:
     DefaultDeleteValueInt = 2147483647
     DefaultDeleteValueUnsignedInt = 2147483647
 
+    # Native functions of the dynamic item data path. They are looked up once,
+    # and stored as _<name> on the file. These are the functions instrumented
+    # by EnableInstrumentation.
+    _nativeFunctions = (
+        "dfsReadItemTimeStep",
+        "dfsWriteItemTimeStep",
+        "dfsFindItemDynamic",
+        "dfsFindTimeStep",
+        "dfsFindBlockDynamic",
+        "dfsReadDfs0DataDouble",
+        "dfsReadDfs0ItemsDouble",
+        "dfsWriteDfs0DataDouble",
+    )
+
+    # When positioning the file pointer a short distance forward, the data
+    # in between is read instead of seeking, if it is at most this many bytes.
+    # Set to 0 to always seek.
+    MaxForwardReadBytes = 65536
+
+    # Number of file pointer positionings in the window used for detecting
+    # a random access pattern
+    AccessPatternWindow = 64
+
     def __init__(self):
-        DfsDLL.Init()
+        # I/O statistics, when instrumentation is enabled
+        self.Stats = None
+        # Time output argument of dfsReadItemTimeStep, reused for all reads
+        self._timep = ctypes.c_double(0)
+        self._timepRef = ctypes.byref(self._timep)
+        self._writeData = None
+        self._writeDataPointer = None
+        self._timeIndex = None
+        self._fpLayout = None
+        # Memory mapped views of the dynamic items, see GetItemMemoryMap, and the memory map
+        self._memoryMaps = None
+        self._memoryMap = None
+        self._fpAccessCount = 0
+        self._fpSeekCount = 0
+        self._fpBackwardSeekCount = 0
+        self._fpRandomAccessLogged = False
         self.fpState = DfsFilePointerState.StaticItem
         self.fpItemNumber = 1
         self.fpTimeStepIndex = 0
         self.headPointer = ctypes.c_void_p(0)
         self.filePointer = ctypes.c_void_p(0)
+        self.ItemInfo = []
+        # Static items owning a native static vector, released on Close
+        self._staticItems = weakref.WeakSet()
+        # Loading the native library last, such that all fields used by Close,
+        # called from __del__, exist when loading fails
+        wrapper = DfsDLL.Init()
+        for name in DfsFile._nativeFunctions:
+            setattr(self, "_" + name, getattr(wrapper, name))
 
     def __del__(self):
         self.Close()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.Close()
+
     def Open(self, filename, mode = DfsFileMode.Read, parameters=None):
         """
         Open file
@@ -719,6 +865,7 @@ class DfsFile:
 
         self.FileName = filename
         self.FileMode = mode
+        self._parameters = parameters
         self.filePointer = ctypes.c_void_p()
         self.headPointer = ctypes.c_void_p()
         # Marshal filename string to C char*
@@ -744,6 +891,9 @@ class DfsFile:
 
         self.FileInfo = DfsFileInfo()
         self.FileInfo.InitRead(self, self.headPointer, parameters)
+        self._timeIndex = None
+        self._fpLayout = None
+        self._memoryMaps = None
 
         # Load Items
         noOfItems = DfsDLL.Wrapper.dfsGetNoOfItems(self.headPointer)
@@ -778,6 +928,9 @@ class DfsFile:
 
         self.FileInfo = DfsFileInfo()
         self.FileInfo.InitRead(self, headPointer)
+        self._timeIndex = None
+        self._fpLayout = None
+        self._memoryMaps = None
 
         # Load Items
         self.ItemInfo = []
@@ -790,11 +943,28 @@ class DfsFile:
         """
         Close the file and release all ressources associated with it. The header information
         is still valid (for reading) even though the file has been closed.
+        Calling Close on a closed file does nothing.
         """
+        for staticItem in list(self._staticItems):
+            staticItem.Dispose()
+        self._staticItems.clear()
+        self._writeData = None
+        self._writeDataPointer = None
+        self._memoryMaps = None
+        self.__CloseMemoryMap()
         if (self.filePointer.value != None):
             DfsDLL.Wrapper.dfsFileClose(self.headPointer, ctypes.byref(self.filePointer))
+            self.filePointer = ctypes.c_void_p(0)
         if (self.headPointer.value != None):
+            # Item info must remain valid after close, decode any deferred spatial axis
+            # and copy custom block data while the native header still exist.
+            for item in self.ItemInfo:
+                item.SpatialAxis
+            if (hasattr(self, "FileInfo")):
+                for customBlock in self.FileInfo.CustomBlocks:
+                    customBlock._Detach()
             DfsDLL.Wrapper.dfsHeaderDestroy(ctypes.byref(self.headPointer))
+            self.headPointer = ctypes.c_void_p(0)
 
 
     def GetNextItemNumber(self):
@@ -884,6 +1054,8 @@ class DfsFile:
         # Check type of data, and save to disc.
         if (DfsDLLUtil.GetDfsType(data) != stItem.DataType):
             raise Exception("Type of data defined in static item does not match type of data argument.");
+        if (stItem.VectorPointer is None):
+            raise Exception("Static item has been disposed, it can not be written to the file.");
 
         rok = DfsDLL.Wrapper.dfsStaticWrite(stItem.VectorPointer, self.filePointer, data.ctypes.data);
         DfsDLL.CheckReturnCode(rok);
@@ -925,20 +1097,21 @@ class DfsFile:
 
         if (itemData is None):
             values = item.CreateEmptyItemDataData()
+            valuesPointer = values.ctypes.data
         else:
             values = itemData.Data
+            valuesPointer = itemData._DataPointer()
 
         if (values.size != item.ElementCount):
             raise Exception("itemData.Data is of incorrect size")
 
-        timep = ctypes.c_double(0)
-        success = DfsDLL.Wrapper.dfsReadItemTimeStep(
-            self.headPointer, self.filePointer, ctypes.byref(timep), values.ctypes.data
+        success = self._dfsReadItemTimeStep(
+            self.headPointer, self.filePointer, self._timepRef, valuesPointer
         )
 
         if success != 0:
             return None
-        time = self.__GetTime(timep.value, self.fpTimeStepIndex)
+        time = self.__GetTime(self._timep.value, self.fpTimeStepIndex)
         if (itemData is None):
             res = DfsItemData(self.fpTimeStepIndex, self.fpItemNumber, time, values)
         else:
@@ -984,6 +1157,280 @@ class DfsFile:
         self.__FpFindItemTimeStep(itemNumber, timestepIndex);
         return (self.ReadItemTimeStepNext(itemData, reshape));
 
+    def __GetTimeIndex(self):
+        """
+        Times of all time steps, as numpy array. Times are relative, in the unit
+        of the time axis, as the Time of the DfsItemData read from the file.
+        The array is created once and reused, until data is written to the file.
+
+        For an equidistant time axis, times are calculated from the time axis.
+        For a non-equidistant time axis, times are stored with the data, and
+        are read from the file:
+        - When all items have one float or double value, like in most dfs0 files,
+          all times are read with one native bulk read call.
+        - Otherwise the item with the fewest elements is read for each time step,
+          seeking past the data of all other items.
+
+        Reading times moves the file pointer. A position at a dynamic item-timestep
+        is restored afterwards. The static item iteration is reset, as when
+        reading dynamic item data.
+        """
+        if (self._timeIndex is None):
+            timeAxis = self.FileInfo.TimeAxis
+            if (timeAxis.IsEquidistant()):
+                times = timeAxis.StartTimeOffset + timeAxis.TimeStep * np.arange(timeAxis.NumberOfTimeSteps, dtype=np.float64)
+            else:
+                times = self.__ReadTimes()
+            times.flags.writeable = False
+            self._timeIndex = times
+        return self._timeIndex
+    TimeIndex = property(__GetTimeIndex)
+
+    def __ReadTimes(self):
+        self.__CheckIfOpen()
+        if (self.fpState == DfsFilePointerState.CreatingItems):
+            raise Exception("No dynamic items have been written to the file yet (file is being created).");
+
+        numTimeSteps = self.FileInfo.TimeAxis.NumberOfTimeSteps
+        times = np.zeros(numTimeSteps, dtype=np.float64)
+        if (numTimeSteps == 0 or len(self.ItemInfo) == 0):
+            return times
+
+        fpState = self.fpState
+        fpItemNumber = self.fpItemNumber
+        fpTimeStepIndex = self.fpTimeStepIndex
+
+        if all(item.ElementCount == 1 and item.DataType in (DfsSimpleType.Float, DfsSimpleType.Double) for item in self.ItemInfo):
+            # Bulk read times and first item, leaves the file pointer after the last item-timestep.
+            # Times are returned in seconds.
+            data = np.zeros(2 * numTimeSteps, dtype=np.float64)
+            itemsToLoad = np.array([1], dtype=np.int32)
+            rok = self._dfsReadDfs0ItemsDouble(
+                self.headPointer, self.filePointer, data.ctypes.data, itemsToLoad.ctypes.data, 1
+            )
+            DfsDLL.CheckReturnCode(rok)
+            times[:] = self.FileInfo.TimeAxis.ToRelativeTime(data[0::2])
+            self.fpState = DfsFilePointerState.DynamicItem
+            self.fpItemNumber = 1
+            self.fpTimeStepIndex = numTimeSteps
+        else:
+            item = min(self.ItemInfo, key=lambda item: item.ElementCount)
+            itemData = item.CreateEmptyItemData()
+            for i in range(numTimeSteps):
+                self.__FpFindItemTimeStep(item.ItemNumber, i)
+                times[i] = self.ReadItemTimeStepNext(itemData).Time
+
+        self.__FpRestore(fpState, fpItemNumber, fpTimeStepIndex)
+        return times
+
+    def ReadAhead(self, depth: int = 2, maxBytes: int = None, startTimeStepIndex: int = 0):
+        """
+        Iterate over the time steps of the file, reading up to depth time steps ahead
+        in a background thread while the current time step is processed, see DfsReadAhead.
+
+        The file is opened again for reading the time steps, with its own native file handle,
+        hence the file pointer of this file is not affected.
+
+        :param depth int: Number of time steps to read ahead
+        :param maxBytes int: Optional limit of the memory used for data of time steps, in bytes
+        :param startTimeStepIndex int: Index of the first time step to read (0-based)
+        :returns DfsReadAhead: Iterator returning a list of DfsItemData for each time step
+        """
+        from mikecore.DfsReadAhead import DfsReadAhead
+        return DfsReadAhead(self.FileName, depth, maxBytes, startTimeStepIndex, self._parameters)
+
+    def GetItemMemoryMap(self, itemNumber: int):
+        """
+        Memory mapped view of the data of all time steps of a dynamic item, as a
+        read-only numpy array of shape (NumberOfTimeSteps, ElementCount). Slicing the
+        view in time or space only reads the parts of the file that are accessed,
+        without calls to the native library.
+
+        Memory mapping is available for files opened for reading, that are not
+        compressed, and without unit conversion of the items. The layout of the
+        dynamic data is determined once for the file, by locating item-timesteps,
+        read the ordinary way, in the file. The layout must have the same size for
+        every time step, with the last time step ending at the end of the file.
+        Before the views are used, every item-timestep of the file is read the
+        ordinary way and compared to the views, hence the first call reads all
+        dynamic data once. If memory mapping is not available, None is returned.
+
+        The views are valid while the file is open, and the file must not be modified
+        while they are in use. Close releases the memory map. Views still referenced
+        keep the memory map, and on Windows the file locked, until they are deleted.
+
+        :param itemNumber int: Item number (1-based)
+        :returns numpy.ndarray: Memory mapped view of the item data, or None
+        """
+        self.__CheckIfOpen()
+        if (itemNumber <= 0 or itemNumber > len(self.ItemInfo)):
+            raise Exception("itemNumber must be within [1,NumberOfItems].");
+        if (self._memoryMaps is None):
+            fpState = self.fpState
+            fpItemNumber = self.fpItemNumber
+            fpTimeStepIndex = self.fpTimeStepIndex
+            self._memoryMaps = self.__CreateMemoryMaps() or False
+            self.__FpRestore(fpState, fpItemNumber, fpTimeStepIndex)
+        if (self._memoryMaps is False):
+            return None
+        return self._memoryMaps[itemNumber - 1]
+
+    def ReadItemTimeSteps(self, itemNumber: int, timestepIndices = None, memoryMap: bool = False) -> np.ndarray:
+        """
+        Reads the data of a dynamic item for a number of time steps, as a numpy array
+        of shape (number of time steps, ElementCount).
+
+        Each item-timestep is read from the file. With memoryMap True, data is instead
+        copied from the memory mapped view of the item when available, see GetItemMemoryMap.
+
+        :param itemNumber int: Item number (1-based)
+        :param timestepIndices: Time step indices (0-based), as a slice or sequence. Default is all time steps.
+        :param memoryMap bool: Use the memory mapped view of the item, when available
+        :returns numpy.ndarray: Item data, one row for each time step
+        """
+        if (timestepIndices is None):
+            timestepIndices = slice(None)
+        if (memoryMap):
+            view = self.GetItemMemoryMap(itemNumber)
+            if (view is not None):
+                return np.array(view[timestepIndices])
+
+        indices = np.atleast_1d(np.arange(self.FileInfo.TimeAxis.NumberOfTimeSteps)[timestepIndices])
+        itemData = self.ItemInfo[itemNumber - 1].CreateEmptyItemData()
+        res = np.empty((indices.size, itemData.Data.size), dtype=itemData.Data.dtype)
+        for i in range(indices.size):
+            # Read directly into the row of the result
+            itemData.Data = res[i]
+            self.ReadItemTimeStep(itemData, int(indices[i]))
+        return res
+
+    def __CreateMemoryMaps(self):
+        """
+        Create memory mapped views of all dynamic items, or return None if not possible.
+        Moves the file pointer.
+        """
+        numTimeSteps = self.FileInfo.TimeAxis.NumberOfTimeSteps
+        if (self.FileMode != DfsFileMode.Read
+            or self.FileInfo.IsFileCompressed
+            or numTimeSteps == 0
+            or len(self.ItemInfo) == 0
+            or any(item.ConversionType != UnitConversionType.NoConversion for item in self.ItemInfo)):
+            return None
+
+        try:
+            with open(self.FileName, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        views = self.__LocateMemoryMaps(mm, numTimeSteps)
+        if (views is None):
+            mm.close()
+            return None
+        self._memoryMap = mm
+        return views
+
+    def __LocateMemoryMaps(self, mm, numTimeSteps):
+        """Memory mapped views of all dynamic items in mm, verified on all item-timesteps, or None"""
+        # Data of the first time step, and of the first item of the second time step
+        firstStep = [self.ReadItemTimeStep(item.ItemNumber, 0).Data for item in self.ItemInfo]
+        secondStep = self.ReadItemTimeStep(1, 1).Data if numTimeSteps > 1 else None
+
+        # Locate the item-timestep with the most distinct byte values in the file, and
+        # the other item-timesteps relative to that. The same data can also be found
+        # in the header or in static items, hence try more locations. All time steps
+        # after the first follow the first one, which limits the search to the start
+        # of the file, before the data of the remaining time steps.
+        anchor = max(range(len(firstStep)), key=lambda i: np.unique(firstStep[i].view(np.uint8)).size)
+        stepBytes = sum(data.nbytes for data in firstStep)
+        searchEnd = len(mm) - (numTimeSteps - 1) * stepBytes - sum(data.nbytes for data in firstStep[anchor + 1:])
+        start = 0
+        for attempt in range(8):
+            position = mm.find(firstStep[anchor].tobytes(), start, max(searchEnd, 0))
+            if (position < 0):
+                return None
+            layout = DfsFile.__MatchDataLayout(mm, anchor, position, firstStep, secondStep, numTimeSteps)
+            if (layout is not None):
+                offsets, stride = layout
+                views = [np.ndarray(shape=(numTimeSteps, data.size), dtype=data.dtype, buffer=mm,
+                                    offset=offset, strides=(stride, data.itemsize))
+                         for data, offset in zip(firstStep, offsets)]
+                # A sample of time steps first, to quickly try the next location on a mismatch
+                if (self.__VerifyMemoryMaps(views, DfsFile.__SampleTimeSteps(numTimeSteps))):
+                    # A layout is only used when it matches every item-timestep of the file
+                    if (self.__VerifyMemoryMaps(views, range(numTimeSteps))):
+                        return views
+                    return None
+            start = position + 1
+        return None
+
+    # Maximum number of bytes between item-timesteps in the dynamic data,
+    # accepted when determining the layout for memory mapping
+    _memoryMapMaxGap = 1024
+    # Number of evenly spread, and of random, time steps compared when locating memory
+    # maps, before all time steps are compared
+    _memoryMapVerifySteps = 16
+    _memoryMapVerifyRandomSteps = 4
+
+    @staticmethod
+    def __MatchDataLayout(mm, anchor, position, firstStep, secondStep, numTimeSteps):
+        """
+        Offsets in the file of the items of the first time step, and the stride between
+        time steps, when item number anchor+1 is at position. None if no match.
+        """
+        offsets = [position]
+        start = position
+        for data in reversed(firstStep[:anchor]):
+            position = mm.rfind(data.tobytes(), max(0, start - DfsFile._memoryMapMaxGap - data.nbytes), start)
+            if (position < 0):
+                return None
+            offsets.insert(0, position)
+            start = position
+        end = offsets[-1] + firstStep[anchor].nbytes
+        for data in firstStep[anchor + 1:] + ([secondStep] if secondStep is not None else []):
+            position = mm.find(data.tobytes(), end, end + DfsFile._memoryMapMaxGap + data.nbytes)
+            if (position < 0):
+                return None
+            offsets.append(position)
+            end = position + data.nbytes
+        if (secondStep is not None):
+            stride = offsets.pop() - offsets[0]
+        else:
+            stride = end - offsets[0]
+        # Dynamic data is stored last in the file: the layout of all time steps
+        # must end exactly at the end of the file
+        if (offsets[-1] + (numTimeSteps - 1) * stride + firstStep[-1].nbytes != len(mm)):
+            return None
+        return offsets, stride
+
+    @staticmethod
+    def __SampleTimeSteps(numTimeSteps):
+        """Time steps, in increasing order, spread evenly over the file, and a few random ones"""
+        timesteps = set(np.linspace(0, numTimeSteps - 1, DfsFile._memoryMapVerifySteps).astype(int).tolist())
+        timesteps.update(np.random.default_rng(numTimeSteps).integers(0, numTimeSteps, DfsFile._memoryMapVerifyRandomSteps).tolist())
+        return sorted(timesteps)
+
+    def __VerifyMemoryMaps(self, views, timesteps):
+        """Compare the memory mapped views with data read for the time steps, in increasing order"""
+        itemDatas = [item.CreateEmptyItemData() for item in self.ItemInfo]
+        for timestepIndex in timesteps:
+            # Positioning once per time step, the items are then read sequentially
+            self.FindTimeStep(timestepIndex)
+            for itemData, view in zip(itemDatas, views):
+                self.ReadItemTimeStepNext(itemData)
+                if (not np.array_equal(itemData.Data.view(np.uint8), view[timestepIndex].view(np.uint8))):
+                    return False
+        return True
+
+    def __CloseMemoryMap(self):
+        if (self._memoryMap is not None):
+            try:
+                self._memoryMap.close()
+            except BufferError:
+                # Views are still referenced, the memory map is closed when they are deleted
+                pass
+            self._memoryMap = None
+
     def __GetTime(self, time, timestepIndex):
         # TODO: This assumes time in seconds?
         timeaxis = self.FileInfo.TimeAxis
@@ -1104,7 +1551,12 @@ class DfsFile:
         elif (dynamicItem.DataType == DfsSimpleType.UShort and data.dtype != np.uint16):
             raise Exception("Expecting uint16 data, got " + str(data.dtype))
 
-        DfsDLL.Wrapper.dfsWriteItemTimeStep(self.headPointer, self.filePointer, ctypes.c_double(time), data.ctypes.data);
+        self._timeIndex = None
+        # Writers usually reuse one array for all item-timesteps
+        if (data is not self._writeData):
+            self._writeDataPointer = data.ctypes.data
+            self._writeData = data
+        self._dfsWriteItemTimeStep(self.headPointer, self.filePointer, time, self._writeDataPointer);
 
         if (self.__FpDynamicIncrement()):
             if (self.fpTimeStepIndex > self.FileInfo.TimeAxis.NumberOfTimeSteps):
@@ -1165,6 +1617,71 @@ class DfsFile:
         self.__CheckIfOpen()
         DfsDLL.Wrapper.dfsFileFlushTimeStep(self.headPointer, self.filePointer)
 
+    def EnableInstrumentation(self, callback = None) -> DfsIOStatistics:
+        """
+        Enable collecting I/O statistics of the file: bytes of item data read and
+        written, and number of calls and time spent in the native functions of the
+        dynamic item data path, including seeks. The statistics are available in
+        the Stats property, see DfsIOStatistics.
+
+        The native functions are replaced by wrappers recording each call, so there
+        is no overhead when instrumentation is disabled (the default).
+
+        If instrumentation is already enabled, the existing statistics are kept,
+        and the callback is replaced when given.
+
+        :param callback: Optional function called after each native call, as
+            callback(name: str, seconds: float, nbytes: int)
+        :returns DfsIOStatistics: The statistics, also available as Stats
+        """
+        if (self.Stats is not None):
+            if (callback is not None):
+                self.Stats.Callback = callback
+            return self.Stats
+
+        # Weak reference to the file, to not keep it alive from its own attributes
+        fileRef = weakref.ref(self)
+        def itemBytes(rc, *args):
+            if (rc != 0):
+                return 0
+            dfsFile = fileRef()
+            item = dfsFile.ItemInfo[dfsFile.fpItemNumber - 1]
+            return item.ElementCount * _dfsSimpleTypeSize[item.DataType]
+        def dfs0ReadBytes(rc, *args):
+            if (rc != 0):
+                return 0
+            dfsFile = fileRef()
+            numItems = args[4] if len(args) > 4 else len(dfsFile.ItemInfo)
+            return 8 * (numItems + 1) * dfsFile.FileInfo.TimeAxis.NumberOfTimeSteps
+        def dfs0WriteBytes(rc, headPointer, filePointer, data, numTimeSteps):
+            if (rc != 0):
+                return 0
+            return 8 * (len(fileRef().ItemInfo) + 1) * numTimeSteps
+        nbytes = {
+            "dfsReadItemTimeStep": itemBytes,
+            "dfsWriteItemTimeStep": itemBytes,
+            "dfsReadDfs0DataDouble": dfs0ReadBytes,
+            "dfsReadDfs0ItemsDouble": dfs0ReadBytes,
+            "dfsWriteDfs0DataDouble": dfs0WriteBytes,
+        }
+
+        stats = DfsIOStatistics(callback)
+        wrapper = DfsDLL.Init()
+        for name in DfsFile._nativeFunctions:
+            setattr(self, "_" + name, stats._Wrap(name, getattr(wrapper, name), nbytes.get(name)))
+        self.Stats = stats
+        return stats
+
+    def DisableInstrumentation(self):
+        """
+        Disable collecting I/O statistics, restoring the native functions. The Stats
+        property is set to None.
+        """
+        wrapper = DfsDLL.Init()
+        for name in DfsFile._nativeFunctions:
+            setattr(self, "_" + name, getattr(wrapper, name))
+        self.Stats = None
+
     def CreateEmptyItemData(self, item, reshape = False):
         """Create an empty DfsItemData object with the size matching the item.
 
@@ -1205,13 +1722,17 @@ class DfsFile:
 
         data = np.zeros(npSize, dtype=np.float64)
         if (itemsToLoad is None):
-            success = DfsDLL.Wrapper.dfsReadDfs0DataDouble(
+            success = self._dfsReadDfs0DataDouble(
                 self.headPointer, self.filePointer, data.ctypes.data
             )
         else:
-            success = DfsDLL.Wrapper.dfsReadDfs0ItemsDouble(
+            success = self._dfsReadDfs0ItemsDouble(
                 self.headPointer, self.filePointer, data.ctypes.data, itemsToLoad.ctypes.data, numItemsToLoad
             )
+        # The bulk read leaves the file pointer after the last item-timestep
+        self.fpState = DfsFilePointerState.DynamicItem
+        self.fpItemNumber = 1
+        self.fpTimeStepIndex = numTimeSteps
         if success != 0:
             return None
 
@@ -1249,7 +1770,8 @@ class DfsFile:
             raise Exception("Type of input data is incorrect. Must be float(64), but is: " + str(data.dtype))
 
         data = np.require(data, requirements=['C'])
-        success = DfsDLL.Wrapper.dfsWriteDfs0DataDouble(
+        self._timeIndex = None
+        success = self._dfsWriteDfs0DataDouble(
             self.headPointer, self.filePointer, data.ctypes.data, numTimeSteps
         )
 
@@ -1261,42 +1783,117 @@ class DfsFile:
             raise IOError("File is closed")
 
     def __FpFindBlockDynamic(self):
-        DfsDLL.Wrapper.dfsFindBlockDynamic(self.headPointer, self.filePointer)
+        self._dfsFindBlockDynamic(self.headPointer, self.filePointer)
         self.fpState = DfsFilePointerState.DynamicItem
         self.fpItemNumber = 1
         self.fpTimeStepIndex = 0
 
     def __FpFindItemTimeStep(self, itemNumber: int, timestepIndex: int):
-        # If itemNumber is first item, search for time step instead
-        if itemNumber == 1:
-            self.__FpFindTimeStep(timestepIndex)
-
         # Position the file pointer at the dynamic item
         if (
-            self.fpState != DfsFilePointerState.DynamicItem
-            or self.fpItemNumber != itemNumber
-            or self.fpTimeStepIndex != timestepIndex
+            self.fpState == DfsFilePointerState.DynamicItem
+            and self.fpItemNumber == itemNumber
+            and self.fpTimeStepIndex == timestepIndex
         ):
-            DfsDLL.Wrapper.dfsFindItemDynamic(
-                self.headPointer, self.filePointer, int(timestepIndex), itemNumber
+            self.__FpRecordAccess(None)
+            return
+        if (self.__FpReadForward(itemNumber, timestepIndex)):
+            self.__FpRecordAccess(None)
+            return
+
+        backward = (
+            self.fpState == DfsFilePointerState.DynamicItem
+            and (timestepIndex, itemNumber) < (self.fpTimeStepIndex, self.fpItemNumber)
+        )
+        # If itemNumber is first item, search for time step instead
+        if itemNumber == 1:
+            self._dfsFindTimeStep(
+                self.headPointer, self.filePointer, timestepIndex
             )
-            self.fpState = DfsFilePointerState.DynamicItem
-            self.fpItemNumber = itemNumber
-            self.fpTimeStepIndex = timestepIndex
+        else:
+            self._dfsFindItemDynamic(
+                self.headPointer, self.filePointer, timestepIndex, itemNumber
+            )
+        self.fpState = DfsFilePointerState.DynamicItem
+        self.fpItemNumber = itemNumber
+        self.fpTimeStepIndex = timestepIndex
+        self.__FpRecordAccess(backward)
 
     def __FpFindTimeStep(self, timestepIndex: int):
-        # Position the file pointer at the dynamic item
-        if (
-            self.fpState != DfsFilePointerState.DynamicItem
-            or self.fpItemNumber != 1
-            or self.fpTimeStepIndex != timestepIndex
-        ):
-            DfsDLL.Wrapper.dfsFindTimeStep(
-                self.headPointer, self.filePointer, int(timestepIndex)
-            )
-            self.fpState = DfsFilePointerState.DynamicItem
-            self.fpItemNumber = 1
-            self.fpTimeStepIndex = timestepIndex
+        self.__FpFindItemTimeStep(1, timestepIndex)
+
+    def __FpReadForward(self, itemNumber: int, timestepIndex: int):
+        """
+        Move the file pointer forward to the item-timestep by reading the item-timesteps
+        in between, if they are at most MaxForwardReadBytes. Returns False if not done.
+        """
+        if (self.fpState != DfsFilePointerState.DynamicItem
+            or self.FileMode != DfsFileMode.Read
+            or self.MaxForwardReadBytes <= 0
+            or timestepIndex >= self.FileInfo.TimeAxis.NumberOfTimeSteps):
+            return False
+
+        if (self._fpLayout is None):
+            # Byte offset of each item within a time step, and a buffer for any item
+            itemBytes = [item.ElementCount * _dfsSimpleTypeSize[item.DataType] for item in self.ItemInfo]
+            offsets = np.concatenate(([0], np.cumsum(itemBytes))).tolist()
+            buffer = np.empty(max(itemBytes, default=0), dtype=np.uint8)
+            self._fpLayout = (offsets, buffer, buffer.ctypes.data)
+        offsets, buffer, bufferPointer = self._fpLayout
+
+        distance = ((timestepIndex - self.fpTimeStepIndex) * offsets[-1]
+                    + offsets[itemNumber - 1] - offsets[self.fpItemNumber - 1])
+        if (distance <= 0 or distance > self.MaxForwardReadBytes):
+            return False
+
+        while (self.fpItemNumber != itemNumber or self.fpTimeStepIndex != timestepIndex):
+            if (self._dfsReadItemTimeStep(self.headPointer, self.filePointer, self._timepRef, bufferPointer) != 0):
+                # Caller seeks to the item-timestep, fixing the file pointer state
+                return False
+            self.__FpDynamicIncrement()
+        if (self.Stats is not None):
+            self.Stats.ForwardReads += 1
+        return True
+
+    def __FpRestore(self, fpState, fpItemNumber, fpTimeStepIndex):
+        """
+        Restore a file pointer position at a dynamic item-timestep, also at the end of
+        the file. A position in the static items is not restored.
+        """
+        if (fpState != DfsFilePointerState.DynamicItem):
+            return
+        numTimeSteps = self.FileInfo.TimeAxis.NumberOfTimeSteps
+        if (fpTimeStepIndex < numTimeSteps):
+            self.__FpFindItemTimeStep(fpItemNumber, fpTimeStepIndex)
+        elif (self.fpState != DfsFilePointerState.DynamicItem or self.fpTimeStepIndex < numTimeSteps):
+            # Position at the end, by reading the last item-timestep
+            self.__FpFindItemTimeStep(len(self.ItemInfo), numTimeSteps - 1)
+            self.ReadItemTimeStepNext()
+
+    def __FpRecordAccess(self, backward):
+        """
+        Record a positioning of the file pointer, backward is None when no seek was required.
+        Logs when more than half of the positionings within a window required a seek.
+        """
+        self._fpAccessCount += 1
+        if (backward is not None):
+            self._fpSeekCount += 1
+            if (backward):
+                self._fpBackwardSeekCount += 1
+        if (self._fpAccessCount < self.AccessPatternWindow):
+            return
+        if (2 * self._fpSeekCount > self._fpAccessCount):
+            # Log once at info level, afterwards at debug level
+            level = logging.DEBUG if self._fpRandomAccessLogged else logging.INFO
+            if (_logger.isEnabledFor(level)):
+                _logger.log(level,
+                    "Random access pattern in %s: %d of the last %d file positionings required a seek, "
+                    "%d of them backwards. Reading in file order with ReadItemTimeStepNext avoids seeking.",
+                    self.FileName, self._fpSeekCount, self._fpAccessCount, self._fpBackwardSeekCount)
+            self._fpRandomAccessLogged = True
+        self._fpAccessCount = 0
+        self._fpSeekCount = 0
+        self._fpBackwardSeekCount = 0
 
     def __FpDynamicIncrement(self):
         self.fpItemNumber += 1
@@ -1313,7 +1910,8 @@ class DfsFile:
             DfsDLL.Wrapper.dfsItemD(self.headPointer, itemNumber)
         )
         item = DfsDynamicItemInfo(itemPointer, itemNumber)
-        self.__GetItemInfo(item)
+        # Spatial axis is decoded on first access, see Close
+        self.__GetItemInfo(item, readSpatialAxis = False)
         return item
 
     def __StaticItemReadAndCreate(self, number, ubgConversion):
@@ -1325,6 +1923,7 @@ class DfsFile:
 
         if (staticVectorPointer is None):
             return (None);
+        staticVectorPointer = ctypes.c_void_p(staticVectorPointer)
 
         # Get pointer to static item info
         staticItemPointer = ctypes.c_void_p(DfsDLL.Wrapper.dfsItemS(staticVectorPointer))
@@ -1345,40 +1944,24 @@ class DfsFile:
         self.__GetItemInfo(staticItem)
         self.__GetStaticData(staticItem)
 
-        return (staticItem)
+        # Item info and data has been copied. The native static vector is only 
+        # required for writing the static item back to the file.
+        if (self.FileMode == DfsFileMode.Read):
+            staticItem.Dispose()
 
-    def __GetItemInfo(self, item):
-        eumItemIntP = ctypes.c_int32()
-        eumItemDescP = ctypes.c_char_p()
-        itemNameP = ctypes.c_char_p()
-        eumUnitIntP = ctypes.c_int32()
-        eumUnitDescP = ctypes.c_char_p()
-        itemDataTypeP = ctypes.c_int()
-
-        # DfsDLL.Wrapper.dfsGetItemInfo_(itemPointer, ctypes.byref(eumItemIntP), ctypes.byref(itemNameP), ctypes.byref(eumUnitDescP), ctypes.byref(itemDataTypeP));
-        DfsDLL.Wrapper.dfsGetItemInfo(
-            item.ItemPointer,
-            ctypes.byref(eumItemIntP),
-            ctypes.byref(eumItemDescP),
-            ctypes.byref(itemNameP),
-            ctypes.byref(eumUnitIntP),
-            ctypes.byref(eumUnitDescP),
-            ctypes.byref(itemDataTypeP),
-        )
-        eumItemDesc = eumItemDescP.value.decode("ascii")
-        eumUnitDesc = eumUnitDescP.value.decode("ascii")
-        itemName = itemNameP.value.decode("cp1252", "replace")
-        itemDataType = DfsSimpleType(itemDataTypeP.value)
+        return (staticItem)
 
-        quantity = eumQuantity(eumItem(eumItemIntP.value), eumUnit(eumUnitIntP.value))
-        quantity.ItemDescription = eumItemDesc
-        quantity.UnitDescription = eumUnitDesc
+    def __GetItemInfo(self, item, readSpatialAxis = True):
+        itemName, quantity, itemDataType = DfsDLLUtil.GetItemInfo(item.ItemPointer)
 
         item.init(itemName, quantity)
         item.DataType = itemDataType
         item.ValueType = DfsDLLUtil.dfsGetItemValueType(item.ItemPointer)
         item.ElementCount = DfsDLL.Wrapper.dfsGetItemElements(item.ItemPointer)
-        item.SpatialAxis = DfsDLLUtil.GetItemSpatialAxis(item.ItemPointer)
+        if (readSpatialAxis):
+            item.SpatialAxis = DfsDLLUtil.GetItemSpatialAxis(item.ItemPointer)
+        else:
+            item._DeferSpatialAxis()
 
 
     def __GetStaticData(self, item):
@@ -1574,6 +2157,36 @@ class DfsDLLUtil():
             )
             return res
 
+    @staticmethod
+    def GetItemInfo(itemPointer):
+        """Returns item name, quantity and data type of the native item"""
+        eumItemIntP = ctypes.c_int32()
+        eumItemDescP = ctypes.c_char_p()
+        itemNameP = ctypes.c_char_p()
+        eumUnitIntP = ctypes.c_int32()
+        eumUnitDescP = ctypes.c_char_p()
+        itemDataTypeP = ctypes.c_int()
+
+        # DfsDLL.Wrapper.dfsGetItemInfo_(itemPointer, ctypes.byref(eumItemIntP), ctypes.byref(itemNameP), ctypes.byref(eumUnitDescP), ctypes.byref(itemDataTypeP));
+        DfsDLL.Wrapper.dfsGetItemInfo(
+            itemPointer,
+            ctypes.byref(eumItemIntP),
+            ctypes.byref(eumItemDescP),
+            ctypes.byref(itemNameP),
+            ctypes.byref(eumUnitIntP),
+            ctypes.byref(eumUnitDescP),
+            ctypes.byref(itemDataTypeP),
+        )
+        eumItemDesc = eumItemDescP.value.decode("ascii")
+        eumUnitDesc = eumUnitDescP.value.decode("ascii")
+        itemName = itemNameP.value.decode("cp1252", "replace")
+        itemDataType = DfsSimpleType(itemDataTypeP.value)
+
+        quantity = eumQuantity(eumItem(eumItemIntP.value), eumUnit(eumUnitIntP.value))
+        quantity.ItemDescription = eumItemDesc
+        quantity.UnitDescription = eumUnitDesc
+        return itemName, quantity, itemDataType
+
     @staticmethod
     def GetItemSpatialAxis(itemPointer):
         axisType = SpaceAxisType(DfsDLL.Wrapper.dfsGetItemAxisType(itemPointer));
@@ -1750,13 +2363,19 @@ class DfsDLLUtil():
 
 
     @staticmethod
-    def BuildCustomBlocks(headPointer):
+    def BuildCustomBlocks(headPointer, readOnly = False):
+        """
+        Build custom blocks with values as views on the native header 
+        memory. See DfsCustomBlock for their lifetime.
+        """
         customBlockP = ctypes.c_void_p();
         rok = DfsDLL.Wrapper.dfsGetCustomBlockRef(headPointer, ctypes.byref(customBlockP))
         DfsDLL.CheckReturnCode(rok);
         customBlocks = []
         while (customBlockP.value != None):
             customBlockP, dfsCustomBlock = DfsDLLUtil.__CustomBlockRead(customBlockP)
+            if (readOnly):
+                dfsCustomBlock.Values.flags.writeable = False
             customBlocks.append(dfsCustomBlock)
         return (customBlocks);
 
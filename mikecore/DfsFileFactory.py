@@ -1,7 +1,48 @@
-from mikecore.DfsFile import DfsFile, DfsParameters, DfsFileMode;
+import os
+import ctypes
+from mikecore.DfsDLL import DfsDLL
+from mikecore.DfsFile import DfsFile, DfsParameters, DfsFileMode, DfsCustomBlock, DfsDLLUtil, SpaceAxisType;
 from mikecore.Dfs123File import Dfs123File, Dfs2File, Dfs3File
 from mikecore.DfsuFile import DfsuFile
 
+class DfsFileSummary:
+    """
+    Summary of the header of a dfs file, as returned by DfsFileFactory.Probe.
+
+    Holds no references to native resources, hence it can be pickled
+    and passed between processes.
+    """
+    def __init__(self):
+        self.FileName = ""
+        self.FileTitle = ""
+        self.ApplicationTitle = ""
+        self.ApplicationVersion = 0
+        self.DataType = 0
+        self.IsFileCompressed = False
+        self.DeleteValueFloat = DfsFile.DefaultDeleteValueFloat
+        # DfsuFileType for dfsu files, otherwise None
+        self.DfsuFileType = None
+        self.Projection = None
+        self.TimeAxis = None
+        self.CustomBlocks = []
+        # One entry for each dynamic item
+        self.ItemNames = []
+        self.ItemQuantities = []
+        self.ItemDataTypes = []
+        self.ItemElementCounts = []
+        self.ItemAxisTypes = []
+
+    def __repr__(self):
+        return "DfsFileSummary({}, {} items)".format(self.FileName, len(self.ItemNames))
+
+    @property
+    def ProjectionWKT(self):
+        return self.Projection.WKTString
+
+    @property
+    def NumberOfTimeSteps(self):
+        return self.TimeAxis.NumberOfTimeSteps if self.TimeAxis is not None else 0
+
 class DfsFileFactory:
     """description of class"""
 
@@ -99,3 +140,62 @@ class DfsFileFactory:
     @staticmethod
     def CreateDefaultParameters():
         return (DfsParameters());
+
+    @staticmethod
+    def Probe(filename, parameters = None) -> DfsFileSummary:
+        """
+        Read the header of a dfs file and return a DfsFileSummary.
+        Only the header is decoded, static items and dynamic data are not
+        read, and the file is closed again before returning.
+        """
+        if (not os.path.isfile(filename)):
+            raise FileNotFoundError("File not found {}".format(filename))
+
+        if (parameters is None):
+            parameters = DfsParameters()
+
+        DfsDLL.Init()
+        headPointer = ctypes.c_void_p()
+        filePointer = ctypes.c_void_p()
+        rok = DfsDLL.Wrapper.dfsFileRead(
+            filename.encode("cp1252"), ctypes.byref(headPointer), ctypes.byref(filePointer)
+        )
+        if (rok != 0):
+            raise Exception("Could not load file {} (Error code {})".format(filename, rok))
+
+        try:
+            # The dfsParamModifyTimes must be called before getting the temporal axis.
+            DfsDLL.Wrapper.dfsParamModifyTimes(headPointer, ctypes.c_int32(parameters.ModifyTimes))
+
+            res = DfsFileSummary()
+            res.FileName = filename
+            res.FileTitle = DfsDLL.Wrapper.dfsGetFileTitle(headPointer).decode("cp1252", "replace")
+            res.ApplicationTitle = DfsDLL.Wrapper.dfsGetAppTitle(headPointer).decode("cp1252", "replace")
+            res.ApplicationVersion = DfsDLL.Wrapper.dfsGetAppVersionNo(headPointer)
+            res.DataType = DfsDLL.Wrapper.dfsGetDataType(headPointer)
+            res.IsFileCompressed = (DfsDLL.Wrapper.dfsIsFileCompressed(headPointer) != 0)
+            res.DeleteValueFloat = DfsDLL.Wrapper.dfsGetDeleteValFloat(headPointer)
+            res.Projection = DfsDLLUtil.GetProjection(headPointer)
+            res.TimeAxis = DfsDLLUtil.GetTemporalAxis(headPointer)
+
+            # Custom block values refer to native memory, copy them
+            for customBlock in DfsDLLUtil.BuildCustomBlocks(headPointer):
+                res.CustomBlocks.append(DfsCustomBlock(customBlock.Name, customBlock.SimpleType, customBlock.Values.copy()))
+
+            if (len(res.CustomBlocks) == 1 and res.CustomBlocks[0].Name == "MIKE_FM"):
+                res.DfsuFileType = DfsuFile.GetDfsuFileType(res.DataType, res.CustomBlocks[0])
+
+            noOfItems = DfsDLL.Wrapper.dfsGetNoOfItems(headPointer)
+            for i in range(noOfItems):
+                itemPointer = ctypes.c_void_p(DfsDLL.Wrapper.dfsItemD(headPointer, i + 1))
+                itemName, quantity, itemDataType = DfsDLLUtil.GetItemInfo(itemPointer)
+                res.ItemNames.append(itemName)
+                res.ItemQuantities.append(quantity)
+                res.ItemDataTypes.append(itemDataType)
+                res.ItemElementCounts.append(DfsDLL.Wrapper.dfsGetItemElements(itemPointer))
+                res.ItemAxisTypes.append(SpaceAxisType(DfsDLL.Wrapper.dfsGetItemAxisType(itemPointer)))
+        finally:
+            DfsDLL.Wrapper.dfsFileClose(headPointer, ctypes.byref(filePointer))
+            DfsDLL.Wrapper.dfsHeaderDestroy(ctypes.byref(headPointer))
+
+        return res
@@ -0,0 +1,116 @@
+import time
+
+
+class DfsIOStatistics:
+    '''
+    I/O statistics of a DfsFile, collected while instrumentation is enabled,
+    see DfsFile.EnableInstrumentation.
+
+    Native calls of the dynamic item data path are counted and timed by name,
+    together with the number of bytes of item data read and written. Seeks
+    are the calls to the native find functions issued when positioning the
+    file pointer. Short forward positionings are done by reading the data in
+    between instead of seeking (see DfsFile.MaxForwardReadBytes). These are
+    counted in ForwardReads, and their reads count as native reads.
+
+    Times are in seconds. NativeTime is the time spent in the native calls,
+    and PythonTime is the remaining wall time since instrumentation was
+    enabled or Reset, i.e. time spent in Python, including the calling code.
+
+    A callback can be given, which is called after each native call with
+    the function name, the time in seconds and the number of bytes read or
+    written (0 for seeks), for example to update counters of a metrics exporter.
+
+    :param callback: Optional function, callback(name: str, seconds: float, nbytes: int)
+    '''
+
+    # Native functions by kind of operation
+    ReadFunctions = ("dfsReadItemTimeStep", "dfsReadDfs0DataDouble", "dfsReadDfs0ItemsDouble")
+    WriteFunctions = ("dfsWriteItemTimeStep", "dfsWriteDfs0DataDouble")
+    SeekFunctions = ("dfsFindItemDynamic", "dfsFindTimeStep", "dfsFindBlockDynamic")
+
+    def __init__(self, callback = None):
+        self.Callback = callback
+        self.Reset()
+
+    def Reset(self):
+        """Reset all counters and timers to zero"""
+        self.BytesRead = 0
+        self.BytesWritten = 0
+        # Number of positionings done by reading forward instead of seeking
+        self.ForwardReads = 0
+        # Number of calls and time spent, by native function name
+        self.NativeCalls = {}
+        self.NativeTimes = {}
+        self._startTime = time.perf_counter()
+
+    @property
+    def Seeks(self) -> int:
+        """Number of native seek calls"""
+        return sum(self.NativeCalls.get(name, 0) for name in DfsIOStatistics.SeekFunctions)
+
+    @property
+    def SeekTime(self) -> float:
+        """Time spent in native seek calls"""
+        return sum(self.NativeTimes.get(name, 0.0) for name in DfsIOStatistics.SeekFunctions)
+
+    @property
+    def NativeTime(self) -> float:
+        """Time spent in all native calls"""
+        return sum(self.NativeTimes.values())
+
+    @property
+    def ElapsedTime(self) -> float:
+        """Wall time since instrumentation was enabled or Reset"""
+        return time.perf_counter() - self._startTime
+
+    @property
+    def PythonTime(self) -> float:
+        """Wall time not spent in native calls"""
+        return self.ElapsedTime - self.NativeTime
+
+    def ToDict(self) -> dict:
+        """All statistics as a flat dictionary, with native calls and times as calls.<name> and time.<name>"""
+        res = {
+            "bytesRead": self.BytesRead,
+            "bytesWritten": self.BytesWritten,
+            "seeks": self.Seeks,
+            "forwardReads": self.ForwardReads,
+            "seekTime": self.SeekTime,
+            "nativeTime": self.NativeTime,
+            "pythonTime": self.PythonTime,
+        }
+        for name, count in self.NativeCalls.items():
+            res["calls." + name] = count
+            res["time." + name] = self.NativeTimes[name]
+        return res
+
+    def __repr__(self):
+        return "DfsIOStatistics(bytesRead={}, bytesWritten={}, seeks={}, forwardReads={}, nativeTime={:.6f}, pythonTime={:.6f})".format(
+            self.BytesRead, self.BytesWritten, self.Seeks, self.ForwardReads, self.NativeTime, self.PythonTime)
+
+    def _Record(self, name, seconds, nbytes):
+        self.NativeCalls[name] = self.NativeCalls.get(name, 0) + 1
+        self.NativeTimes[name] = self.NativeTimes.get(name, 0.0) + seconds
+        if (nbytes):
+            if (name in DfsIOStatistics.WriteFunctions):
+                self.BytesWritten += nbytes
+            else:
+                self.BytesRead += nbytes
+        if (self.Callback is not None):
+            self.Callback(name, seconds, nbytes)
+
+    def _Wrap(self, name, function, nbytes = None):
+        '''
+        Wrap the native function, recording each call. nbytes is an optional
+        function, called as nbytes(returnCode, *args), returning the number
+        of bytes read or written by the call.
+        '''
+        perf_counter = time.perf_counter
+        def call(*args):
+            t0 = perf_counter()
+            rc = function(*args)
+            seconds = perf_counter() - t0
+            self._Record(name, seconds, nbytes(rc, *args) if nbytes is not None else 0)
+            return rc
+        return call
@@ -0,0 +1,116 @@
+import queue
+import threading
+from mikecore.DfsFile import DfsFile, DfsFileMode, _dfsSimpleTypeSize
+
+
+class DfsReadAhead:
+    '''
+    Iterator over the time steps of a dfs file, reading the next time steps
+    in a background thread while the current time step is being processed.
+
+    The file is opened again for reading, with its own native file handle,
+    hence the file pointer of any other DfsFile object of the same file is
+    not affected.
+
+    Each iteration returns a list of DfsItemData, one for each dynamic item,
+    of the next time step. The data arrays are reused: they are valid until
+    the next iteration, copy them to keep them longer.
+
+    Up to depth time steps are read ahead. Together with the time step being
+    processed, depth + 1 time steps are held in memory. When maxBytes is given,
+    depth is reduced such that the data of the time steps held in memory does
+    not exceed maxBytes, though always at least one time step is read ahead.
+
+    Use Close, or a with statement, to stop the thread and close the file, when
+    not iterating through all time steps.
+
+    :param filename: Name of file to read
+    :param depth: Number of time steps to read ahead
+    :param maxBytes: Optional limit of the memory used for data, in bytes
+    :param startTimeStepIndex: Index of the first time step to read (0-based)
+    :param parameters: Optional DfsParameters used when opening the file
+    '''
+
+    def __init__(self, filename, depth = 2, maxBytes = None, startTimeStepIndex = 0, parameters = None):
+        self._thread = None
+        if (depth < 1):
+            raise ValueError("depth must be at least 1")
+
+        dfsFile = DfsFile()
+        dfsFile.Open(filename, DfsFileMode.Read, parameters)
+
+        stepBytes = sum(item.ElementCount * _dfsSimpleTypeSize[item.DataType] for item in dfsFile.ItemInfo)
+        if (maxBytes is not None and stepBytes > 0):
+            depth = max(1, min(depth, maxBytes // stepBytes - 1))
+        self.Depth = depth
+        self.FileName = filename
+
+        # Buffers of depth + 1 time steps, the one being processed and the ones read ahead
+        self._slots = [[item.CreateEmptyItemData() for item in dfsFile.ItemInfo] for i in range(depth + 1)]
+        self._free = queue.Queue()
+        for slot in range(depth + 1):
+            self._free.put(slot)
+        self._ready = queue.Queue()
+        self._current = None
+        self._done = False
+        self._stop = threading.Event()
+
+        # The thread does not reference self, so an abandoned iterator can be garbage collected
+        self._thread = threading.Thread(
+            target=DfsReadAhead._Run,
+            args=(dfsFile, self._slots, self._free, self._ready, self._stop, startTimeStepIndex),
+            name="DfsReadAhead", daemon=True)
+        self._thread.start()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if (self._current is not None):
+            self._free.put(self._current)
+            self._current = None
+        if (self._done):
+            raise StopIteration
+        res = self._ready.get()
+        if (res is None):
+            self._done = True
+            raise StopIteration
+        if (isinstance(res, BaseException)):
+            self._done = True
+            raise res
+        self._current = res
+        return self._slots[res]
+
+    def Close(self):
+        """Stop reading ahead and close the file. Calling Close more than once does nothing."""
+        self._done = True
+        if (self._thread is not None and self._thread.is_alive()):
+            self._stop.set()
+            # Wake up the thread, if waiting for a buffer
+            self._free.put(None)
+            self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.Close()
+
+    def __del__(self):
+        self.Close()
+
+    @staticmethod
+    def _Run(dfsFile, slots, free, ready, stop, startTimeStepIndex):
+        try:
+            for timestepIndex in range(startTimeStepIndex, dfsFile.FileInfo.TimeAxis.NumberOfTimeSteps):
+                slot = free.get()
+                if (stop.is_set()):
+                    return
+                for itemData in slots[slot]:
+                    dfsFile.ReadItemTimeStep(itemData, timestepIndex)
+                ready.put(slot)
+            ready.put(None)
+        except BaseException as e:
+            ready.put(e)
+        finally:
+            dfsFile.Close()
@@ -0,0 +1,411 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from mikecore.DfsFile import *
+from mikecore.DfsBuilder import DfsBuilder
+from mikecore.eum import eumQuantity, eumItem, eumUnit
+
+
+class DfsItemStatistics:
+    '''
+    Running temporal statistics of the values of one dynamic item.
+
+    The statistics are updated one timestep at a time, using memory
+    proportional to the number of elements only. Values equal to the
+    delete value are not included.
+
+    Two DfsItemStatistics of the same elements, for example of two
+    periods or two files, can be combined using Merge.
+    '''
+
+    # Names of statistics available from GetStatistic
+    StatisticNames = ("Min", "Max", "Mean", "Std", "TimeOfMax", "TimeStepOfMax", "Count")
+
+    def __init__(self, elementCount, deleteValue, thresholds = None):
+        self.ElementCount = elementCount
+        self.DeleteValue = deleteValue
+        self.Thresholds = np.array([] if thresholds is None else thresholds, dtype=np.float64)
+
+        # Number of values of each element
+        self.Count = np.zeros(elementCount, dtype=np.int64)
+        # Number of values larger than each of the thresholds
+        self.ExceedanceCount = np.zeros((self.Thresholds.size, elementCount), dtype=np.int64)
+
+        self.__min = np.full(elementCount, np.inf)
+        self.__max = np.full(elementCount, -np.inf)
+        self.__timeOfMax = np.zeros(elementCount, dtype=np.float64)
+        self.__timeStepOfMax = np.full(elementCount, -1, dtype=np.int64)
+        # Running mean and sum of squared differences from the mean (Welford)
+        self.__mean = np.zeros(elementCount, dtype=np.float64)
+        self.__m2 = np.zeros(elementCount, dtype=np.float64)
+
+    def Update(self, data, timestepIndex, time, elements = slice(None)):
+        '''
+        Update the statistics with the data of one timestep.
+
+        :param data: Values of the item for the timestep
+        :param timestepIndex: Index of timestep, stored for the time of maximum
+        :param time: Time of timestep, stored for the time of maximum
+        :param elements: Slice of elements to update. Updates of distinct
+                         slices can run concurrently.
+        '''
+        values = data[elements]
+        valid = values != self.DeleteValue
+        x = values.astype(np.float64)
+
+        count = self.Count[elements]
+        count += valid
+
+        mean = self.__mean[elements]
+        delta = np.where(valid, x - mean, 0.0)
+        mean += np.divide(delta, count, out=np.zeros_like(delta), where=valid)
+        self.__m2[elements] += delta * (x - mean)
+
+        minValues = self.__min[elements]
+        np.minimum(minValues, np.where(valid, x, np.inf), out=minValues)
+        isMax = valid & (x > self.__max[elements])
+        self.__max[elements][isMax] = x[isMax]
+        self.__timeOfMax[elements][isMax] = time
+        self.__timeStepOfMax[elements][isMax] = timestepIndex
+
+        for k in range(self.Thresholds.size):
+            self.ExceedanceCount[k, elements] += valid & (x > self.Thresholds[k])
+
+    def Merge(self, other):
+        '''
+        Merge the statistics of another DfsItemStatistics of the same elements into this.
+        '''
+        if (other.ElementCount != self.ElementCount or not np.array_equal(other.Thresholds, self.Thresholds)):
+            raise Exception("Statistics of different elements or thresholds can not be merged");
+
+        count = self.Count + other.Count
+        delta = other.__mean - self.__mean
+        with np.errstate(divide='ignore', invalid='ignore'):
+            otherFraction = np.where(count > 0, other.Count / count, 0.0)
+        self.__mean += delta * otherFraction
+        self.__m2 += other.__m2 + delta * delta * self.Count * otherFraction
+        self.Count = count
+
+        np.minimum(self.__min, other.__min, out=self.__min)
+        isMax = other.__max > self.__max
+        self.__max[isMax] = other.__max[isMax]
+        self.__timeOfMax[isMax] = other.__timeOfMax[isMax]
+        self.__timeStepOfMax[isMax] = other.__timeStepOfMax[isMax]
+        self.ExceedanceCount += other.ExceedanceCount
+
+    def GetStatistic(self, name):
+        '''
+        Get one of the statistics in StatisticNames. Elements without any values
+        get the delete value, except for Count, and TimeStepOfMax which is -1.
+        '''
+        if (name == "Count"):
+            return self.Count.copy()
+        if (name == "TimeStepOfMax"):
+            return self.__timeStepOfMax.copy()
+        if (name == "Min"):
+            res = self.__min.copy()
+        elif (name == "Max"):
+            res = self.__max.copy()
+        elif (name == "Mean"):
+            res = self.__mean.copy()
+        elif (name == "Std"):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                res = np.sqrt(self.__m2 / self.Count)
+        elif (name == "TimeOfMax"):
+            res = self.__timeOfMax.copy()
+        else:
+            raise Exception("Unknown statistic '{}'. Must be one of {}".format(name, DfsItemStatistics.StatisticNames))
+        res[self.Count == 0] = self.DeleteValue
+        return res
+
+
+class DfsItemHistogram:
+    '''
+    Per element histogram of the values of one dynamic item, with fixed bins
+    over a known value range, for approximate quantiles of long time series.
+
+    Memory is proportional to the number of elements times the number of bins,
+    independent of the number of timesteps. Values below or above the range
+    are counted in an underflow and overflow bin. Histograms with the same
+    range and bins can be combined using Merge.
+    '''
+
+    def __init__(self, elementCount, deleteValue, minValue, maxValue, numberOfBins = 100):
+        if (not maxValue > minValue):
+            raise Exception("Histogram range must have maxValue > minValue")
+        self.ElementCount = elementCount
+        self.DeleteValue = deleteValue
+        self.MinValue = float(minValue)
+        self.MaxValue = float(maxValue)
+        self.NumberOfBins = numberOfBins
+        self.BinWidth = (self.MaxValue - self.MinValue) / numberOfBins
+        # Bin counts for each element. Column 0 is the underflow bin, the last column the overflow bin
+        self.Counts = np.zeros((elementCount, numberOfBins + 2), dtype=np.int32)
+
+    def Update(self, data, elements = slice(None)):
+        '''
+        Update the histograms with the data of one timestep.
+
+        :param data: Values of the item for the timestep
+        :param elements: Slice of elements to update. Updates of distinct
+                         slices can run concurrently.
+        '''
+        values = data[elements]
+        valid = values != self.DeleteValue
+        bins = np.floor((values.astype(np.float64) - self.MinValue) / self.BinWidth)
+        bins = np.clip(bins, -1, self.NumberOfBins).astype(np.intp) + 1
+        counts = self.Counts[elements]
+        # Each element is updated once, so the indices are unique
+        rows = np.flatnonzero(valid)
+        counts[rows, bins[rows]] += 1
+
+    def Merge(self, other):
+        '''
+        Merge the histograms of another DfsItemHistogram of the same elements and bins into this.
+        '''
+        if (other.Counts.shape != self.Counts.shape or other.MinValue != self.MinValue or other.MaxValue != self.MaxValue):
+            raise Exception("Histograms of different elements or bins can not be merged");
+        self.Counts += other.Counts
+
+    def Quantile(self, q):
+        '''
+        Approximate quantile of the values of each element, interpolating
+        linearly within the bin containing the quantile. Quantiles in the
+        underflow or overflow bin are returned as MinValue or MaxValue.
+        Elements without any values get the delete value.
+
+        :param q: Quantile, between 0 and 1, e.g. 0.9 for the P90 value.
+        '''
+        cumCounts = np.cumsum(self.Counts, axis=1)
+        count = cumCounts[:,-1]
+        target = q * count
+        # First bin where the cumulative count reaches the target
+        bins = np.minimum(np.sum(cumCounts < target[:,np.newaxis], axis=1), self.NumberOfBins + 1)
+        rows = np.arange(self.ElementCount)
+        countBefore = cumCounts[rows, bins] - self.Counts[rows, bins]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fraction = np.clip((target - countBefore) / self.Counts[rows, bins], 0, 1)
+        fraction[self.Counts[rows, bins] == 0] = 0
+        res = self.MinValue + (bins - 1 + fraction) * self.BinWidth
+        res[bins == 0] = self.MinValue
+        res[bins == self.NumberOfBins + 1] = self.MaxValue
+        res[count == 0] = self.DeleteValue
+        return res
+
+
+class DfsStatistics:
+    '''
+    Temporal statistics of the dynamic items of a dfs file.
+
+    Compute reads every item-timestep of the file once, in the order
+    they are stored on disk, and updates a DfsItemStatistics for each
+    of the selected items. Results are available from ItemStatistics,
+    or can be written to a new dfs file using WriteDfsFile.
+
+    For approximate quantiles, a DfsItemHistogram is updated for the items
+    that are given a value range in histogramRanges.
+    '''
+
+    def __init__(self, dfsFile, itemNumbers = None, thresholds = None, numberOfThreads = 1, histogramRanges = None, numberOfBins = 100):
+        '''
+        :param dfsFile: File to calculate statistics of
+        :param itemNumbers: Item numbers (1-based) to calculate statistics of. Default all items.
+        :param thresholds: Thresholds to count exceedances of.
+        :param numberOfThreads: Number of threads updating the statistics, each thread
+                                updating a chunk of the elements of an item.
+        :param histogramRanges: Dictionary from item number to (minValue, maxValue) of the
+                                histogram of the item, for approximate quantiles.
+        :param numberOfBins: Number of bins of histograms.
+        '''
+        self.DfsFile = dfsFile
+        if (itemNumbers is None):
+            itemNumbers = [itemInfo.ItemNumber for itemInfo in dfsFile.ItemInfo]
+        self.ItemNumbers = list(itemNumbers)
+        self.NumberOfThreads = numberOfThreads
+        self.NumberOfTimeSteps = 0
+
+        fileInfo = dfsFile.FileInfo
+        # Statistics for each dynamic item, None for items not selected
+        self.ItemStatistics = [None] * len(dfsFile.ItemInfo)
+        for itemNumber in self.ItemNumbers:
+            itemInfo = dfsFile.ItemInfo[itemNumber-1]
+            deleteValue = fileInfo.DeleteValueDouble if itemInfo.DataType == DfsSimpleType.Double else fileInfo.DeleteValueFloat
+            self.ItemStatistics[itemNumber-1] = DfsItemStatistics(itemInfo.ElementCount, deleteValue, thresholds)
+
+        # Histograms for each dynamic item, None for items without a histogram
+        self.ItemHistograms = [None] * len(dfsFile.ItemInfo)
+        if (histogramRanges is not None):
+            for itemNumber, (minValue, maxValue) in histogramRanges.items():
+                itemStatistics = self.ItemStatistics[itemNumber-1]
+                if (itemStatistics is None):
+                    raise Exception("Histogram range given for item {}, which has no statistics".format(itemNumber))
+                self.ItemHistograms[itemNumber-1] = DfsItemHistogram(itemStatistics.ElementCount, itemStatistics.DeleteValue, minValue, maxValue, numberOfBins)
+
+    def Compute(self):
+        '''
+        Read all item-timesteps of the file once, and update the statistics.
+        '''
+        dfsFile = self.DfsFile
+        # For performance, reuse item data buffers for all timesteps
+        itemDatas = [itemInfo.CreateEmptyItemData() for itemInfo in dfsFile.ItemInfo]
+
+        executor = None
+        if (self.NumberOfThreads > 1):
+            executor = ThreadPoolExecutor(max_workers=self.NumberOfThreads)
+
+        try:
+            # Read item-timesteps in the order they are stored on disk
+            dfsFile.FindItem(1, 0)
+            for i in range(dfsFile.FileInfo.TimeAxis.NumberOfTimeSteps):
+                for j in range(len(dfsFile.ItemInfo)):
+                    itemData = dfsFile.ReadItemTimeStepNext(itemDatas[j])
+                    itemStatistics = self.ItemStatistics[j]
+                    if (itemStatistics is None):
+                        continue
+                    itemHistogram = self.ItemHistograms[j]
+                    if (executor is None):
+                        DfsStatistics.__Update(itemStatistics, itemHistogram, itemData, i, slice(None))
+                    else:
+                        # The item data buffer is reused by the next read, wait for all chunks
+                        chunks = DfsStatistics.__Chunks(itemStatistics.ElementCount, self.NumberOfThreads)
+                        list(executor.map(lambda elements: DfsStatistics.__Update(itemStatistics, itemHistogram, itemData, i, elements), chunks))
+                self.NumberOfTimeSteps += 1
+        finally:
+            if (executor is not None):
+                executor.shutdown()
+
+        return self
+
+    @staticmethod
+    def __Update(itemStatistics, itemHistogram, itemData, timestepIndex, elements):
+        itemStatistics.Update(itemData.Data, timestepIndex, itemData.Time, elements)
+        if (itemHistogram is not None):
+            itemHistogram.Update(itemData.Data, elements)
+
+    @staticmethod
+    def __Chunks(elementCount, numberOfChunks):
+        bounds = np.linspace(0, elementCount, numberOfChunks + 1).astype(int)
+        return [slice(bounds[i], bounds[i+1]) for i in range(numberOfChunks) if bounds[i+1] > bounds[i]]
+
+    def Merge(self, other):
+        '''
+        Merge the statistics of another DfsStatistics, for example of another
+        period of the same model, into this.
+        '''
+        for i in range(len(self.ItemStatistics)):
+            if (self.ItemStatistics[i] is not None):
+                if (other.ItemStatistics[i] is None):
+                    raise Exception("Item {} has no statistics to merge".format(i+1))
+                self.ItemStatistics[i].Merge(other.ItemStatistics[i])
+            if (self.ItemHistograms[i] is not None):
+                if (other.ItemHistograms[i] is None):
+                    raise Exception("Item {} has no histogram to merge".format(i+1))
+                self.ItemHistograms[i].Merge(other.ItemHistograms[i])
+        self.NumberOfTimeSteps += other.NumberOfTimeSteps
+        return self
+
+    def WriteDfsFile(self, filename, statistics = ("Min", "Max", "Mean", "Std", "TimeOfMax")):
+        '''
+        Write the statistics to a new dfs file with one timestep. Header, custom
+        blocks and static items are copied from the source file, and a dynamic item
+        is created for each statistic of each item, and for each exceedance threshold.
+        Statistics are names from DfsItemStatistics.StatisticNames, or P followed by
+        a percentage for an approximate quantile, e.g. "P90", for items with a histogram.
+
+        For dfsu files with a vertical dimension, the first item is the node based
+        Z coordinate. It is copied as the first item of the new file with its mean
+        value, or with its value of the first timestep when it has no statistics,
+        and no statistics are written for it.
+        '''
+        source = self.DfsFile
+        fileInfo = source.FileInfo
+
+        builder = DfsBuilder.Create(fileInfo.FileTitle, fileInfo.ApplicationTitle, fileInfo.ApplicationVersion);
+        builder.SetDataType(fileInfo.DataType);
+        builder.SetGeographicalProjection(fileInfo.Projection);
+        builder.SetTemporalAxis(fileInfo.TimeAxis);
+        builder.DeleteValueFloat = fileInfo.DeleteValueFloat;
+        builder.DeleteValueDouble = fileInfo.DeleteValueDouble;
+        for customBlock in fileInfo.CustomBlocks:
+            builder.AddCustomBlock(customBlock);
+
+        # Dfsu file with a vertical dimension, see DfsuFile
+        customBlock = fileInfo.CustomBlocks[0] if len(fileInfo.CustomBlocks) > 0 else None
+        hasZItem = (customBlock is not None and customBlock.Name == "MIKE_FM" and customBlock.Count >= 4 and customBlock[3] > 0)
+
+        # Data for all items, in the order they are added to the builder
+        datas = []
+        if (hasZItem):
+            zItemInfo = source.ItemInfo[0]
+            builder.AddDynamicItem(DfsStatistics.__CreateItem(builder, zItemInfo, zItemInfo.Name, zItemInfo.Quantity))
+            if (self.ItemStatistics[0] is not None):
+                datas.append(self.ItemStatistics[0].GetStatistic("Mean"))
+            else:
+                datas.append(source.ReadItemTimeStep(1, 0).Data.copy())
+
+        undefinedQuantity = eumQuantity(eumItem.eumIItemUndefined, eumUnit.eumUUnitUndefined)
+        for itemNumber in self.ItemNumbers:
+            if (hasZItem and itemNumber == 1):
+                continue
+            itemInfo = source.ItemInfo[itemNumber-1]
+            itemStatistics = self.__GetItemStatistics(itemNumber)
+            for statistic in statistics:
+                quantity = itemInfo.Quantity if statistic in ("Min", "Max", "Mean", "Std") or statistic.startswith("P") else undefinedQuantity
+                builder.AddDynamicItem(DfsStatistics.__CreateItem(builder, itemInfo, "{} {}".format(statistic, itemInfo.Name), quantity))
+                datas.append(self.GetStatistic(itemNumber, statistic))
+            for k in range(itemStatistics.Thresholds.size):
+                name = "Exceedances {} > {:g}".format(itemInfo.Name, itemStatistics.Thresholds[k])
+                builder.AddDynamicItem(DfsStatistics.__CreateItem(builder, itemInfo, name, undefinedQuantity))
+                datas.append(itemStatistics.ExceedanceCount[k])
+
+        builder.CreateFile(filename);
+
+        # Copy static items
+        sourceStaticItem = source.ReadStaticItemNext();
+        while sourceStaticItem is not None:
+            builder.AddStaticItem(sourceStaticItem);
+            sourceStaticItem = source.ReadStaticItemNext();
+
+        dfsFile = builder.GetFile();
+        for data in datas:
+            dfsFile.WriteItemTimeStepNext(0.0, data.astype(np.float32));
+        dfsFile.Close();
+
+    def GetStatistic(self, itemNumber, statistic):
+        '''
+        Get a statistic of an item, see WriteDfsFile for the statistic names.
+        '''
+        if (statistic.startswith("P")):
+            itemHistogram = self.ItemHistograms[itemNumber-1]
+            if (itemHistogram is None):
+                raise Exception("No histogram calculated for item {}".format(itemNumber))
+            return itemHistogram.Quantile(float(statistic[1:]) / 100)
+        return self.__GetItemStatistics(itemNumber).GetStatistic(statistic)
+
+    def __GetItemStatistics(self, itemNumber):
+        itemStatistics = self.ItemStatistics[itemNumber-1]
+        if (itemStatistics is None):
+            raise Exception("No statistics calculated for item {}".format(itemNumber))
+        return itemStatistics
+
+    @staticmethod
+    def __CreateItem(builder, itemInfo, name, quantity):
+        itemBuilder = builder.CreateDynamicItemBuilder()
+        itemBuilder.Set(name, quantity, DfsSimpleType.Float)
+        itemBuilder.SetValueType(DataValueType.Instantaneous)
+        itemBuilder.SetAxis(itemInfo.SpatialAxis)
+        itemBuilder.SetReferenceCoordinates(itemInfo.ReferenceCoordinateX, itemInfo.ReferenceCoordinateY, itemInfo.ReferenceCoordinateZ)
+        itemBuilder.SetOrientation(itemInfo.OrientationAlpha, itemInfo.OrientationPhi, itemInfo.OrientationTheta)
+        return itemBuilder.GetDynamicItemInfo()
+
+    @staticmethod
+    def Calculate(filename, itemNumbers = None, thresholds = None, numberOfThreads = 1, histogramRanges = None, numberOfBins = 100):
+        '''
+        Calculate temporal statistics of the items in a file.
+        :returns: DfsStatistics with the results. The file is closed.
+        '''
+        from mikecore.DfsFileFactory import DfsFileFactory
+        dfsFile = DfsFileFactory.DfsGenericOpen(filename)
+        try:
+            return DfsStatistics(dfsFile, itemNumbers, thresholds, numberOfThreads, histogramRanges, numberOfBins).Compute()
+        finally:
+            dfsFile.Close()
@@ -294,16 +294,10 @@ class DfsuBuilder:
 
       # Check that all nodenumbers are within the range of
       # number of nodes.
-      check = True
-      for elmt in self.__connectivity:
-        for nodeNumber in elmt:
-          if (0 >= nodeNumber or nodeNumber > self.__x.size):
-            check = False
-            break
-        if (not check):
-          break
-      if (not check):
-        errors.append("At least one element has an invalid node number. Node numbers must be within [1,numberOfNodes]")
+      if (self.__isSetNodes and self.__isSetConnectivity):
+        nodesPerElmt, connectivityArray = DfsuUtil.ElementTableToArrays(self.__connectivity)
+        if (np.any(connectivityArray <= 0) or np.any(connectivityArray > self.__x.size)):
+          errors.append("At least one element has an invalid node number. Node numbers must be within [1,numberOfNodes]")
 
       # For vertical files, checking that elements are correctly on top of each other, 
       # and calculate the maxNumberOfLayers
@@ -360,36 +354,19 @@ class DfsuBuilder:
         self.__elementIds = np.arange(len(self.__connectivity), dtype=np.int32) + 1
   
       # Creating additional element information
-      elementType = np.zeros(len(self.__connectivity), dtype=np.int32)
-      nodesPerElmt = np.zeros(len(self.__connectivity), dtype=np.int32)
-      nodeElmtCount = 0 # total number of nodes listed in the connectivity table
-      for i in range(elementType.size):
-        elmt = self.__connectivity[i]
-        elmtsize = len(elmt)
-        if   elmtsize == 2: # vertical column
-            elmtTypeNumber = 11
-        elif elmtsize == 3: # triangle
-            elmtTypeNumber = 21
-        elif elmtsize == 4: # quadrilateral
-            elmtTypeNumber = 25
-        elif elmtsize == 6: # prisme (base element is a triangle)
-            elmtTypeNumber = 32
-        elif elmtsize == 8: # Hexahedron (base element is a quadrilateral)
-            elmtTypeNumber = 33
-        else:
-            # this should have been caught in the validate phase, but just in case:
-            raise Exception("Element with invalid number of nodes encountered")
-        elementType[i] = elmtTypeNumber
-        nodesPerElmt[i] = len(elmt)
-        nodeElmtCount += len(elmt)
-
-      connectivityArray = np.zeros(nodeElmtCount, dtype=np.int32)
-      k = 0
-      for i in range(elementType.size):
-        elmt = self.__connectivity[i]
-        for j in range (len(elmt)):
-           connectivityArray[k] = elmt[j]
-           k += 1
+      nodesPerElmt, connectivityArray = DfsuUtil.ElementTableToArrays(self.__connectivity)
+      # Element type from number of nodes in element:
+      #   2: vertical column
+      #   3: triangle
+      #   4: quadrilateral
+      #   6: prisme (base element is a triangle)
+      #   8: Hexahedron (base element is a quadrilateral)
+      elmtTypeNumbers = np.zeros(9, dtype=np.int32)
+      elmtTypeNumbers[[2, 3, 4, 6, 8]] = [11, 21, 25, 32, 33]
+      if (np.any(nodesPerElmt > 8) or np.any(elmtTypeNumbers[np.minimum(nodesPerElmt, 8)] == 0)):
+        # this should have been caught in the validate phase, but just in case:
+        raise Exception("Element with invalid number of nodes encountered")
+      elementType = elmtTypeNumbers[nodesPerElmt]
 
       return elementType, nodesPerElmt, connectivityArray
   
@@ -70,6 +70,9 @@ class DfsuFile(object):
         self.__freqItem = None
         self.__dirItem = None
 
+        # Geometry is set directly, or read on first access
+        self.__staticItemsRead = True;
+
         # Node variables
         self.NodeIds = None;
         self.X = None;
@@ -83,6 +86,12 @@ class DfsuFile(object):
         self.ElementIds = None; # this can be null, then set default id's, starting from 1
         self.ElementType = None;
         self.ElementTable = [];
+        # Element table as dfsu connectivity arrays, see GetConnectivityArrays
+        self.__nodesPerElmt = None;
+        self.__connectivity = None;
+        # Column and layer index maps, see Layers
+        self.__layers = None;
+        self.__elementToNodeWeights = None;
 
         # Spectral definition
         self.Frequencies = None;
@@ -111,10 +120,11 @@ class DfsuFile(object):
       if (customBlock is None or customBlock.Count < 4 or customBlock.SimpleType != DfsSimpleType.Int):
           raise Exception("Error while reading dfsu file (custom block not valid)");
 
-      #int numberOfNodes = customBlock[0];
+      numberOfNodes = customBlock[0];
       numberOfElmts = customBlock[1];
+      self.__numberOfNodes = int(numberOfNodes);
+      self.__numberOfElmts = int(numberOfElmts);
 
-      dimensions = customBlock[2];
       self.NumberOfLayers = customBlock[3];
       if (customBlock.Count == 5):
         self.NumberOfSigmaLayers = customBlock[4];
@@ -128,127 +138,171 @@ class DfsuFile(object):
         self.NumberOfFrequencies = 0;
         self.NumberOfDirections = 0;
 
-      # Figuring out dfsu file type from custom block MIKE_FM
+      self.DfsuFileType = DfsuFile.GetDfsuFileType(self.FileInfo.DataType, customBlock);
+
+      self.ItemInfo = self.dfsFile.ItemInfo
+
+      # Do not read static items when building, they are already set.
+      # When opening a file, static items are read on first access of
+      # any of the geometry properties, see __ReadStaticItems
+      if (not build):
+        self.__staticItemsRead = False
+
+    @staticmethod
+    def GetDfsuFileType(dataType: int, customBlock: DfsCustomBlock) -> DfsuFileType:
+      """
+      Figure out the dfsu file type from the file data type and the
+      "MIKE_FM" custom block.
+      """
+      numberOfElmts = customBlock[1];
+      dimensions = customBlock[2];
+      numberOfLayers = customBlock[3];
+      if (customBlock.Count == 5):
+        numberOfSigmaLayers = customBlock[4];
+      else:
+        numberOfSigmaLayers = numberOfLayers;
+
+      if (dataType in (2002, 2003) or (dataType == 2001 and (customBlock.Count == 6))):
+        numberOfFrequencies = customBlock[4];
+        numberOfDirections = customBlock[5];
+      else:
+        numberOfFrequencies = 0;
+        numberOfDirections = 0;
+
       if (dimensions == 1):
-        if (self.NumberOfLayers > 0):
-          self.DfsuFileType = DfsuFileType.DfsuVerticalColumn;
-        elif (self.FileInfo.DataType == 2001 and (self.NumberOfFrequencies == numberOfElmts or self.NumberOfDirections == numberOfElmts)):
+        if (numberOfLayers > 0):
+          return DfsuFileType.DfsuVerticalColumn;
+        elif (dataType == 2001 and (numberOfFrequencies == numberOfElmts or numberOfDirections == numberOfElmts)):
           # Spectral Frequency-Direction (Rose-plot) geometry
-          self.DfsuFileType = DfsuFileType.DfsuSpectral0D;
-        elif (self.FileInfo.DataType == 2002 and self.IsSpectral):
+          return DfsuFileType.DfsuSpectral0D;
+        elif (dataType == 2002 and (numberOfFrequencies > 0 or numberOfDirections > 0)):
           # Spectral Frequency or Direction geometry
-          self.DfsuFileType = DfsuFileType.DfsuSpectral1D;
+          return DfsuFileType.DfsuSpectral1D;
         else:
-          self.DfsuFileType = DfsuFileType.Dfsu1D;
+          return DfsuFileType.Dfsu1D;
 
       elif (dimensions == 2):
-        if (self.FileInfo.DataType == 2001 and (self.NumberOfFrequencies*self.NumberOfDirections == numberOfElmts)):
+        if (dataType == 2001 and (numberOfFrequencies*numberOfDirections == numberOfElmts)):
           # Spectral Frequency-Direction (Rose-plot) geometry
-          self.DfsuFileType = DfsuFileType.DfsuSpectral0D;
-        elif self.FileInfo.DataType == 2003:
-          self.DfsuFileType = DfsuFileType.DfsuSpectral2D;
-        elif (self.NumberOfLayers == 0):
-          self.DfsuFileType = DfsuFileType.Dfsu2D;
-        elif (self.NumberOfLayers == self.NumberOfSigmaLayers):
-          self.DfsuFileType = DfsuFileType.DfsuVerticalProfileSigma;
+          return DfsuFileType.DfsuSpectral0D;
+        elif dataType == 2003:
+          return DfsuFileType.DfsuSpectral2D;
+        elif (numberOfLayers == 0):
+          return DfsuFileType.Dfsu2D;
+        elif (numberOfLayers == numberOfSigmaLayers):
+          return DfsuFileType.DfsuVerticalProfileSigma;
         else:
-          self.DfsuFileType = DfsuFileType.DfsuVerticalProfileSigmaZ;
+          return DfsuFileType.DfsuVerticalProfileSigmaZ;
 
       elif (dimensions == 3):
-        if (self.NumberOfLayers == self.NumberOfSigmaLayers):
-          self.DfsuFileType = DfsuFileType.Dfsu3DSigma;
+        if (numberOfLayers == numberOfSigmaLayers):
+          return DfsuFileType.Dfsu3DSigma;
         else:
-          self.DfsuFileType = DfsuFileType.Dfsu3DSigmaZ;
-
+          return DfsuFileType.Dfsu3DSigmaZ;
 
-      # Do not read static items when building, they are already set
-      if (not build):
-          # "Node id"       , int
-          # "X-coord"       , double/float
-          # "Y-coord"       , double/float
-          # "Z-coord"       , float (prepared for reading doubles)
-          # "Code"          , int
-          # "Element id"    , int
-          # "Element type"  , int
-          # "No of nodes"   , int
-          # "Connectivity"  , int
-          # For spectral files also at least one of:
-          # "Frequency"     , double
-          # "Direction"     , double
-
-          self.__nodeIdItem = self.dfsFile.ReadStaticItemNext(); CheckForNull(self.__nodeIdItem);
-          self.NodeIds = self.__nodeIdItem.Data
-
-          # X can be in doubles or in floats. Floats are converted to doubles
-          self.__xItem = self.dfsFile.ReadStaticItemNext(); CheckForNull(self.__xItem);
-          if (self.__xItem.DataType == DfsSimpleType.Double):
-            self.X = self.__xItem.Data
-          else: # self.__xItem.DataType == DfsSimpleType.Float 
-            floats = self.__xItem.Data;
-            self.X = np.array(floats, np.double);
-
-
-          # Y can be in doubles or in floats. Floats are converted to doubles
-          self.__yItem = self.dfsFile.ReadStaticItemNext(); CheckForNull(self.__yItem);
-          if (self.__yItem.DataType == DfsSimpleType.Double):
-            self.Y = self.__yItem.Data
-          else: # self.__yItem.DataType == DfsSimpleType.Double
-            floats = self.__yItem.Data;
-            self.Y = np.array(floats, np.double);
-
-          # Z is stored as float. Doubles are also read, but converted to floats ("future" support of doubles)
-          self.__zItem = self.dfsFile.ReadStaticItemNext(); CheckForNull(self.__zItem);
-          if (self.__zItem.DataType == DfsSimpleType.Float):
-            self.Z = self.__zItem.Data
-          else: # self.__zItem.DataType == DfsSimpleType.Double
-            doubles = self.__zItem.Data;
-            self.Z = np.array(doubles, np.float32);
-
-          self.ZUnit = self.__zItem.Quantity.Unit;
-
-          self.__codeItem = self.dfsFile.ReadStaticItemNext(); CheckForNull(self.__codeItem);
-          self.Code = self.__codeItem.Data
-
-          self.__elmtIdItem = self.dfsFile.ReadStaticItemNext(); CheckForNull(self.__elmtIdItem);
-          self.ElementIds = self.__elmtIdItem.Data
-
-          elmtTypeItem = self.dfsFile.ReadStaticItemNext(); CheckForNull(elmtTypeItem);
-          self.ElementType = elmtTypeItem.Data
-
-          nodesPerElmtItem = self.dfsFile.ReadStaticItemNext(); CheckForNull(nodesPerElmtItem);
-          nodesPerElement = nodesPerElmtItem.Data
-
-          connectivityItem = self.dfsFile.ReadStaticItemNext(); CheckForNull(connectivityItem);
-          connectivityArray = connectivityItem.Data
-
-          # TODO Validate data
-          self.ElementTable = np.empty(numberOfElmts,dtype=object)
-          k1 = 0
-          for i in range(numberOfElmts):
-            k2 = k1 + nodesPerElement[i]
-            self.ElementTable[i] = np.asarray(connectivityArray[k1:k2], dtype=np.int32)
-            k1 = k2
-            
-          # Spectral Dfsu
-          if (self.NumberOfFrequencies):
-              frequency = self.dfsFile.ReadStaticItemNext(); CheckForNull(frequency);
-              self.Frequencies = frequency.Data
-          if (self.NumberOfDirections):
-              direction = self.dfsFile.ReadStaticItemNext(); CheckForNull(direction);
-              self.Directions = direction.Data
-
-      self.NumberOfNodes = self.NodeIds.size; 
-      self.ItemInfo = self.dfsFile.ItemInfo
-
-      self.NumberOfElements = self.ElementIds.size
-      #self.NumberOfNodes = self.X.size
-
-      if (not build):
-         # In append mode, move the file pointer to end of file
-         # It was moved elsewhere when reading static data...
-         if (self.dfsFile.FileMode == DfsFileMode.Append):
-            self.dfsFile.FindTimeStep(self.NumberOfTimeSteps);
+      return DfsuFileType.Dfsu2D;
 
+    def __ReadStaticItems(self):
+      """
+      Read the geometry from the static items, if not already done.
+      """
+      if (self.__staticItemsRead):
+        return
+      self.__staticItemsRead = True
+
+      dfsFile = self.dfsFile
+      if (dfsFile.filePointer.value is None):
+        # File has been closed, read static items using a temporary file handle
+        dfsFile = DfsFile()
+        dfsFile.Open(self.dfsFile.FileName, DfsFileMode.Read)
+
+      # Reading static items moves the file pointer, remember where it was.
+      fpState = dfsFile.fpState
+      fpItemNumber = dfsFile.fpItemNumber
+      fpTimeStepIndex = dfsFile.fpTimeStepIndex
+
+      # "Node id"       , int
+      # "X-coord"       , double/float
+      # "Y-coord"       , double/float
+      # "Z-coord"       , float (prepared for reading doubles)
+      # "Code"          , int
+      # "Element id"    , int
+      # "Element type"  , int
+      # "No of nodes"   , int
+      # "Connectivity"  , int
+      # For spectral files also at least one of:
+      # "Frequency"     , double
+      # "Direction"     , double
+
+      self.__nodeIdItem = dfsFile.ReadStaticItem(1); CheckForNull(self.__nodeIdItem);
+      self.__nodeIds = self.__nodeIdItem.Data
+
+      # X can be in doubles or in floats. Floats are converted to doubles
+      self.__xItem = dfsFile.ReadStaticItemNext(); CheckForNull(self.__xItem);
+      if (self.__xItem.DataType == DfsSimpleType.Double):
+        self.__x = self.__xItem.Data
+      else: # self.__xItem.DataType == DfsSimpleType.Float 
+        floats = self.__xItem.Data;
+        self.__x = np.array(floats, np.double);
+        # Do not keep the geometry in memory twice
+        self.__xItem.Data = None;
+
+
+      # Y can be in doubles or in floats. Floats are converted to doubles
+      self.__yItem = dfsFile.ReadStaticItemNext(); CheckForNull(self.__yItem);
+      if (self.__yItem.DataType == DfsSimpleType.Double):
+        self.__y = self.__yItem.Data
+      else: # self.__yItem.DataType == DfsSimpleType.Double
+        floats = self.__yItem.Data;
+        self.__y = np.array(floats, np.double);
+        self.__yItem.Data = None;
+
+      # Z is stored as float. Doubles are also read, but converted to floats ("future" support of doubles)
+      self.__zItem = dfsFile.ReadStaticItemNext(); CheckForNull(self.__zItem);
+      if (self.__zItem.DataType == DfsSimpleType.Float):
+        self.__z = self.__zItem.Data
+      else: # self.__zItem.DataType == DfsSimpleType.Double
+        doubles = self.__zItem.Data;
+        self.__z = np.array(doubles, np.float32);
+        self.__zItem.Data = None;
+
+      self.__zUnit = self.__zItem.Quantity.Unit;
+
+      self.__codeItem = dfsFile.ReadStaticItemNext(); CheckForNull(self.__codeItem);
+      self.__code = self.__codeItem.Data
+
+      self.__elmtIdItem = dfsFile.ReadStaticItemNext(); CheckForNull(self.__elmtIdItem);
+      self.__elementIds = self.__elmtIdItem.Data
+
+      elmtTypeItem = dfsFile.ReadStaticItemNext(); CheckForNull(elmtTypeItem);
+      self.__elementType = elmtTypeItem.Data
+
+      nodesPerElmtItem = dfsFile.ReadStaticItemNext(); CheckForNull(nodesPerElmtItem);
+      nodesPerElement = nodesPerElmtItem.Data
+
+      connectivityItem = dfsFile.ReadStaticItemNext(); CheckForNull(connectivityItem);
+      connectivityArray = connectivityItem.Data
+
+      # TODO Validate data
+      # Element table rows are views on the connectivity array, it is not copied
+      self.__nodesPerElmt = np.asarray(nodesPerElement, dtype=np.int32)
+      self.__connectivity = np.asarray(connectivityArray, dtype=np.int32)
+      self.__elementTable = DfsuUtil.ElementTableFromArrays(self.__nodesPerElmt, self.__connectivity)
+
+      # Spectral Dfsu
+      if (self.NumberOfFrequencies):
+          frequency = dfsFile.ReadStaticItemNext(); CheckForNull(frequency);
+          self.__frequencies = frequency.Data
+      if (self.NumberOfDirections):
+          direction = dfsFile.ReadStaticItemNext(); CheckForNull(direction);
+          self.__directions = direction.Data
+
+      if (dfsFile is not self.dfsFile):
+        dfsFile.Close()
+      elif (fpState == DfsFilePointerState.DynamicItem):
+        # Move the file pointer back to where it was. In append mode 
+        # this is the end of the file.
+        dfsFile.FindItem(fpItemNumber, fpTimeStepIndex)
 
     def Dispose(self):
       """
@@ -291,6 +345,12 @@ class DfsuFile(object):
     def Close(self):
        self.dfsFile.Close();
 
+    def __enter__(self):
+      return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+      self.Close()
+
     @staticmethod
     def Open(fileName):
       dfs = DfsFile();
@@ -421,6 +481,131 @@ class DfsuFile(object):
     def IsSpectral(self):
       return (self.NumberOfFrequencies > 0) or (self.NumberOfDirections > 0)
 
+    @property
+    def IsLayered(self):
+      return self.DfsuFileType in (DfsuFileType.DfsuVerticalColumn, DfsuFileType.DfsuVerticalProfileSigma, DfsuFileType.DfsuVerticalProfileSigmaZ, DfsuFileType.Dfsu3DSigma, DfsuFileType.Dfsu3DSigmaZ)
+
+    @property
+    def Layers(self):
+      """
+      Column and layer index maps of a file with a vertical dimension, see DfsuLayers.
+      The maps are calculated on first access and cached.
+      """
+      if (not self.IsLayered):
+        raise Exception("Dfsu file does not have a vertical dimension");
+      if (self.__layers is None):
+        self.__layers = DfsuLayers(self)
+      return self.__layers
+
+    @property
+    def NumberOfNodes(self):
+      # Take it from the custom block, when static items have not been read.
+      # For spectral files the custom block can not be used.
+      if (not self.__staticItemsRead and not self.IsSpectral):
+        return self.__numberOfNodes
+      return self.NodeIds.size
+
+    @property
+    def NumberOfElements(self):
+      if (not self.__staticItemsRead and not self.IsSpectral):
+        return self.__numberOfElmts
+      return self.ElementIds.size
+
+    # Geometry properties, static items are read on first access
+    def __GetNodeIds(self):
+        self.__ReadStaticItems()
+        return self.__nodeIds
+    def __SetNodeIds(self, value):
+        self.__ReadStaticItems()
+        self.__nodeIds = value
+    NodeIds = property(__GetNodeIds, __SetNodeIds)
+
+    def __GetX(self):
+        self.__ReadStaticItems()
+        return self.__x
+    def __SetX(self, value):
+        self.__ReadStaticItems()
+        self.__x = value
+        self.__elementToNodeWeights = None
+    X = property(__GetX, __SetX)
+
+    def __GetY(self):
+        self.__ReadStaticItems()
+        return self.__y
+    def __SetY(self, value):
+        self.__ReadStaticItems()
+        self.__y = value
+        self.__elementToNodeWeights = None
+    Y = property(__GetY, __SetY)
+
+    def __GetZ(self):
+        self.__ReadStaticItems()
+        return self.__z
+    def __SetZ(self, value):
+        self.__ReadStaticItems()
+        self.__z = value
+    Z = property(__GetZ, __SetZ)
+
+    def __GetCode(self):
+        self.__ReadStaticItems()
+        return self.__code
+    def __SetCode(self, value):
+        self.__ReadStaticItems()
+        self.__code = value
+    Code = property(__GetCode, __SetCode)
+
+    def __GetZUnit(self):
+        self.__ReadStaticItems()
+        return self.__zUnit
+    def __SetZUnit(self, value):
+        self.__ReadStaticItems()
+        self.__zUnit = value
+    ZUnit = property(__GetZUnit, __SetZUnit)
+
+    def __GetElementIds(self):
+        self.__ReadStaticItems()
+        return self.__elementIds
+    def __SetElementIds(self, value):
+        self.__ReadStaticItems()
+        self.__elementIds = value
+    ElementIds = property(__GetElementIds, __SetElementIds)
+
+    def __GetElementType(self):
+        self.__ReadStaticItems()
+        return self.__elementType
+    def __SetElementType(self, value):
+        self.__ReadStaticItems()
+        self.__elementType = value
+    ElementType = property(__GetElementType, __SetElementType)
+
+    def __GetElementTable(self):
+        self.__ReadStaticItems()
+        return self.__elementTable
+    def __SetElementTable(self, value):
+        self.__ReadStaticItems()
+        self.__elementTable = value
+        self.__nodesPerElmt = None
+        self.__connectivity = None
+        self.__layers = None
+        self.__elementToNodeWeights = None
+    ElementTable = property(__GetElementTable, __SetElementTable)
+
+    def __GetFrequencies(self):
+        self.__ReadStaticItems()
+        return self.__frequencies
+    def __SetFrequencies(self, value):
+        self.__ReadStaticItems()
+        self.__frequencies = value
+    Frequencies = property(__GetFrequencies, __SetFrequencies)
+
+    def __GetDirections(self):
+        self.__ReadStaticItems()
+        return self.__directions
+    def __SetDirections(self, value):
+        self.__ReadStaticItems()
+        self.__directions = value
+    Directions = property(__GetDirections, __SetDirections)
+
 
     @staticmethod
     def CreateEmptyItemDatas(dfsFile: DfsFile):
@@ -439,32 +624,103 @@ class DfsuFile(object):
         res[i] = dfsFile.ItemInfo[i].CreateEmptyItemData();
       return res;
 
+    def GetConnectivityArrays(self):
+      """
+      Return the element table as the arrays stored in the dfsu file:
+      The number of nodes in each element, and the connectivity array with
+      the (1-based) node numbers of all elements following each other.
+      The arrays are cached, do not modify them.
+      """
+      self.__ReadStaticItems()
+      if (self.__connectivity is None):
+        self.__nodesPerElmt, self.__connectivity = DfsuUtil.ElementTableToArrays(self.ElementTable)
+      return self.__nodesPerElmt, self.__connectivity
+
     def CalculateElementCenterCoordinates(self):
       """"
       For each element, calculates the element center coordinate
       as the average of all node coordinates of the nodes in 
       each element.
       """
-      xArr = np.zeros(self.NumberOfElements, dtype=np.float64);
-      yArr = np.zeros(self.NumberOfElements, dtype=np.float64);
-      zArr = np.zeros(self.NumberOfElements, dtype=np.float64);
-
-      for i in range(self.NumberOfElements):
-        nodesInElmt = self.ElementTable[i].size;
-        iNodesInElmt = 1.0/nodesInElmt;
-        x = 0;
-        y = 0;
-        z = 0;
-        for j in range(nodesInElmt):
-          nodeIndex = self.ElementTable[i][j];
-          x += self.X[nodeIndex -1] * iNodesInElmt;
-          y += self.Y[nodeIndex -1] * iNodesInElmt;
-          z += self.Z[nodeIndex -1] * iNodesInElmt;
-        xArr[i] = x;
-        yArr[i] = y;
-        zArr[i] = z;
+      nodesPerElmt, connectivity = self.GetConnectivityArrays()
+      # Index of element for each entry in the connectivity array
+      elmtIndex = np.repeat(np.arange(nodesPerElmt.size), nodesPerElmt)
+      nodeIndex = connectivity - 1
+      iNodesInElmt = 1.0/nodesPerElmt
+      xArr = np.bincount(elmtIndex, weights=self.X[nodeIndex], minlength=nodesPerElmt.size) * iNodesInElmt;
+      yArr = np.bincount(elmtIndex, weights=self.Y[nodeIndex], minlength=nodesPerElmt.size) * iNodesInElmt;
+      zArr = np.bincount(elmtIndex, weights=self.Z[nodeIndex], minlength=nodesPerElmt.size) * iNodesInElmt;
       return xArr, yArr, zArr
 
+    def GetElementToNodeWeights(self):
+      """
+      Inverse distance weights from element values to node values, see 
+      DfsuUtil.ElementToNodeWeights. The weights are calculated on first 
+      access and cached.
+      """
+      if (self.IsLayered):
+        raise Exception("Element to node weights are only available for 2D files");
+      if (self.__elementToNodeWeights is None):
+        nodesPerElmt, connectivity = self.GetConnectivityArrays()
+        self.__elementToNodeWeights = DfsuUtil.ElementToNodeWeights(self.X, self.Y, nodesPerElmt, connectivity)
+      return self.__elementToNodeWeights
+
+    def ElementToNodeValues(self, data, out = None):
+      """
+      Interpolate element values of an item-timestep to the nodes, using
+      inverse distance weighting of the values of the elements around each node.
+      Delete values are not used, and nodes with only delete values around 
+      them get the delete value.
+      :param data: Element values
+      :param out: Optional array for the node values
+      """
+      return self.GetElementToNodeWeights().Apply(data, self.DeleteValueFloat, out)
+
+    def Subset(self, elements = None, bbox = None, polygon = None):
+      """
+      Select a subset of the elements in the file. The subset can be
+      written to a new dfsu file using DfsuSubset.WriteDfsu.
+
+      :param elements: Boolean mask with an entry for each element, or array of (zero based) element indices.
+      :param bbox: Bounding box (x0, y0, x1, y1). Elements having a node inside the box are included.
+      :param polygon: Polygon vertices, array of shape (n,2). Elements having a node inside the polygon are included.
+      :returns: A DfsuSubset. When more than one selection argument is given, the intersection is returned.
+      """
+      if (self.IsSpectral):
+        raise Exception("Subset of spectral dfsu files is not supported");
+
+      nodesPerElmt, connectivity = self.GetConnectivityArrays()
+      numberOfElmts = nodesPerElmt.size
+
+      elmtMask = np.ones(numberOfElmts, dtype=bool)
+      if (elements is not None):
+        elements = np.asarray(elements)
+        if (elements.dtype == bool):
+          if (elements.size != numberOfElmts):
+            raise Exception("Element mask must have an entry for each element");
+          elmtMask &= elements
+        else:
+          indexMask = np.zeros(numberOfElmts, dtype=bool)
+          indexMask[elements] = True
+          elmtMask &= indexMask
+
+      if (bbox is not None or polygon is not None):
+        x = self.X
+        y = self.Y
+        nodeMask = np.ones(x.size, dtype=bool)
+        if (bbox is not None):
+          x0, y0, x1, y1 = bbox
+          nodeMask &= (x0 <= x) & (x <= x1) & (y0 <= y) & (y <= y1)
+        if (polygon is not None):
+          nodeMask &= DfsuUtil.PointsInPolygon(x, y, polygon)
+        # An element is included if any of its nodes are
+        elmtIndex = np.repeat(np.arange(numberOfElmts), nodesPerElmt)
+        elmtHasNode = np.zeros(numberOfElmts, dtype=bool)
+        elmtHasNode[elmtIndex[nodeMask[connectivity - 1]]] = True
+        elmtMask &= elmtHasNode
+
+      return DfsuSubset(self, np.flatnonzero(elmtMask).astype(np.int32))
+
     def GetDateTimes(self):
       """"
       Return an array of DateTimes which are the times for each timestep
@@ -482,6 +738,179 @@ class DfsuFile(object):
 
       return DfsuUtil.FindTopLayerElements(self.ElementTable)
 
+    def ReadLayer(self, itemNumber, layer, timesteps = None):
+      """
+      Read the values of an item in one layer of a file with a vertical dimension.
+
+      :param itemNumber: Item number (1-based) of an element based item
+      :param layer: "top", "bottom", a layer number or a z coordinate, see DfsuLayers.ElementsInLayer.
+                    For a z coordinate (float), the element containing z in each column is used,
+                    based on the Z coordinate item of each timestep.
+      :param timesteps: Timestep index, list of timestep indices, or None for all timesteps
+      :returns: Array with a row of column values for each timestep. For a single timestep index
+                a single row is returned. Columns not having the layer get the delete value.
+      """
+      layers = self.Layers
+      atZ = isinstance(layer, (float, np.floating))
+      if (not atZ):
+        elmts = layers.ElementsInLayer(layer)
+
+      singleTimestep, timesteps = self.__GetTimestepIndices(timesteps)
+      res = np.zeros((timesteps.size, layers.NumberOfColumns), dtype=np.float32)
+      for i, zNodes, data in self.__ReadLayeredTimeSteps(itemNumber, timesteps, atZ):
+        if (atZ):
+          elmts = layers.ElementsAtZ(layer, zNodes)
+        res[i] = layers.ExtractLayer(data, elmts, self.DeleteValueFloat)
+
+      if (singleTimestep):
+        return res[0]
+      return res
+
+    def ReadColumnStatistic(self, itemNumber, statistic, timesteps = None):
+      """
+      Read values of an item reduced over each column of a file with a vertical dimension.
+
+      :param itemNumber: Item number (1-based) of an element based item
+      :param statistic: "mean" for depth averaged values, "min" or "max" for
+                        minimum or maximum value in the column.
+      :param timesteps: Timestep index, list of timestep indices, or None for all timesteps
+      :returns: Array with a row of column values for each timestep. For a single timestep index
+                a single row is returned.
+      """
+      layers = self.Layers
+      if (statistic not in ("mean", "min", "max")):
+        raise Exception("Statistic must be one of 'mean', 'min' or 'max'");
+
+      singleTimestep, timesteps = self.__GetTimestepIndices(timesteps)
+      res = np.zeros((timesteps.size, layers.NumberOfColumns), dtype=np.float32)
+      for i, zNodes, data in self.__ReadLayeredTimeSteps(itemNumber, timesteps, statistic == "mean"):
+        if (statistic == "mean"):
+          res[i] = layers.DepthAverage(data, zNodes, self.DeleteValueFloat)
+        elif (statistic == "min"):
+          res[i] = layers.ColumnMin(data, self.DeleteValueFloat)
+        else:
+          res[i] = layers.ColumnMax(data, self.DeleteValueFloat)
+
+      if (singleTimestep):
+        return res[0]
+      return res
+
+    def ReadProfile(self, itemNumber, x, y, timesteps = None):
+      """
+      Read the vertical profile of an item in the column at the point (x,y),
+      in a file with a vertical dimension.
+
+      :param itemNumber: Item number (1-based) of an element based item
+      :param x: x coordinate of point
+      :param y: y coordinate of point
+      :param timesteps: Timestep index, list of timestep indices, or None for all timesteps
+      :returns: Element center z coordinates and values of the column elements, from bottom
+                to top, with a row for each timestep. For a single timestep index a single
+                row is returned.
+      """
+      layers = self.Layers
+      column = layers.FindColumn(x, y)
+      if (column < 0):
+        raise Exception("Point ({},{}) is not inside the mesh".format(x, y));
+      elmts = layers.ColumnElements(column)
+
+      singleTimestep, timesteps = self.__GetTimestepIndices(timesteps)
+      zRes = np.zeros((timesteps.size, elmts.size), dtype=np.float32)
+      res = np.zeros((timesteps.size, elmts.size), dtype=np.float32)
+      for i, zNodes, data in self.__ReadLayeredTimeSteps(itemNumber, timesteps, True):
+        zRes[i], res[i] = layers.Profile(data, zNodes, column)
+
+      if (singleTimestep):
+        return zRes[0], res[0]
+      return zRes, res
+
+    def __GetTimestepIndices(self, timesteps):
+      """
+      Timestep indices from a timestep index, list of indices or None for all timesteps.
+      Returns whether a single timestep index was given, and the array of indices.
+      """
+      singleTimestep = timesteps is not None and np.ndim(timesteps) == 0
+      if (timesteps is None):
+        timesteps = np.arange(self.NumberOfTimeSteps)
+      return singleTimestep, np.atleast_1d(timesteps)
+
+    def __ReadLayeredTimeSteps(self, itemNumber, timesteps, readZ):
+      """
+      Read an element based item of a layered file for each of the timestep indices,
+      yielding (index in timesteps, node z coordinates, data). Node z coordinates
+      are only read when readZ is true, otherwise None. 
+      Item data buffers are reused between timesteps.
+      """
+      itemInfo = self.ItemInfo[itemNumber-1]
+      if (itemInfo.ElementCount != self.NumberOfElements):
+        raise Exception("Item {} is not an element based item".format(itemNumber));
+
+      zItemData = self.dfsFile.CreateEmptyItemData(1) if readZ else None
+      itemData = self.dfsFile.CreateEmptyItemData(itemNumber)
+      for i in range(timesteps.size):
+        zNodes = None
+        if (readZ):
+          zNodes = self.dfsFile.ReadItemTimeStep(zItemData, int(timesteps[i])).Data
+        data = self.dfsFile.ReadItemTimeStep(itemData, int(timesteps[i])).Data
+        yield i, zNodes, data
+
+    def WriteLayerDfsu(self, filename: str, layer, itemNumbers = None):
+      """
+      Extract a single layer from a 3D dfsu file, and write it to a 2D dfsu file.
+      Data is processed one item-timestep at a time.
+
+      :param filename: Name of 2D dfsu file to create
+      :param layer: "top", "bottom", a layer number or a z coordinate, see ReadLayer
+      :param itemNumbers: Item numbers (1-based) to write. Default is all element based items
+      """
+      from mikecore.DfsuBuilder import DfsuBuilder
+
+      if (self.DfsuFileType not in (DfsuFileType.Dfsu3DSigma, DfsuFileType.Dfsu3DSigmaZ)):
+        raise Exception("Input file is not a 3D dfsu file");
+
+      layers = self.Layers
+      if (itemNumbers is None):
+        itemNumbers = [item.ItemNumber for item in self.ItemInfo if item.ElementCount == self.NumberOfElements]
+      writeItem = np.zeros(len(self.ItemInfo) + 1, dtype=bool)
+      writeItem[itemNumbers] = True
+
+      x, y, z, code, elementTable = layers.Get2DGeometry()
+
+      builder = DfsuBuilder.Create(DfsuFileType.Dfsu2D);
+      builder.SetNodes(x, y, z, code);
+      builder.SetElements(elementTable);
+      builder.SetProjection(self.Projection);
+      builder.SetTimeInfo(self.StartDateTime, self.TimeStepInSeconds);
+      if (self.ZUnit == eumUnit.eumUUnitUndefined):
+        builder.SetZUnit(eumUnit.eumUmeter);
+      else:
+        builder.SetZUnit(self.ZUnit);
+
+      for itemNumber in np.flatnonzero(writeItem):
+        itemInfo = self.ItemInfo[itemNumber-1];
+        if (itemInfo.ElementCount != self.NumberOfElements):
+          raise Exception("Item {} is not an element based item".format(itemNumber));
+        builder.AddDynamicItem(itemInfo.Name, itemInfo.Quantity);
+
+      dfsu2File = builder.CreateFile(filename);
+
+      atZ = isinstance(layer, (float, np.floating))
+      if (not atZ):
+        elmts = layers.ElementsInLayer(layer)
+
+      # For performance, use predefined itemdata objects when reading data from dfsu 3D file
+      itemDatas = DfsuFile.CreateEmptyItemDatas(self.dfsFile)
+      self.FindItem(1, 0)
+      for i in range(self.NumberOfTimeSteps):
+        for j in range(len(self.ItemInfo)):
+          itemData = self.dfsFile.ReadItemTimeStepNext(itemDatas[j]);
+          if (atZ and j == 0):
+            # First item is the Z coordinate
+            elmts = layers.ElementsAtZ(layer, itemData.Data)
+          if (writeItem[j+1]):
+            dfsu2File.WriteItemTimeStepNext(itemData.Time, layers.ExtractLayer(itemData.Data, elmts, self.DeleteValueFloat));
+      dfsu2File.Close();
+
     """"
     Utility and extension methods for <see cref="DfsuFile"/>
     """
@@ -504,48 +933,39 @@ class DfsuUtil:
       :returns: A list of element indices of top layer elements
       """
 
-      topLayerElments = [];
+      nodesPerElmt, connectivity = DfsuUtil.ElementTableToArrays(elementTable)
+      elementNodes = DfsuUtil.ElementNodeMatrix(nodesPerElmt, connectivity)
 
       # Find top layer elements by matching the number numers of the last half of elmt i 
       # with the first half of element i+1.
       # Elements always start from the bottom, and the element of one columne are following
       # each other in the element table.
-      for i in range(len(elementTable)-1):
-        elmt1 = elementTable[i];
-        elmt2 = elementTable[i+1];
+      # The last element will always be a top layer element
+      isTop = np.ones(nodesPerElmt.size, dtype=bool)
 
-        if (elmt1.size != elmt2.size):
-          # elements with different number of nodes can not be on top of each other, 
-          # so elmt2 must be another column, and elmt1 must be a top element
-          topLayerElments.append(i);
-          continue;
-        
-        if (elmt1.size%2 != 0):
-          raise Exception("In a layered mesh, each element must have an even number of elements (element index "+i+")");
+      # elements with different number of nodes can not be on top of each other, 
+      # so elmt2 must be another column, and elmt1 must be a top element
+      sameSize = nodesPerElmt[:-1] == nodesPerElmt[1:]
 
-        # Number of nodes in a 2D element
-        elmt2DSize = int(elmt1.size/2);
-
-        for j in range(elmt2DSize):
-          if (elmt2DSize > 2):
-            if (elmt1[j + elmt2DSize] != elmt2[j]):
-              # At least one node number did not match
-              # so elmt2 must be another column, and elmt1 must be a top element
-              topLayerElments.append(i);
-              break;
-          else:
-            # for 2D vertical profiles the nodes in the element on the
-            # top is in reverse order of those in the bottom.
-            if (elmt1[j + elmt2DSize] != elmt2[(elmt2DSize-1)-j]):
-              # At least one node number did not match
-              # so elmt2 must be another column, and elmt1 must be a top element
-              topLayerElments.append(i);
-              break;
+      oddSize = np.flatnonzero(sameSize & (nodesPerElmt[:-1] % 2 != 0))
+      if (oddSize.size > 0):
+        raise Exception("In a layered mesh, each element must have an even number of nodes (element index {})".format(oddSize[0]));
 
-      # The last element will always be a top layer element
-      topLayerElments.append(len(elementTable)-1);
+      for elmtSize in np.unique(nodesPerElmt[:-1][sameSize]):
+        # Number of nodes in a 2D element
+        elmt2DSize = int(elmtSize/2);
+        rows = np.flatnonzero(sameSize & (nodesPerElmt[:-1] == elmtSize))
+        upper = elementNodes[rows, elmt2DSize:elmtSize]
+        lower = elementNodes[rows + 1, :elmt2DSize]
+        if (elmt2DSize <= 2):
+          # for 2D vertical profiles the nodes in the element on the
+          # top is in reverse order of those in the bottom.
+          lower = lower[:, ::-1]
+        # If at least one node number did not match, elmt2 must be 
+        # another column, and elmt1 must be a top element
+        isTop[rows] = np.any(upper != lower, axis=1)
 
-      return (np.array(topLayerElments, dtype=np.int32));
+      return (np.flatnonzero(isTop).astype(np.int32));
 
 
     @staticmethod
@@ -628,12 +1048,8 @@ class DfsuUtil:
       Assuming that the topLayerElements comes ordered.
       """
       # the first column has top-element-index + 1 layers
-      maxLayers = topLayerElements[0]+1;
-      for i in range(1, topLayerElements.size):
-        layers = topLayerElements[i] - topLayerElements[i - 1];
-        if (layers > maxLayers):
-          maxLayers = layers;
-      return (maxLayers);
+      layers = np.diff(topLayerElements, prepend=-1)
+      return (int(layers.max()));
 
     @staticmethod
     def FindMinNumberOfLayers(topLayerElements):
@@ -644,9 +1060,552 @@ class DfsuUtil:
       ordered.
       """
       # the first column has top-element-index + 1 layers
-      minLayers = topLayerElements[0] + 1;
-      for i in range(1, topLayerElements.size):
-        layers = topLayerElements[i] - topLayerElements[i - 1];
-        if (layers < minLayers):
-          minLayers = layers;
-      return (minLayers);
+      layers = np.diff(topLayerElements, prepend=-1)
+      return (int(layers.min()));
+
+    @staticmethod
+    def ElementTableToArrays(elementTable):
+      """
+      Convert an element table to the arrays stored in a dfsu file.
+      :returns: The number of nodes in each element, and the connectivity array
+                with the (1-based) node numbers of all elements following each other.
+      """
+      numberOfElmts = len(elementTable)
+      nodesPerElmt = np.fromiter((len(elmt) for elmt in elementTable), dtype=np.int32, count=numberOfElmts)
+      if (numberOfElmts == 0):
+        return nodesPerElmt, np.zeros(0, dtype=np.int32)
+      connectivity = np.concatenate([np.asarray(elmt) for elmt in elementTable]).astype(np.int32, copy=False)
+      return nodesPerElmt, connectivity
+
+    @staticmethod
+    def ElementToNodeWeights(x, y, nodesPerElmt, connectivity):
+      """
+      Inverse distance weights from element values to node values. Each node
+      value is a weighted average of the values of the elements it is part of, 
+      with weights inversely proportional to the distance from the node to
+      the element center.
+      :returns: SparseMatrix of size (number of nodes, number of elements)
+      """
+      from mikecore.MeshInterpolation import SparseMatrix
+      x = np.asarray(x, dtype=np.float64)
+      y = np.asarray(y, dtype=np.float64)
+      numberOfElmts = nodesPerElmt.size
+      elmtIndex = np.repeat(np.arange(numberOfElmts), nodesPerElmt)
+      nodeIndex = connectivity - 1
+      xc = np.bincount(elmtIndex, weights=x[nodeIndex], minlength=numberOfElmts) / nodesPerElmt
+      yc = np.bincount(elmtIndex, weights=y[nodeIndex], minlength=numberOfElmts) / nodesPerElmt
+      dist = np.hypot(xc[elmtIndex] - x[nodeIndex], yc[elmtIndex] - y[nodeIndex])
+      weights = 1.0 / np.maximum(dist, 1e-300)
+
+      # Sort entries by node, and scale weights of each node to sum to one
+      order = np.argsort(nodeIndex, kind='stable')
+      nodeIndex = nodeIndex[order]
+      weights = weights[order]
+      weightSum = np.bincount(nodeIndex, weights=weights, minlength=x.size)
+      weights /= weightSum[nodeIndex]
+      indptr = np.concatenate(([0], np.cumsum(np.bincount(nodeIndex, minlength=x.size))))
+      return SparseMatrix(indptr, elmtIndex[order], weights, numberOfElmts)
+
+    @staticmethod
+    def ElementTableFromArrays(nodesPerElmt, connectivity):
+      """
+      Build an element table from the number of nodes in each element and the
+      connectivity array. Each row of the element table is a view on the connectivity array.
+      """
+      numberOfElmts = nodesPerElmt.size
+      elementTable = np.empty(numberOfElmts, dtype=object)
+      k1 = 0
+      for i in range(numberOfElmts):
+        k2 = k1 + nodesPerElmt[i]
+        elementTable[i] = connectivity[k1:k2]
+        k1 = k2
+      return elementTable
+
+    @staticmethod
+    def ElementNodeMatrix(nodesPerElmt, connectivity):
+      """
+      Build a matrix of node indices with a row for each element, for 
+      vectorised operations on elements.
+      :returns: Matrix of shape (number of elements, max nodes per element), containing
+                zero based node indices. Rows of elements with fewer nodes are padded with -1.
+      """
+      numberOfElmts = nodesPerElmt.size
+      maxNodes = int(nodesPerElmt.max()) if numberOfElmts > 0 else 0
+      matrix = np.full((numberOfElmts, maxNodes), -1, dtype=np.int32)
+      # Column of each entry in connectivity, i.e. the index of the node within its element
+      offsets = np.cumsum(nodesPerElmt) - nodesPerElmt
+      rows = np.repeat(np.arange(numberOfElmts), nodesPerElmt)
+      cols = np.arange(connectivity.size) - np.repeat(offsets, nodesPerElmt)
+      matrix[rows, cols] = connectivity - 1
+      return matrix
+
+    @staticmethod
+    def PointsInPolygon(x, y, polygon):
+      """
+      Check which points are inside a polygon, using the even-odd rule.
+      :param x: x coordinates of points
+      :param y: y coordinates of points
+      :param polygon: Polygon vertices, array of shape (n,2). The polygon is closed automatically
+      :returns: Boolean array, true for points inside the polygon
+      """
+      polygon = np.asarray(polygon, dtype=np.float64)
+      px = polygon[:,0]
+      py = polygon[:,1]
+      inside = np.zeros(np.shape(x), dtype=bool)
+      j = px.size - 1
+      for i in range(px.size):
+        # Edge from vertex j to vertex i, check if a ray from the point in positive x direction crosses it
+        crosses = (py[i] > y) != (py[j] > y)
+        with np.errstate(divide='ignore', invalid='ignore'):
+          xCross = (px[j] - px[i]) * (y - py[i]) / (py[j] - py[i]) + px[i]
+        inside ^= crosses & (x < xCross)
+        j = i
+      return inside
+
+
+class DfsuSubset:
+    """
+    A subset of the elements of a dfsu file, as returned by DfsuFile.Subset.
+
+    The subset geometry is ready for use with the DfsuBuilder. ElementIndices
+    and NodeIndices are the (zero based) indices of the elements and nodes
+    in the source file, and can be used to extract data on the subset.
+    """
+
+    def __init__(self, dfsuFile: DfsuFile, elementIndices):
+      self.DfsuFile = dfsuFile
+      self.ElementIndices = elementIndices
+
+      nodesPerElmt, connectivity = dfsuFile.GetConnectivityArrays()
+
+      # Connectivity entries of the included elements
+      elmtIncluded = np.zeros(nodesPerElmt.size, dtype=bool)
+      elmtIncluded[elementIndices] = True
+      entryIncluded = np.repeat(elmtIncluded, nodesPerElmt)
+      subNodesPerElmt = nodesPerElmt[elementIndices]
+      subConnectivity = connectivity[entryIncluded]
+
+      # All nodes of included elements are included
+      nodesIncluded = np.zeros(dfsuFile.NumberOfNodes, dtype=bool)
+      nodesIncluded[subConnectivity - 1] = True
+      self.NodeIndices = np.flatnonzero(nodesIncluded).astype(np.int32)
+
+      # Node with index i will get number renumber[i] in new mesh (1-based)
+      renumber = np.cumsum(nodesIncluded, dtype=np.int32)
+      subConnectivity = renumber[subConnectivity - 1]
+
+      self.NodeIds = dfsuFile.NodeIds[self.NodeIndices]
+      self.X = dfsuFile.X[self.NodeIndices]
+      self.Y = dfsuFile.Y[self.NodeIndices]
+      self.Z = dfsuFile.Z[self.NodeIndices]
+      self.Code = dfsuFile.Code[self.NodeIndices]
+      self.ElementIds = dfsuFile.ElementIds[elementIndices]
+      self.ElementType = dfsuFile.ElementType[elementIndices]
+      self.ElementTable = DfsuUtil.ElementTableFromArrays(subNodesPerElmt, subConnectivity)
+
+    @property
+    def NumberOfNodes(self):
+      return self.NodeIndices.size
+
+    @property
+    def NumberOfElements(self):
+      return self.ElementIndices.size
+
+    def ExtractItemData(self, data, nodeBased = False):
+      """
+      Extract the values on the subset from data of an item of the source file.
+      Set nodeBased for node based items, i.e. the Z coordinate item of files 
+      with a vertical dimension.
+      """
+      if (nodeBased):
+        return data[self.NodeIndices]
+      return data[self.ElementIndices]
+
+    def WriteDfsu(self, filename: str):
+      """
+      Write the subset to a new dfsu file, copying all item-timesteps
+      from the source file. Data is processed one item-timestep at a time.
+      """
+      from mikecore.DfsuBuilder import DfsuBuilder
+
+      dfsu = self.DfsuFile
+      dfsuFileType = dfsu.DfsuFileType
+      isLayered = dfsu.IsLayered
+
+      builder = DfsuBuilder.Create(dfsuFileType);
+      builder.SetNodes(self.X, self.Y, self.Z, self.Code);
+      builder.SetElements(self.ElementTable);
+      builder.SetElementIds(self.ElementIds); # retain original element id's
+      builder.SetProjection(dfsu.Projection);
+      builder.SetTimeInfo(dfsu.StartDateTime, dfsu.TimeStepInSeconds);
+      if (dfsu.ZUnit == eumUnit.eumUUnitUndefined):
+        builder.SetZUnit(eumUnit.eumUmeter);
+      else:
+        builder.SetZUnit(dfsu.ZUnit);
+      if (isLayered):
+        builder.SetNumberOfSigmaLayers(dfsu.NumberOfSigmaLayers);
+
+      # Add dynamic items, copying from source. The builder adds the Z coordinate item itself.
+      firstItem = 1 if isLayered else 0
+      for i in range(firstItem, len(dfsu.ItemInfo)):
+        itemInfo = dfsu.ItemInfo[i];
+        builder.AddDynamicItem(itemInfo.Name, itemInfo.Quantity);
+
+      dfsuOut = builder.CreateFile(filename);
+
+      # Buffers for reading, reused for all timesteps
+      itemDatas = DfsuFile.CreateEmptyItemDatas(dfsu.dfsFile)
+      dfsu.FindItem(1, 0)
+      for i in range(dfsu.NumberOfTimeSteps):
+        for j in range(len(dfsu.ItemInfo)):
+          itemData = dfsu.dfsFile.ReadItemTimeStepNext(itemDatas[j]);
+          values = self.ExtractItemData(itemData.Data, nodeBased = (isLayered and j == 0))
+          dfsuOut.WriteItemTimeStepNext(itemData.Time, values.astype(np.float32, copy=False));
+      dfsuOut.Close();
+
+
+class DfsuGridMesh:
+    """
+    A 2D quadrilateral mesh built from the water cells of a dfs2 grid with
+    an equidistant axis, for converting dfs2 files to dfsu files.
+
+    Each water cell becomes an element, and the cell corners its nodes.
+    The node Z value is the average of the surrounding water cells, and
+    nodes with land cells or the grid boundary around them get code 1.
+    ElementCells holds the (zero based) dfs2 cell index of each element,
+    and can be used to extract data on the mesh.
+    """
+
+    def __init__(self, dfs2File, bathymetry = None, landValue = None):
+      """
+      :param dfs2File: Dfs2 file to build mesh from
+      :param bathymetry: Cell values, cells equal to the landValue are land. 
+                         Default is the first static item of the dfs2 file.
+      :param landValue: Land value of bathymetry. Default is the land value of the
+                        M21_Misc custom block, or the delete value if no such custom block.
+      """
+      from mikecore.Projections import Cartography
+      self.Dfs2File = dfs2File
+
+      if (bathymetry is None):
+        dfs2File.Reset()
+        bathymetry = dfs2File.ReadStaticItemNext().Data
+      if (landValue is None):
+        customBlocks = dfs2File.FileInfo.CustomBlocks
+        if (len(customBlocks) > 0 and customBlocks[0].Name.upper() == "M21_MISC"):
+          landValue = customBlocks[0][3]
+        else:
+          landValue = dfs2File.FileInfo.DeleteValueFloat
+
+      axis = dfs2File.SpatialAxis
+      xCount = axis.XCount
+      yCount = axis.YCount
+      # Grids are indexed [l,k], with k the x index, matching the dfs2 data layout
+      bathy = np.asarray(bathymetry).reshape(-1, order='F').reshape((yCount, xCount))
+      water = bathy != landValue
+
+      # Cell values and water flags, padded with one land cell on all sides
+      waterPad = np.zeros((yCount + 2, xCount + 2), dtype=bool)
+      waterPad[1:-1, 1:-1] = water
+      bathyPad = np.zeros((yCount + 2, xCount + 2), dtype=np.float64)
+      bathyPad[1:-1, 1:-1] = np.where(water, bathy, 0)
+
+      # Node [l,k] is the lower left corner of cell [l,k], and has the
+      # cells [l-1:l+1, k-1:k+1] around it
+      zCount = (waterPad[:-1, :-1].astype(np.int32) + waterPad[:-1, 1:] + waterPad[1:, :-1] + waterPad[1:, 1:])
+      zSum = bathyPad[:-1, :-1] + bathyPad[:-1, 1:] + bathyPad[1:, :-1] + bathyPad[1:, 1:]
+      nodeIncluded = zCount > 0
+
+      # Node [l,k] will get number nodeNumber[l,k] in the mesh (1-based)
+      nodeNumber = np.cumsum(nodeIncluded.ravel(), dtype=np.int32).reshape(nodeIncluded.shape)
+      l, k = np.nonzero(nodeIncluded)
+
+      proj = dfs2File.FileInfo.Projection
+      cart = Cartography(proj.WKTString, proj.Longitude, proj.Latitude, proj.Orientation)
+      self.X, self.Y = cart.Xy2ProjArray((k - 0.5) * axis.Dx + axis.X0, (l - 0.5) * axis.Dy + axis.Y0)
+      self.Z = (zSum[nodeIncluded] / zCount[nodeIncluded]).astype(np.float32)
+      self.Code = np.where(zCount[nodeIncluded] == 4, 0, 1).astype(np.int32)
+
+      # Elements, in the order of the dfs2 cells, with nodes counter-clockwise
+      l, k = np.nonzero(water)
+      self.ElementCells = (k + l * xCount).astype(np.int64)
+      connectivity = np.stack((nodeNumber[l, k], nodeNumber[l, k+1], nodeNumber[l+1, k+1], nodeNumber[l+1, k]), axis=1)
+      self.ElementTable = DfsuUtil.ElementTableFromArrays(np.full(l.size, 4, dtype=np.int32), connectivity.ravel())
+
+    @property
+    def NumberOfNodes(self):
+      return self.X.size
+
+    @property
+    def NumberOfElements(self):
+      return self.ElementCells.size
+
+    def ExtractItemData(self, data):
+      """
+      Extract the values of the mesh elements from dfs2 data of an item.
+      """
+      return data.reshape(-1, order='F')[self.ElementCells]
+
+    def WriteDfsu(self, filename: str):
+      """
+      Write the mesh to a new Dfsu2D file, copying all item-timesteps
+      from the dfs2 file. Data is processed one item-timestep at a time.
+      """
+      from mikecore.DfsuBuilder import DfsuBuilder
+
+      dfs2 = self.Dfs2File
+      timeAxis = dfs2.FileInfo.TimeAxis
+
+      builder = DfsuBuilder.Create(DfsuFileType.Dfsu2D);
+      builder.SetNodes(self.X, self.Y, self.Z, self.Code);
+      builder.SetElements(self.ElementTable);
+      builder.SetProjection(dfs2.FileInfo.Projection);
+      builder.SetTimeInfo(timeAxis.StartDateTime, timeAxis.TimeStepInSeconds());
+      builder.SetZUnit(eumUnit.eumUmeter);
+
+      for itemInfo in dfs2.ItemInfo:
+        builder.AddDynamicItem(itemInfo.Name, itemInfo.Quantity);
+
+      dfsu = builder.CreateFile(filename);
+
+      # Buffers for reading, reused for all timesteps
+      itemDatas = DfsuFile.CreateEmptyItemDatas(dfs2)
+      dfs2.FindItem(1, 0)
+      for i in range(timeAxis.NumberOfTimeSteps):
+        for j in range(len(dfs2.ItemInfo)):
+          itemData = dfs2.ReadItemTimeStepNext(itemDatas[j]);
+          values = self.ExtractItemData(itemData.Data)
+          dfsu.WriteItemTimeStepNext(itemData.Time, values.astype(np.float32, copy=False));
+      dfsu.Close();
+
+
+class DfsuLayers:
+    """
+    Column and layer index maps of a dfsu file with a vertical dimension,
+    as returned by DfsuFile.Layers.
+
+    The elements of a column follow each other in the element table, 
+    starting from the bottom. Layers are numbered from 1 (bottom layer)
+    to NumberOfLayers (top layer). In sigma-z files, columns with fewer
+    layers than NumberOfLayers do not have the bottom-most layer numbers.
+    """
+
+    def __init__(self, dfsuFile: DfsuFile):
+      self.DfsuFile = dfsuFile
+
+      self.TopLayerElements = DfsuUtil.FindTopLayerElements(dfsuFile.ElementTable)
+      self.NumberOfColumns = self.TopLayerElements.size
+      # Number of layers in each column
+      self.LayersInColumn = np.diff(self.TopLayerElements, prepend=-1).astype(np.int32)
+      self.NumberOfLayers = int(self.LayersInColumn.max())
+      self.BottomLayerElements = (self.TopLayerElements - self.LayersInColumn + 1).astype(np.int32)
+      # Column index and layer number of each element
+      self.ColumnIndex = np.repeat(np.arange(self.NumberOfColumns, dtype=np.int32), self.LayersInColumn)
+      numberOfElmts = self.ColumnIndex.size
+      self.LayerNumber = (self.NumberOfLayers - (self.TopLayerElements[self.ColumnIndex] - np.arange(numberOfElmts))).astype(np.int32)
+
+      self.__elementsInLayer = {}
+      self.__faceWeights = None
+      self.__geometry2D = None
+
+    def ElementsInLayer(self, layer):
+      """
+      Element index (zero based) in each column of the elements in the layer.
+      Columns not having the layer get -1.
+      :param layer: "top", "bottom" or a layer number. Layer number 1 is the bottom layer, 
+                    negative layer numbers count from the top, -1 being the top layer. 
+      """
+      if (isinstance(layer, str)):
+        if (layer == "top"):
+          return self.TopLayerElements
+        if (layer == "bottom"):
+          return self.BottomLayerElements
+        raise Exception("Layer must be 'top', 'bottom' or a layer number");
+
+      layer = int(layer)
+      elmts = self.__elementsInLayer.get(layer)
+      if (elmts is None):
+        # Offset from top layer element. Offset is between 0 (top layer) and
+        # NumberOfLayers-1 (bottom layer)
+        if (layer > 0 and layer <= self.NumberOfLayers):
+          topLayerOffset = self.NumberOfLayers - layer;
+        elif (layer < 0 and -layer <= self.NumberOfLayers):
+          topLayerOffset = -layer - 1;
+        else:
+          raise Exception("Layer number is out of range");
+        elmts = self.TopLayerElements - topLayerOffset
+        elmts[topLayerOffset >= self.LayersInColumn] = -1
+        self.__elementsInLayer[layer] = elmts
+      return elmts
+
+    def ElementsAtZ(self, z, zNodes):
+      """
+      Element index (zero based) in each column of the element containing
+      the z coordinate. Columns not containing z get -1.
+      :param z: z coordinate
+      :param zNodes: Node z coordinates, i.e. the values of the Z coordinate item of a timestep
+      """
+      zBottom, zTop = self.ElementFaceZ(zNodes)
+      elmts = np.flatnonzero((zBottom <= z) & (z <= zTop)).astype(np.int32)
+      res = np.full(self.NumberOfColumns, -1, dtype=np.int32)
+      # When z is on a face, the upper element is used
+      np.maximum.at(res, self.ColumnIndex[elmts], elmts)
+      return res
+
+    def ElementFaceZ(self, zNodes):
+      """
+      The z coordinate of the bottom and top face of each element, as the
+      average z coordinate of the first and the second half of the element nodes.
+      :param zNodes: Node z coordinates, i.e. the values of the Z coordinate item of a timestep
+      """
+      if (self.__faceWeights is None):
+        nodesPerElmt, connectivity = self.DfsuFile.GetConnectivityArrays()
+        elementNodes = DfsuUtil.ElementNodeMatrix(nodesPerElmt, connectivity)
+        half = (nodesPerElmt // 2)[:,np.newaxis]
+        cols = np.arange(elementNodes.shape[1])
+        bottomWeights = (cols < half) / half
+        topWeights = ((cols >= half) & (cols < 2*half)) / half
+        self.__faceWeights = (np.maximum(elementNodes, 0), bottomWeights, topWeights)
+      elementNodes, bottomWeights, topWeights = self.__faceWeights
+      zElmtNodes = zNodes[elementNodes]
+      return np.sum(zElmtNodes * bottomWeights, axis=1), np.sum(zElmtNodes * topWeights, axis=1)
+
+    @staticmethod
+    def ExtractLayer(data, elmts, deleteValue):
+      """
+      Extract the layer values from element data, using the element 
+      indices from ElementsInLayer or ElementsAtZ.
+      """
+      return np.where(elmts >= 0, data[elmts], deleteValue).astype(data.dtype, copy=False)
+
+    def ElementThickness(self, zNodes):
+      """
+      Thickness of each element, the difference between its top and bottom face z coordinates.
+      :param zNodes: Node z coordinates, i.e. the values of the Z coordinate item of a timestep
+      """
+      zBottom, zTop = self.ElementFaceZ(zNodes)
+      return zTop - zBottom
+
+    def DepthAverage(self, data, zNodes, deleteValue = None):
+      """
+      Depth averaged value of each column, weighting element values by element thickness.
+      :param data: Element data of a timestep
+      :param zNodes: Node z coordinates, i.e. the values of the Z coordinate item of the same timestep
+      :param deleteValue: Elements with this value are not included. Columns without any values get the delete value
+      """
+      weights = self.ElementThickness(zNodes)
+      if (deleteValue is not None):
+        weights[data == deleteValue] = 0
+      # Elements of a column follow each other, reduce over each segment
+      sumWeights = np.add.reduceat(weights, self.BottomLayerElements)
+      sumValues = np.add.reduceat(weights * data, self.BottomLayerElements)
+      with np.errstate(divide='ignore', invalid='ignore'):
+        res = sumValues / sumWeights
+      if (deleteValue is not None):
+        res[sumWeights == 0] = deleteValue
+      return res
+
+    def ColumnMin(self, data, deleteValue = None):
+      """
+      Minimum value in each column.
+      :param data: Element data of a timestep
+      :param deleteValue: Elements with this value are not included. Columns without any values get the delete value
+      """
+      return self.__ColumnReduce(np.minimum, data, np.inf, deleteValue)
+
+    def ColumnMax(self, data, deleteValue = None):
+      """
+      Maximum value in each column.
+      :param data: Element data of a timestep
+      :param deleteValue: Elements with this value are not included. Columns without any values get the delete value
+      """
+      return self.__ColumnReduce(np.maximum, data, -np.inf, deleteValue)
+
+    def __ColumnReduce(self, ufunc, data, identity, deleteValue):
+      if (deleteValue is not None):
+        isDelete = data == deleteValue
+        data = np.where(isDelete, identity, data)
+      res = ufunc.reduceat(data, self.BottomLayerElements)
+      if (deleteValue is not None):
+        res[np.logical_and.reduceat(isDelete, self.BottomLayerElements)] = deleteValue
+      return res
+
+    def ColumnElements(self, column):
+      """
+      Element indices (zero based) of the elements in the column, from bottom to top.
+      """
+      return np.arange(self.BottomLayerElements[column], self.TopLayerElements[column] + 1)
+
+    def Profile(self, data, zNodes, column):
+      """
+      Vertical profile of a column.
+      :param data: Element data of a timestep
+      :param zNodes: Node z coordinates, i.e. the values of the Z coordinate item of the same timestep
+      :returns: Element center z coordinate and values of the column elements, from bottom to top
+      """
+      elmts = self.ColumnElements(column)
+      zBottom, zTop = self.ElementFaceZ(zNodes)
+      return 0.5 * (zBottom[elmts] + zTop[elmts]), data[elmts]
+
+    def FindColumn(self, x, y):
+      """
+      Find the column (zero based index) containing the point (x,y).
+      For 3D files the column with the 2D element containing the point 
+      is returned, -1 if no element contains the point. For vertical profile 
+      and vertical column files the column closest to the point is returned.
+      """
+      x2, y2, z2, code2, elementTable2 = self.Get2DGeometry()
+      nodesPerElmt, connectivity = DfsuUtil.ElementTableToArrays(elementTable2)
+      elementNodes = DfsuUtil.ElementNodeMatrix(nodesPerElmt, connectivity)
+      isNode = elementNodes >= 0
+      xe = x2[elementNodes]
+      ye = y2[elementNodes]
+
+      if (nodesPerElmt.min() < 3):
+        # Elements have no area, use closest element center
+        xc = np.sum(xe * isNode, axis=1) / nodesPerElmt
+        yc = np.sum(ye * isNode, axis=1) / nodesPerElmt
+        return int(np.argmin((xc - x)**2 + (yc - y)**2))
+
+      # Point is inside if it is on the same side of all element edges
+      cols = np.arange(elementNodes.shape[1])
+      nextNode = (cols + 1) % nodesPerElmt[:,np.newaxis]
+      xn = np.take_along_axis(xe, nextNode, axis=1)
+      yn = np.take_along_axis(ye, nextNode, axis=1)
+      cross = (xn - xe) * (y - ye) - (yn - ye) * (x - xe)
+      inside = np.all((cross >= 0) | ~isNode, axis=1) | np.all((cross <= 0) | ~isNode, axis=1)
+      columns = np.flatnonzero(inside)
+      if (columns.size == 0):
+        return -1
+      return int(columns[0])
+
+    def Get2DGeometry(self):
+      """
+      Geometry of the 2D mesh of a layered file, with an element for each column. 
+      Nodes with equal x,y coordinates are merged, and the 2D node z coordinate 
+      is taken from the bottom node.
+      :returns: x, y, z, code and element table of 2D mesh
+      """
+      if (self.__geometry2D is None):
+        dfsuFile = self.DfsuFile
+        x = dfsuFile.X
+        y = dfsuFile.Y
+
+        # Create 2D nodes, by skipping nodes with equal x,y coordinates
+        # to the previous node
+        isNewNode = np.ones(x.size, dtype=bool)
+        isNewNode[1:] = (x[1:] != x[:-1]) | (y[1:] != y[:-1])
+        nodes2D = np.flatnonzero(isNewNode)
+        # Renumbering array, from 3D node index to 2D node number
+        renumber = np.cumsum(isNewNode, dtype=np.int32)
+
+        # 2D element nodes are the first half of the top element nodes
+        nodesPerElmt, connectivity = dfsuFile.GetConnectivityArrays()
+        elementNodes = DfsuUtil.ElementNodeMatrix(nodesPerElmt, connectivity)[self.TopLayerElements]
+        nodesPerElmt2D = nodesPerElmt[self.TopLayerElements] // 2
+        isBottomFace = np.arange(elementNodes.shape[1]) < nodesPerElmt2D[:,np.newaxis]
+        connectivity2D = renumber[elementNodes[isBottomFace]]
+
+        self.__geometry2D = (x[nodes2D], y[nodes2D], dfsuFile.Z[nodes2D], dfsuFile.Code[nodes2D],
+                             DfsuUtil.ElementTableFromArrays(nodesPerElmt2D, connectivity2D))
+      return self.__geometry2D
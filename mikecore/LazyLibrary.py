@@ -0,0 +1,28 @@
+class LazyLibrary:
+    '''
+    Stand-in for a native library that has not been loaded yet.
+
+    The Wrapper of DfsDLL, eumDLL and MzCartDLL is a LazyLibrary until the
+    library is used. The first function lookup on it calls the Init method
+    of the owning class, which loads and configures the native library and
+    replaces the LazyLibrary by the ctypes library. Later calls go directly
+    to the ctypes library.
+
+    :param init: Function loading the library and returning the ctypes library.
+    '''
+
+    def __init__(self, init):
+        self._init = init
+
+    def __getattr__(self, name):
+        return getattr(self._init(), name)
+
+    def __repr__(self):
+        return "<LazyLibrary (not loaded)>"
+
+    @staticmethod
+    def IsLoaded(wrapper):
+        '''
+        True if wrapper is a loaded library, i.e. not None and not a LazyLibrary.
+        '''
+        return wrapper is not None and not isinstance(wrapper, LazyLibrary)
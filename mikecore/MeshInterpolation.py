@@ -0,0 +1,337 @@
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+from mikecore.DfsuFile import DfsuUtil
+
+
+class SparseMatrix:
+    '''
+    Sparse matrix in compressed sparse row format, for interpolation weights.
+
+    Row i has the column indices Indices[IndPtr[i]:IndPtr[i+1]] and the
+    corresponding values in Values. The row of each entry is stored as
+    well, for vectorised products.
+    '''
+
+    def __init__(self, indptr, indices, values, numberOfColumns):
+        self.IndPtr = np.asarray(indptr, dtype=np.int64)
+        self.Indices = np.asarray(indices, dtype=np.int64)
+        self.Values = np.asarray(values, dtype=np.float64)
+        self.NumberOfColumns = numberOfColumns
+        self.Rows = np.repeat(np.arange(self.NumberOfRows), np.diff(self.IndPtr))
+
+    @property
+    def NumberOfRows(self):
+        return self.IndPtr.size - 1
+
+    @staticmethod
+    def FromDense(indices, values, numberOfColumns):
+        '''
+        Create from matrices of size (number of rows, entries per row). Entries
+        with a zero value are not stored.
+        '''
+        nonZero = values != 0
+        indptr = np.concatenate(([0], np.cumsum(nonZero.sum(axis=1))))
+        return SparseMatrix(indptr, indices[nonZero], values[nonZero], numberOfColumns)
+
+    def Multiply(self, other):
+        '''
+        Matrix product of this and another SparseMatrix, e.g. to combine
+        interpolation steps into one matrix.
+        '''
+        count = np.diff(other.IndPtr)[self.Indices]
+        total = int(count.sum())
+        # For each entry of this, all entries of the corresponding row of other
+        ptr = np.repeat(other.IndPtr[self.Indices], count) + np.arange(total) - np.repeat(np.cumsum(count) - count, count)
+        rows = np.repeat(self.Rows, count)
+        cols = other.Indices[ptr]
+        values = np.repeat(self.Values, count) * other.Values[ptr]
+        # Sum entries with the same row and column
+        keys, inverse = np.unique(rows * other.NumberOfColumns + cols, return_inverse=True)
+        values = np.bincount(inverse.ravel(), weights=values, minlength=keys.size)
+        rows = keys // other.NumberOfColumns
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=self.NumberOfRows))))
+        return SparseMatrix(indptr, keys % other.NumberOfColumns, values, other.NumberOfColumns)
+
+    def Dot(self, data):
+        '''
+        Matrix-vector product.
+        '''
+        return np.bincount(self.Rows, weights=self.Values * data[self.Indices], minlength=self.NumberOfRows)
+
+    def Apply(self, data, deleteValue = None, out = None):
+        '''
+        Interpolate data, i.e. the matrix-vector product, with each row
+        of weights scaled to sum to one.
+
+        Data values equal to the delete value are not used, and the
+        weights of the remaining values are scaled to sum to one. Rows
+        without any values get the delete value.
+
+        :param data: Values, of size NumberOfColumns
+        :param deleteValue: Delete value of the data, None if data has no delete values
+        :param out: Optional array of size NumberOfRows for the result
+        '''
+        values = data[self.Indices]
+        weights = self.Values
+        if (deleteValue is not None):
+            weights = np.where(values != deleteValue, weights, 0)
+            values = np.where(values != deleteValue, values, 0)
+        weightSum = np.bincount(self.Rows, weights=weights, minlength=self.NumberOfRows)
+        valueSum = np.bincount(self.Rows, weights=weights * values, minlength=self.NumberOfRows)
+        hasValue = weightSum != 0
+        res = np.full(self.NumberOfRows, np.nan if deleteValue is None else deleteValue)
+        res[hasValue] = valueSum[hasValue] / weightSum[hasValue]
+        if (out is None):
+            return res.astype(data.dtype)
+        out[:] = res
+        return out
+
+
+class MeshElementSearcher:
+    '''
+    Spatial index of the elements of a 2D mesh, for finding the element
+    containing a point.
+
+    Element bounding boxes are registered in a uniform grid of buckets,
+    with a bucket size of about twice the typical element size. Elements are
+    assumed to be convex, with nodes in counter-clockwise or clockwise order.
+    '''
+
+    def __init__(self, x, y, elementNodes):
+        '''
+        :param x: Node x coordinates
+        :param y: Node y coordinates
+        :param elementNodes: Element node matrix, see DfsuUtil.ElementNodeMatrix
+        '''
+        self.X = np.asarray(x, dtype=np.float64)
+        self.Y = np.asarray(y, dtype=np.float64)
+        # Pad with the first node, giving degenerate closing edges for elements with fewer nodes
+        self.ElementNodes = np.where(elementNodes >= 0, elementNodes, elementNodes[:, :1])
+
+        ex = self.X[self.ElementNodes]
+        ey = self.Y[self.ElementNodes]
+        xMin = ex.min(axis=1)
+        xMax = ex.max(axis=1)
+        yMin = ey.min(axis=1)
+        yMax = ey.max(axis=1)
+
+        numberOfElmts = self.ElementNodes.shape[0]
+        self.X0 = xMin.min()
+        self.Y0 = yMin.min()
+        elmtSize = np.median(np.maximum(xMax - xMin, yMax - yMin))
+        width = max(xMax.max() - self.X0, yMax.max() - self.Y0)
+        # Bucket size, limiting the number of buckets to around 4 times the number of elements
+        self.BucketSize = max(2 * elmtSize, width / (2 * np.sqrt(numberOfElmts)), 1e-12)
+        self.XCount = int((xMax.max() - self.X0) / self.BucketSize) + 1
+        self.YCount = int((yMax.max() - self.Y0) / self.BucketSize) + 1
+
+        # Register each element in all buckets overlapping its bounding box
+        i0, j0 = self.__BucketIndex(xMin, yMin)
+        i1, j1 = self.__BucketIndex(xMax, yMax)
+        ni = i1 - i0 + 1
+        count = ni * (j1 - j0 + 1)
+        elmts = np.repeat(np.arange(numberOfElmts), count)
+        local = np.arange(elmts.size) - np.repeat(np.cumsum(count) - count, count)
+        buckets = (j0[elmts] + local // ni[elmts]) * self.XCount + i0[elmts] + local % ni[elmts]
+
+        order = np.argsort(buckets, kind='stable')
+        self.BucketElements = elmts[order].astype(np.int32)
+        self.BucketStart = np.concatenate(([0], np.cumsum(np.bincount(buckets, minlength=self.XCount * self.YCount))))
+
+    def __BucketIndex(self, x, y):
+        i = np.clip(((x - self.X0) / self.BucketSize).astype(np.int64), 0, self.XCount - 1)
+        j = np.clip(((y - self.Y0) / self.BucketSize).astype(np.int64), 0, self.YCount - 1)
+        return i, j
+
+    def FindElements(self, x, y):
+        '''
+        Find the (zero based) index of the element containing each point,
+        -1 for points outside the mesh.
+        '''
+        x = np.asarray(x, dtype=np.float64).ravel()
+        y = np.asarray(y, dtype=np.float64).ravel()
+        res = np.full(x.size, -1, dtype=np.int32)
+
+        i, j = self.__BucketIndex(x, y)
+        inGrid = ((x >= self.X0) & (x <= self.X0 + self.XCount * self.BucketSize) &
+                  (y >= self.Y0) & (y <= self.Y0 + self.YCount * self.BucketSize))
+        bucket = j * self.XCount + i
+        start = self.BucketStart[bucket]
+        count = np.where(inGrid, self.BucketStart[bucket + 1] - start, 0)
+
+        # Check the r'th candidate element of all points not found yet
+        for r in range(int(count.max()) if count.size > 0 else 0):
+            points = np.flatnonzero((res < 0) & (count > r))
+            if (points.size == 0):
+                break
+            elmts = self.BucketElements[start[points] + r]
+            inside = self.IsInside(x[points], y[points], elmts)
+            res[points[inside]] = elmts[inside]
+        return res
+
+    def IsInside(self, x, y, elmts):
+        '''
+        Check if each point (x,y) is inside the corresponding element.
+        '''
+        nodes = self.ElementNodes[elmts]
+        ex = self.X[nodes]
+        ey = self.Y[nodes]
+        ex2 = np.roll(ex, -1, axis=1)
+        ey2 = np.roll(ey, -1, axis=1)
+        # Cross product of edge and node-to-point vectors, same sign for all edges when inside
+        cross = (ex2 - ex) * (y[:, np.newaxis] - ey) - (ey2 - ey) * (x[:, np.newaxis] - ex)
+        # Tolerance relative to the element size, points on an edge are inside
+        tol = 1e-10 * ((ex2 - ex)**2 + (ey2 - ey)**2).max(axis=1)
+        return np.all(cross >= -tol[:, np.newaxis], axis=1) | np.all(cross <= tol[:, np.newaxis], axis=1)
+
+
+class MeshInterpolator:
+    '''
+    Interpolation of values from a source mesh to the element centers
+    or nodes of a target mesh. Meshes are DfsuFile, MeshFile or other
+    2D geometries with X, Y and ElementTable.
+
+    With method "nearest", the target point gets the value of the source
+    element containing it, and Apply takes element values, i.e. dfsu item data.
+    With method "barycentric", the target point is interpolated linearly
+    from the nodes of the source element containing it, with quadrilaterals
+    split into two triangles, and Apply takes node values. To apply barycentric
+    interpolation to element values, set elementValues, and the element values
+    are interpolated to the nodes first, see DfsuUtil.ElementToNodeWeights.
+    Target points outside the source mesh get the delete value.
+
+    The weights are calculated once, and shared by all interpolators
+    of the same geometries, see Create.
+    '''
+
+    # Weights of recently used geometry pairs, keyed by geometry hashes and method
+    __cache = OrderedDict()
+    __cacheLock = threading.Lock()
+    CacheSize = 8
+
+    def __init__(self, weights, method, targetNodes, elementValues):
+        self.Weights = weights
+        self.Method = method
+        self.TargetNodes = targetNodes
+        self.ElementValues = elementValues
+
+    @staticmethod
+    def Create(source, target, method = "nearest", targetNodes = False, elementValues = False):
+        '''
+        Create an interpolator between two mesh geometries.
+
+        :param source: Source geometry
+        :param target: Target geometry
+        :param method: "nearest" or "barycentric"
+        :param targetNodes: Interpolate to the target nodes, instead of the target element centers.
+        :param elementValues: For method "barycentric", source values are element values.
+        '''
+        if (method not in ("nearest", "barycentric")):
+            raise Exception("Unknown interpolation method '{}'. Must be 'nearest' or 'barycentric'".format(method))
+        elementValues = elementValues or method == "nearest"
+        key = (MeshInterpolator.GeometryHash(source), MeshInterpolator.GeometryHash(target), method, targetNodes, elementValues)
+        with MeshInterpolator.__cacheLock:
+            weights = MeshInterpolator.__cache.get(key)
+            if (weights is not None):
+                MeshInterpolator.__cache.move_to_end(key)
+        if (weights is None):
+            weights = MeshInterpolator.CalculateWeights(source, target, method, targetNodes)
+            if (method == "barycentric" and elementValues):
+                nodesPerElmt, connectivity = MeshInterpolator.__ConnectivityArrays(source)
+                weights = weights.Multiply(DfsuUtil.ElementToNodeWeights(source.X, source.Y, nodesPerElmt, connectivity))
+            with MeshInterpolator.__cacheLock:
+                MeshInterpolator.__cache[key] = weights
+                while (len(MeshInterpolator.__cache) > MeshInterpolator.CacheSize):
+                    MeshInterpolator.__cache.popitem(last=False)
+        return MeshInterpolator(weights, method, targetNodes, elementValues)
+
+    @staticmethod
+    def ClearCache():
+        with MeshInterpolator.__cacheLock:
+            MeshInterpolator.__cache.clear()
+
+    @staticmethod
+    def GeometryHash(geometry):
+        '''
+        Hash of the node coordinates and element table of a geometry.
+        '''
+        nodesPerElmt, connectivity = MeshInterpolator.__ConnectivityArrays(geometry)
+        h = hashlib.sha1()
+        for array in (np.asarray(geometry.X, dtype=np.float64), np.asarray(geometry.Y, dtype=np.float64), nodesPerElmt, connectivity):
+            h.update(np.ascontiguousarray(array).tobytes())
+        return h.hexdigest()
+
+    @staticmethod
+    def __ConnectivityArrays(geometry):
+        if (hasattr(geometry, "GetConnectivityArrays")):
+            return geometry.GetConnectivityArrays()
+        return DfsuUtil.ElementTableToArrays(geometry.ElementTable)
+
+    @staticmethod
+    def __ElementNodes(geometry):
+        if (getattr(geometry, "IsLayered", False) or getattr(geometry, "IsSpectral", False)):
+            raise Exception("Interpolation only supports 2D meshes")
+        nodesPerElmt, connectivity = MeshInterpolator.__ConnectivityArrays(geometry)
+        return DfsuUtil.ElementNodeMatrix(nodesPerElmt, connectivity)
+
+    @staticmethod
+    def CalculateWeights(source, target, method, targetNodes = False):
+        '''
+        Calculate the weight matrix from source values to target points.
+        See MeshInterpolator for the arguments.
+        '''
+        sourceNodes = MeshInterpolator.__ElementNodes(source)
+        x = np.asarray(source.X, dtype=np.float64)
+        y = np.asarray(source.Y, dtype=np.float64)
+
+        if (targetNodes):
+            px = np.asarray(target.X, dtype=np.float64)
+            py = np.asarray(target.Y, dtype=np.float64)
+        else:
+            targetElmtNodes = MeshInterpolator.__ElementNodes(target)
+            valid = targetElmtNodes >= 0
+            count = valid.sum(axis=1)
+            px = np.where(valid, np.asarray(target.X, dtype=np.float64)[targetElmtNodes], 0).sum(axis=1) / count
+            py = np.where(valid, np.asarray(target.Y, dtype=np.float64)[targetElmtNodes], 0).sum(axis=1) / count
+
+        searcher = MeshElementSearcher(x, y, sourceNodes)
+        elmts = searcher.FindElements(px, py)
+        found = elmts >= 0
+
+        if (method == "nearest"):
+            indices = np.where(found, elmts, 0).reshape(-1, 1)
+            return SparseMatrix.FromDense(indices, found.astype(np.float64).reshape(-1, 1), sourceNodes.shape[0])
+
+        # Barycentric coordinates in triangle (n0,n1,n2), or (n0,n2,n3) for points
+        # in the second half of a quadrilateral
+        nodes = searcher.ElementNodes[np.where(found, elmts, 0)]
+        isQuad = sourceNodes[np.where(found, elmts, 0), -1] >= 0 if sourceNodes.shape[1] > 3 else np.zeros(px.size, dtype=bool)
+        triangle = nodes[:, :3].copy()
+        bary = MeshInterpolator.__Barycentric(x, y, triangle, px, py)
+        secondHalf = isQuad & (bary.min(axis=1) < -1e-10)
+        if (np.any(secondHalf)):
+            triangle[secondHalf] = nodes[secondHalf][:, [0, 2, 3]]
+            bary[secondHalf] = MeshInterpolator.__Barycentric(x, y, triangle[secondHalf], px[secondHalf], py[secondHalf])
+        bary = np.clip(bary, 0, None)
+        bary /= bary.sum(axis=1, keepdims=True)
+        bary[~found] = 0
+        return SparseMatrix.FromDense(triangle, bary, x.size)
+
+    @staticmethod
+    def __Barycentric(x, y, triangle, px, py):
+        x0 = x[triangle[:, 0]]; y0 = y[triangle[:, 0]]
+        x1 = x[triangle[:, 1]]; y1 = y[triangle[:, 1]]
+        x2 = x[triangle[:, 2]]; y2 = y[triangle[:, 2]]
+        det = (y1 - y2) * (x0 - x2) + (x2 - x1) * (y0 - y2)
+        l0 = ((y1 - y2) * (px - x2) + (x2 - x1) * (py - y2)) / det
+        l1 = ((y2 - y0) * (px - x2) + (x0 - x2) * (py - y2)) / det
+        return np.stack((l0, l1, 1 - l0 - l1), axis=1)
+
+    def Apply(self, data, deleteValue = None, out = None):
+        '''
+        Interpolate source values of one item-timestep to the target points.
+        Source values equal to the delete value are not used.
+        '''
+        return self.Weights.Apply(data, deleteValue, out)
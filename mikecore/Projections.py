@@ -1,8 +1,10 @@
 import os
 import ctypes
+import threading
 from typing import Tuple
 import numpy as np
 from enum import Enum, IntEnum
+from mikecore.LazyLibrary import LazyLibrary
 
 
 class ProjectionException(Exception):
@@ -21,7 +23,9 @@ class ProjectionException(Exception):
 class MzCartDLL():
 
     # Static variables
-    Wrapper = None
+    Wrapper = LazyLibrary(lambda: MzCartDLL.Init())
+    libfilepath = None
+    _initLock = threading.Lock()
 
     _cartCreateCount = 0;
     _cartDestroyCount = 0;
@@ -33,66 +37,87 @@ class MzCartDLL():
     @staticmethod
     def Init(libfilepath: str = None):
 
-        # ufs lib should be loaded only once
-        if MzCartDLL.Wrapper is None:
-
-            MzCartDLL.libfilepath = None
-            if not libfilepath is None:
-                MzCartDLL.libfilepath = libfilepath
-
-            # TODO: On linux, this looks different!
-            if os.name == "nt":
-                MzCartDLL.Wrapper = ctypes.CDLL(os.path.join(MzCartDLL.libfilepath, "MzCart.dll"))
-            else:
-                MzCartDLL.Wrapper = ctypes.CDLL(os.path.join(MzCartDLL.libfilepath, "libMzCart.so"))
-                libfilepathe = MzCartDLL.libfilepath+"/";
-                libfilepatheP = ctypes.c_char_p(libfilepathe.encode("ascii"))
-                MzCartDLL.Wrapper.CARTSETUPLINUX(libfilepatheP, libfilepatheP);
-
-
-            MzCartDLL.Wrapper.C_MZC_GETPROJECTION.restype = ctypes.c_void_p;
-            MzCartDLL.Wrapper.C_MZC_GETPROJECTIONSTRING.restype = None;
-            MzCartDLL.Wrapper.S_GETGOOGLEMAPPROJECTIONSTRING.restype = None;
-
-            MzCartDLL.Wrapper.C_MZC_CREATE.restype = None;
-            MzCartDLL.Wrapper.C_MZC_DESTROY.restype = None;
-            MzCartDLL.Wrapper.C_MZC_GETPROJNORTH.restype = ctypes.c_double;
-            MzCartDLL.Wrapper.C_MZC_GETTRUENORTH.restype = ctypes.c_double;
-            MzCartDLL.Wrapper.C_MZC_GEO2PROJ.restype = None;
-            MzCartDLL.Wrapper.C_MZC_PROJ2GEO.restype = None;
-            MzCartDLL.Wrapper.C_MZC_GEO2XY.restype = None;
-            MzCartDLL.Wrapper.C_MZC_XY2GEO.restype = None;
-            MzCartDLL.Wrapper.C_MZC_PROJ2XY.restype = None;
-            MzCartDLL.Wrapper.C_MZC_XY2PROJ.restype = None;
-
-            MzCartDLL.Wrapper.C_MZMP_CREATE.restype = None;
-            MzCartDLL.Wrapper.C_MZMP_DESTROY.restype = None;
-            MzCartDLL.Wrapper.C_MZMP_GETNAME.restype = None;
-            MzCartDLL.Wrapper.C_MZMP_GETPROJECTIONSTRING.restype = None;
-            MzCartDLL.Wrapper.C_MZMP_GEO2PROJ.restype = None;
-            MzCartDLL.Wrapper.C_MZMP_PROJ2GEO.restype = None;
-            MzCartDLL.Wrapper.C_MZMP_GETORIGIN.restype = None;
-            MzCartDLL.Wrapper.C_MZMP_GETCONVERGENCE.restype = ctypes.c_double;
-            MzCartDLL.Wrapper.C_MZMP_GETDEFAULTAREA.restype = None;
-            MzCartDLL.Wrapper.C_MZMP_GEO2XYZ.restype = None;
-            MzCartDLL.Wrapper.C_MZMP_XYZ2GEO.restype = None;
-
-            MzCartDLL.Wrapper.C_MZDC_CREATE.restype = None;
-            MzCartDLL.Wrapper.C_MZDC_DESTROY.restype = None;
-            MzCartDLL.Wrapper.C_MZDC_CONVERTXY.restype = None;
-            MzCartDLL.Wrapper.C_MZDC_INVCONVERTXY.restype = None;
-            MzCartDLL.Wrapper.C_MZDC_CONVERTXYH.restype = None;
-            MzCartDLL.Wrapper.C_MZDC_INVCONVERTXYH.restype = None;
-            MzCartDLL.Wrapper.C_MZDC_DATUMSHIFT.restype = None;
-            MzCartDLL.Wrapper.C_MZDC_BYPASSXYZ.restype = None;
-            MzCartDLL.Wrapper.C_MZDC_RESETBYPASSXYZ.restype = None;
-            MzCartDLL.Wrapper.C_MZDC_SETDATUMSHIFT.argtypes = [ctypes.c_void_p, ctypes.c_int32, ctypes.c_void_p, ctypes.c_int32];
-            MzCartDLL.Wrapper.C_MZDC_SETDATUMSHIFT.restype = None;
-            MzCartDLL.Wrapper.C_MZDC_INVERTORDER.restype = None;
-
-            MzCartDLL.Wrapper.S_LONGITUDETOUTMZONE.restype = None;
-            MzCartDLL.Wrapper.S_PROJECTIONSHORTNAME.restype = None;
-            MzCartDLL.Wrapper.S_PROJECTIONORIGIN.restype = None;
+        if not libfilepath is None:
+            MzCartDLL.libfilepath = libfilepath
+
+        # MzCart lib should be loaded only once
+        if not LazyLibrary.IsLoaded(MzCartDLL.Wrapper):
+            with MzCartDLL._initLock:
+                if not LazyLibrary.IsLoaded(MzCartDLL.Wrapper):
+                    MzCartDLL.__Load()
+        return MzCartDLL.Wrapper
+
+    @staticmethod
+    def __Load():
+
+        # Keep the load order of the native libraries: eum before MzCart
+        from mikecore.eum import eumDLL
+        eumDLL.Init()
+
+        # TODO: On linux, this looks different!
+        if os.name == "nt":
+            wrapper = ctypes.CDLL(os.path.join(MzCartDLL.libfilepath, "MzCart.dll"))
+        else:
+            wrapper = ctypes.CDLL(os.path.join(MzCartDLL.libfilepath, "libMzCart.so"))
+            libfilepathe = MzCartDLL.libfilepath+"/";
+            libfilepatheP = ctypes.c_char_p(libfilepathe.encode("ascii"))
+            wrapper.CARTSETUPLINUX(libfilepatheP, libfilepatheP);
+
+        wrapper.C_MZC_GETPROJECTION.restype = ctypes.c_void_p;
+        wrapper.C_MZC_GETPROJECTIONSTRING.restype = None;
+        wrapper.S_GETGOOGLEMAPPROJECTIONSTRING.restype = None;
+
+        wrapper.C_MZC_CREATE.restype = None;
+        wrapper.C_MZC_DESTROY.restype = None;
+        wrapper.C_MZC_GETPROJNORTH.restype = ctypes.c_double;
+        wrapper.C_MZC_GETTRUENORTH.restype = ctypes.c_double;
+        wrapper.C_MZC_GEO2PROJ.restype = None;
+        wrapper.C_MZC_PROJ2GEO.restype = None;
+        wrapper.C_MZC_GEO2XY.restype = None;
+        wrapper.C_MZC_XY2GEO.restype = None;
+        wrapper.C_MZC_PROJ2XY.restype = None;
+        wrapper.C_MZC_XY2PROJ.restype = None;
+        # Coordinate conversions are called for every point of arrays, see MzCartConvertArrays.
+        # With argtypes set, coordinates can be passed as plain Python floats.
+        convertArgtypes = [ctypes.c_void_p, ctypes.c_double, ctypes.c_double, ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_double)]
+        wrapper.C_MZC_GEO2PROJ.argtypes = convertArgtypes;
+        wrapper.C_MZC_PROJ2GEO.argtypes = convertArgtypes;
+        wrapper.C_MZC_GEO2XY.argtypes = convertArgtypes;
+        wrapper.C_MZC_XY2GEO.argtypes = convertArgtypes;
+        wrapper.C_MZC_PROJ2XY.argtypes = convertArgtypes;
+        wrapper.C_MZC_XY2PROJ.argtypes = convertArgtypes;
+
+        wrapper.C_MZMP_CREATE.restype = None;
+        wrapper.C_MZMP_DESTROY.restype = None;
+        wrapper.C_MZMP_GETNAME.restype = None;
+        wrapper.C_MZMP_GETPROJECTIONSTRING.restype = None;
+        wrapper.C_MZMP_GEO2PROJ.restype = None;
+        wrapper.C_MZMP_PROJ2GEO.restype = None;
+        wrapper.C_MZMP_GETORIGIN.restype = None;
+        wrapper.C_MZMP_GETCONVERGENCE.restype = ctypes.c_double;
+        wrapper.C_MZMP_GETDEFAULTAREA.restype = None;
+        wrapper.C_MZMP_GEO2XYZ.restype = None;
+        wrapper.C_MZMP_XYZ2GEO.restype = None;
+
+        wrapper.C_MZDC_CREATE.restype = None;
+        wrapper.C_MZDC_DESTROY.restype = None;
+        wrapper.C_MZDC_CONVERTXY.restype = None;
+        wrapper.C_MZDC_INVCONVERTXY.restype = None;
+        wrapper.C_MZDC_CONVERTXYH.restype = None;
+        wrapper.C_MZDC_INVCONVERTXYH.restype = None;
+        wrapper.C_MZDC_DATUMSHIFT.restype = None;
+        wrapper.C_MZDC_BYPASSXYZ.restype = None;
+        wrapper.C_MZDC_RESETBYPASSXYZ.restype = None;
+        wrapper.C_MZDC_SETDATUMSHIFT.argtypes = [ctypes.c_void_p, ctypes.c_int32, ctypes.c_void_p, ctypes.c_int32];
+        wrapper.C_MZDC_SETDATUMSHIFT.restype = None;
+        wrapper.C_MZDC_INVERTORDER.restype = None;
+
+        wrapper.S_LONGITUDETOUTMZONE.restype = None;
+        wrapper.S_PROJECTIONSHORTNAME.restype = None;
+        wrapper.S_PROJECTIONORIGIN.restype = None;
+
+        # Publish the library when fully configured
+        MzCartDLL.Wrapper = wrapper
 
     ################################/
     #region MzCartography methods
@@ -310,6 +335,33 @@ class MzCartDLL():
                                          ctypes.byref(east), ctypes.byref(north))
         return east.value, north.value;
 
+    #/ <summary>
+    #/ Convert arrays of coordinates using one of the MzCart coordinate
+    #/ conversion functions, e.g. Wrapper.C_MZC_GEO2XY.
+    #/ <para>
+    #/ The conversion functions only handle one point at a time. The output
+    #/ arguments are created once and reused for all points, and the input
+    #/ coordinates are passed as plain floats, using the argtypes of the function.
+    #/ </para>
+    #/ </summary>
+    @staticmethod
+    def MzCartConvertArrays(function, mzCartPointer: ctypes.c_void_p, a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray,np.ndarray]:
+        a = np.asarray(a, dtype=np.float64).ravel()
+        b = np.asarray(b, dtype=np.float64).ravel()
+        if (a.size != b.size):
+            raise ValueError("Coordinate arrays must have the same size")
+        aRes = np.empty(a.size)
+        bRes = np.empty(b.size)
+        aOut = ctypes.c_double()
+        bOut = ctypes.c_double()
+        aOutRef = ctypes.byref(aOut)
+        bOutRef = ctypes.byref(bOut)
+        for i, (ai, bi) in enumerate(zip(a.tolist(), b.tolist())):
+            function(mzCartPointer, ai, bi, aOutRef, bOutRef)
+            aRes[i] = aOut.value
+            bRes[i] = bOut.value
+        return aRes, bRes;
+
     # endregion
 
 
@@ -1462,6 +1514,60 @@ class Cartography:
     def Xy2Proj(self, x: float, y: float) -> Tuple[float,float]:
       return MzCartDLL.MzCartXy2Proj(self._mzCartPointer, x, y);
 
+    #/ <summary>
+    #/ Convert arrays of geographical coordinates to local grid x-y coordinates
+    #/ </summary>
+    #/ <param name="lon">Longitudes</param>
+    #/ <param name="lat">Latitudes</param>
+    #/ <returns>Arrays of local grid x and y coordinates</returns>
+    def Geo2XyArray(self, lon: np.ndarray, lat: np.ndarray) -> Tuple[np.ndarray,np.ndarray]:
+      return MzCartDLL.MzCartConvertArrays(MzCartDLL.Wrapper.C_MZC_GEO2XY, self._mzCartPointer, lon, lat);
+
+    #/ <summary>
+    #/ Convert arrays of local grid x-y coordinates to geographical coordinates
+    #/ </summary>
+    #/ <param name="x">Local grid x coordinates</param>
+    #/ <param name="y">Local grid y coordinates</param>
+    #/ <returns>Arrays of longitudes and latitudes</returns>
+    def Xy2GeoArray(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray,np.ndarray]:
+      return MzCartDLL.MzCartConvertArrays(MzCartDLL.Wrapper.C_MZC_XY2GEO, self._mzCartPointer, x, y);
+
+    #/ <summary>
+    #/ Convert arrays of geographical coordinates to projection coordinates
+    #/ </summary>
+    #/ <param name="lon">Longitudes</param>
+    #/ <param name="lat">Latitudes</param>
+    #/ <returns>Arrays of eastings and northings</returns>
+    def Geo2ProjArray(self, lon: np.ndarray, lat: np.ndarray) -> Tuple[np.ndarray,np.ndarray]:
+      return MzCartDLL.MzCartConvertArrays(MzCartDLL.Wrapper.C_MZC_GEO2PROJ, self._mzCartPointer, lon, lat);
+
+    #/ <summary>
+    #/ Convert arrays of projection coordinates to geographical coordinates
+    #/ </summary>
+    #/ <param name="east">Eastings</param>
+    #/ <param name="north">Northings</param>
+    #/ <returns>Arrays of longitudes and latitudes</returns>
+    def Proj2GeoArray(self, east: np.ndarray, north: np.ndarray) -> Tuple[np.ndarray,np.ndarray]:
+      return MzCartDLL.MzCartConvertArrays(MzCartDLL.Wrapper.C_MZC_PROJ2GEO, self._mzCartPointer, east, north);
+
+    #/ <summary>
+    #/ Convert arrays of projection coordinates to local grid x-y coordinates
+    #/ </summary>
+    #/ <param name="east">Eastings</param>
+    #/ <param name="north">Northings</param>
+    #/ <returns>Arrays of local grid x and y coordinates</returns>
+    def Proj2XyArray(self, east: np.ndarray, north: np.ndarray) -> Tuple[np.ndarray,np.ndarray]:
+      return MzCartDLL.MzCartConvertArrays(MzCartDLL.Wrapper.C_MZC_PROJ2XY, self._mzCartPointer, east, north);
+
+    #/ <summary>
+    #/ Convert arrays of local grid x-y coordinates to projection coordinates
+    #/ </summary>
+    #/ <param name="x">Local grid x coordinates</param>
+    #/ <param name="y">Local grid y coordinates</param>
+    #/ <returns>Arrays of eastings and northings</returns>
+    def Xy2ProjArray(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray,np.ndarray]:
+      return MzCartDLL.MzCartConvertArrays(MzCartDLL.Wrapper.C_MZC_XY2PROJ, self._mzCartPointer, x, y);
+
     #region Static factory methods
     
 
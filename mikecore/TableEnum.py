@@ -0,0 +1,138 @@
+import threading
+
+
+class TableEnumMeta(type):
+    '''
+    Metaclass of TableEnum, providing the enum-like class level operations:
+    attribute and item lookup by name, call by value, iteration and len.
+    '''
+
+    def __getattr__(cls, name):
+        # Only called for names that are not yet materialised as class attributes
+        if (name.startswith('_')):
+            raise AttributeError(name)
+        value = cls._Tables()[0].get(name)
+        if (value is None):
+            raise AttributeError("type object '{}' has no member '{}'".format(cls.__name__, name))
+        return cls._Member(value)
+
+    def __getitem__(cls, name):
+        value = cls._Tables()[0].get(name)
+        if (value is None):
+            raise KeyError(name)
+        return cls._Member(value)
+
+    def __call__(cls, value):
+        members = cls.__dict__.get('_members')
+        if (members is not None):
+            member = members.get(value)
+            if (member is not None):
+                return member
+        if (type(value) is cls):
+            return value
+        if (cls._Tables()[1].get(value) is None):
+            raise ValueError("{!r} is not a valid {}".format(value, cls.__name__))
+        return cls._Member(value)
+
+    def __iter__(cls):
+        byName = cls._Tables()[0]
+        return (cls._Member(value) for value in dict.fromkeys(byName.values()))
+
+    def __len__(cls):
+        return len(cls._Tables()[1])
+
+    def __contains__(cls, member):
+        # As for Enum, only members are contained, not plain int values
+        return type(member) is cls
+
+    def __dir__(cls):
+        return sorted(set(type.__dir__(cls)) | set(cls._Tables()[0]))
+
+    def __repr__(cls):
+        return "<enum '{}'>".format(cls.__name__)
+
+    @property
+    def __members__(cls):
+        return {name: cls._Member(value) for name, value in cls._Tables()[0].items()}
+
+
+class TableEnum(int, metaclass=TableEnumMeta):
+    '''
+    Integer enum backed by a table of names and values, as an alternative to
+    IntEnum for enums with many members.
+
+    The table is given in the _table class attribute, with one member on
+    each line, as name and value separated by white space. It is parsed on
+    first use, and members are created when first looked up, by name
+    (eumItem.eumIWaterLevel, eumItem["eumIWaterLevel"]) or by value
+    (eumItem(100000)). A member is created only once, and stored as a class
+    attribute, so later lookups by name are plain attribute lookups.
+
+    As for IntEnum, members are ints, with a name and a value. When a value
+    has more than one name, the first name is the name of the member, and
+    the other names are aliases.
+
+    A TableEnum is not an enum.Enum: members are not instances of enum.IntEnum
+    or enum.Enum, and functions of the enum module do not apply. Test for
+    members with isinstance(x, TableEnum), or the specific TableEnum class.
+    '''
+
+    _table = ""
+    _byName = None
+    _byValue = None
+    _members = None
+    _lock = threading.Lock()
+
+    @property
+    def name(self):
+        return self._name_
+
+    @property
+    def value(self):
+        return int(self)
+
+    def __repr__(self):
+        return "<{}.{}: {}>".format(type(self).__name__, self._name_, int(self))
+
+    __str__ = int.__repr__
+    __format__ = int.__format__
+
+    def __reduce_ex__(self, protocol):
+        return type(self), (int(self),)
+
+    @classmethod
+    def _Tables(cls):
+        '''
+        Name to value and value to name dictionaries, parsed from _table on first use.
+        '''
+        if (cls.__dict__.get('_byValue') is None):
+            with TableEnum._lock:
+                if (cls.__dict__.get('_byValue') is None):
+                    tokens = cls._table.split()
+                    names = tokens[0::2]
+                    values = list(map(int, tokens[1::2]))
+                    byName = dict(zip(names, values))
+                    # Reversed, such that the first name of a value wins
+                    byValue = dict(zip(reversed(values), reversed(names)))
+                    type.__setattr__(cls, '_byName', byName)
+                    type.__setattr__(cls, '_members', {})
+                    type.__setattr__(cls, '_byValue', byValue)
+        return cls._byName, cls._byValue
+
+    @classmethod
+    def _Member(cls, value):
+        '''
+        The member with the given value, created if not already created.
+        '''
+        byName, byValue = cls._Tables()
+        name = byValue[value]
+        member = cls.__dict__.get(name)
+        if (member is None):
+            with TableEnum._lock:
+                member = cls.__dict__.get(name)
+                if (member is None):
+                    member = int.__new__(cls, value)
+                    member._name_ = name
+                    type.__setattr__(cls, name, member)
+                    cls._members[value] = member
+        return member
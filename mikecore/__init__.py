@@ -30,8 +30,10 @@ from mikecore.Projections import MzCartDLL
 # Path is required for reading EUM.xml
 DfsDLL.libfilepath = mikebin
 eumDLL.libfilepath = mikebin
+MzCartDLL.libfilepath = mikebin
 
-eumDLL.Init()
-MzCartDLL.Init(mikebin)
-DfsDLL.Init(mikebin)
+# The native libraries are loaded on first use, see LazyLibrary.
+# Set MIKECORE_EAGER_INIT=1 to load them all at import.
+if os.environ.get("MIKECORE_EAGER_INIT", "0") not in ("", "0"):
+    DfsDLL.Init()
 
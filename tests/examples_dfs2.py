@@ -2,6 +2,8 @@ from mikecore.DfsFileFactory import DfsFileFactory
 from mikecore.DfsFactory import *
 from mikecore.DfsBuilder import *
 from mikecore.DfsFile import *
+from mikecore.Dfs2Reprojector import Dfs2Reprojector
+from mikecore.Projections import Cartography
 from numpy.testing import *
 
 class ExamplesDfs2:
@@ -384,38 +386,41 @@ class ExamplesDfs2:
 
         file.Close();
 
-#    #/ <summary>
-#    #/ Example of how to resample a dfs2 file in x/y space
-#    #/ </summary>
-#    #/ <param name="inputFilename">Path and name of the file to resample</param>
-#    #/ <param name="outputFilename">Path and name of the new file to create</param>
-#    #/ <param name="xCount">Number of cells in x-direction</param>
-#    #/ <param name="yCount">Number of cells in y-direction</param>
-#    def Resample(inputFilename, outputFilename, xCount, yCount):
-#
-#        # Load dfs2 file
-#        dfs2File = DfsFileFactory.Dfs2FileOpen(inputFilename);
-#        axis = dfs2File.SpatialAxis;
-#        
-#        # Create reprojector
-#        reproj = Dfs2Reprojector(dfs2File, outputFilename);
-#
-#        # scale change
-#        dxScale = axis.XCount / xCount;
-#        dyScale = axis.YCount / yCount;
-#
-#        # Calculate new lon/lat origin - center of lower left cell
-#        cart = Projections.Cartography(dfs2File.FileInfo.Projection.WKTString, dfs2File.FileInfo.Projection.Longitude, dfs2File.FileInfo.Projection.Latitude, dfs2File.FileInfo.Projection.Orientation);
-#        # Change in center of lower left cell
-#        dxOrigin = 0.5 * axis.Dx * (dxScale-1);
-#        dyOrigin = 0.5 * axis.Dy * (dyScale-1);
-#        cart.Xy2Geo(dxOrigin, dyOrigin, out double lonOrigin, out double latOrigin);
-#
-#        # Set new target
-#        reproj.SetTarget(dfs2File.FileInfo.Projection.WKTString, lonOrigin, latOrigin, dfs2File.FileInfo.Projection.Orientation, xCount, 0, axis.Dx*dxScale, yCount, 0, axis.Dy*dyScale);
-#        reproj.Interpolate = true;
-#        # Create new file
-#        reproj.Process();
+    #/ <summary>
+    #/ Example of how to resample a dfs2 file in x/y space
+    #/ </summary>
+    #/ <param name="inputFilename">Path and name of the file to resample</param>
+    #/ <param name="outputFilename">Path and name of the new file to create</param>
+    #/ <param name="xCount">Number of cells in x-direction</param>
+    #/ <param name="yCount">Number of cells in y-direction</param>
+    @staticmethod
+    def Resample(inputFilename, outputFilename, xCount, yCount):
+
+        # Load dfs2 file
+        dfs2File = DfsFileFactory.Dfs2FileOpen(inputFilename);
+        axis = dfs2File.SpatialAxis;
+        projection = dfs2File.FileInfo.Projection;
+
+        # Create reprojector
+        reproj = Dfs2Reprojector(dfs2File, outputFilename);
+
+        # scale change
+        dxScale = axis.XCount / xCount;
+        dyScale = axis.YCount / yCount;
+
+        # Calculate new lon/lat origin - center of lower left cell
+        cart = Cartography(projection.WKTString, projection.Longitude, projection.Latitude, projection.Orientation);
+        # Change in center of lower left cell
+        dxOrigin = 0.5 * axis.Dx * (dxScale-1);
+        dyOrigin = 0.5 * axis.Dy * (dyScale-1);
+        lonOrigin, latOrigin = cart.Xy2Geo(dxOrigin, dyOrigin);
+
+        # Set new target
+        reproj.SetTarget(projection.WKTString, lonOrigin, latOrigin, projection.Orientation, xCount, 0, axis.Dx*dxScale, yCount, 0, axis.Dy*dyScale);
+        reproj.Interpolate = True;
+        # Create new file
+        reproj.Process();
+        dfs2File.Close();
 
 
 #    #/ <summary>
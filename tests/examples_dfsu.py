@@ -276,150 +276,12 @@ class ExamplesDfsu:
     def ExtractDfsu2DLayerFrom3D(filenameDfsu3, filenameDfsu2, layerNumber):
       dfsu3File = DfsFileFactory.DfsuFileOpen(filenameDfsu3);
 
-      # Check that dfsu3 file is a 3D dfsu file.
-      switch (dfsu3File.DfsuFileType)
-      if (    dfsu3File.DfsuFileType == DfsuFileType.Dfsu2D
-        or dfsu3File.DfsuFileType == DfsuFileType.DfsuVerticalColumn
-        or dfsu3File.DfsuFileType == DfsuFileType.DfsuVerticalProfileSigma
-        or dfsu3File.DfsuFileType == DfsuFileType.DfsuVerticalProfileSigmaZ):
-          raise Exception("Input file is not a 3D dfsu file");
-  
-      # Calculate offset from toplayer element. Offset is between 0 (top layer) and
-      # dfsu3File.NumberOfLayers-1 (bottom layer)
-      topLayerOffset;
-      if (layerNumber > 0 and layerNumber <= dfsu3File.NumberOfLayers):
-        topLayerOffset = dfsu3File.NumberOfLayers - layerNumber;
-      elif (layerNumber < 0 and -layerNumber <= dfsu3File.NumberOfLayers):
-        topLayerOffset = -layerNumber - 1;
-      else:
-        raise Exception("Layer number is out of range");
-  
-      xv = dfsu3File.X;
-      yv = dfsu3File.Y;
-      zv = dfsu3File.Z;
-      cv = dfsu3File.Code;
-
-      # --------------------------------------------------
-      # Create 2D mesh from 3D mesh
-
-      # List of new 2D nodes
-      node2DCount = 0;
-      xv2 = []
-      yv2 = []
-      zv2 = []
-      cv2 = []
-
-      # Renumbering array, from 3D node numbers to 2D node numbers
-      # i.e. if a 3D element refers to node number k, the 2D element node number is renumber[k]
-      renumber = np.zeros(dfsu3File.NumberOfNodes, dtype=np.int32);
-
-      # Coordinates of last created node
-      xr2 = -1e-10;
-      yr2 = -1e-10;
-
-      # Create 2D nodes, by skipping nodes with equal x,y coordinates
-      for i in range(dfsu3File.NumberOfNodes):
-        # If 3D x,y coordinates are equal to the last created 2D node,
-        # map this node to the last created 2D node, otherwise
-        # create new 2D node and map to that one
-        if (xv[i] != xr2 or yv[i] != yr2):
-          # Create new node
-          node2DCount += 1;
-          xr2 = xv[i];
-          yr2 = yv[i];
-          zr2 = zv[i];
-          cr2 = cv[i];
-          xv2.append(xr2);
-          yv2.append(yr2);
-          zv2.append(zr2);
-          cv2.append(cr2);
-        # Map this 3D node to the last created 2D node.
-        renumber[i] = node2DCount;
-  
-      # Find indices of top layer elements
-      topLayer = dfsu3File.FindTopLayerElements();
-
-      # Create element table for 2D dfsu file
-      elmttable2 = np.zeros(dfsu3File.NumberOfNodes, dtype=object);
-      for i in range(len(topLayer)):
-        # 3D element nodes
-        elmt3 = dfsu3File.ElementTable[topLayer[i]];
-        # 2D element nodes, only half as big, so copy over the first half
-        elmt2 = np.zeros(elmt3.size / 2, dtype=np.int32);
-        for j in range(elmt2.size):
-          elmt2[j] = renumber[elmt3[j]];
-        elmttable2[i] = elmt2;
-  
-      # --------------------------------------------------
-      # Create 2D dfsu file
-      builder = DfsuBuilder.Create(DfsuFileType.Dfsu2D);
+      # Column and layer index maps are calculated once, and each 
+      # item-timestep is then extracted with a single gather.
+      # WriteLayerDfsu checks that dfsu3 file is a 3D dfsu file.
+      dfsu3File.WriteLayerDfsu(filenameDfsu2, layerNumber);
 
-      # Setup header and geometry
-      builder.SetNodes(xv2.ToArray(), yv2.ToArray(), zv2.ToArray(), cv2.ToArray());
-      builder.SetElements(elmttable2);
-      builder.SetProjection(dfsu3File.Projection);
-      builder.SetTimeInfo(dfsu3File.StartDateTime, dfsu3File.TimeStepInSeconds);
-      if (dfsu3File.ZUnit == eumUnit.eumUUnitUndefined):
-        builder.SetZUnit(eumUnit.eumUmeter);
-      else:
-        builder.SetZUnit(dfsu3File.ZUnit);
-
-      # Add dynamic items, copying from source, though not the first one, if it
-      # contains the z-variation on the nodes
-      for i in range(len(dfsu3File.ItemInfo)):
-        itemInfo = dfsu3File.ItemInfo[i];
-        if (itemInfo.ElementCount == dfsu3File.NumberOfElements):
-          builder.AddDynamicItem(itemInfo.Name, itemInfo.Quantity);
-  
-      # Create file
-      dfsu2File = builder.CreateFile(filenameDfsu2);
-
-      # --------------------------------------------------
-      # Process data
-
-      # Check if the layer number exists for 2D element, i.e. if that element
-      # in 2D has that number of columnes in the 3D (relevant for sigma-z files)
-      # If elementExists[i] is false, write delete value to file
-      elementExists = np.zeros(len(topLayer), dtype=bool);
-      numLayersInColumn = topLayer[0] + 1;
-      elementExists[0] = (numLayersInColumn - topLayerOffset) > 0;
-      for i in range(1,len(topLayer)):
-        numLayersInColumn = (topLayer[i] - topLayer[i - 1]);
-        elementExists[i] = (numLayersInColumn - topLayerOffset) > 0;
-  
-      # For performance, use predefined itemdata objects when reading data from dfsu 3D file
-      dfsu3ItemDatas = []
-      for j in range(len(dfsu3File.ItemInfo)):
-        dfsu3ItemDatas.append(dfsu3File.ItemInfo[j].CreateEmptyItemData());
-  
-      # data to write to dfsu 2D file
-      data2 = np.zeros(dfsu2File.NumberOfElements, dtype=np.float32);
-      deleteValueFloat = dfsu2File.DeleteValueFloat;
-
-      for i in range(dfsu3File.NumberOfTimeSteps):
-        for j in range(len(dfsu3File.ItemInfo)):
-          # Read data from 3D dfsu
-          data3Item = dfsu3ItemDatas[j];
-          ok = dfsu3File.ReadItemTimeStep(data3Item, i);
-          # 3D data
-          data3 = data3Item.Data;
-
-          # Skip any items not having size = NumberOfElments (the z-variation on the nodes)
-          if (data3.size != dfsu3File.NumberOfElements):
-            continue;
-
-          # Loop over all 2D elements
-          for k in range(elmtsIndices.size):
-            # Extract layer data from 3D column into 2D element value
-            if (elementExists[k]):
-              data2[k] = data3[topLayer[k] - topLayerOffset];
-            else:
-              data2[k] = deleteValueFloat;
-      
-          dfsu2File.WriteItemTimeStepNext(data3Item.Time, data2);
-      
       dfsu3File.Close();
-      dfsu2File.Close();
 
 
     #/ Create dfsu and mesh file from dfs2 file.
@@ -439,170 +301,29 @@ class ExamplesDfsu:
       # Open file
       dfs2 = DfsFileFactory.Dfs2FileOpen(dfs2Filename);
 
-      # Read bathymetry from first static item
-      bathymetryItem = dfs2.ReadStaticItemNext();
-      bathymetry = bathymetryItem.Data;
-
-      # Extract spatial axis
-      spatialAxis = dfs2.SpatialAxis;
-      # Some convenience variables
-      dx = spatialAxis.Dx;
-      dy = spatialAxis.Dy;
-      x0 = spatialAxis.X0;
-      y0 = spatialAxis.Y0;
-      xCount = spatialAxis.XCount;
-      yCount = spatialAxis.YCount;
+      # Build a quad mesh from the grid cells that are not land in the
+      # bathymetry (first static item). The land value is taken from the
+      # M21_MISC custom block. Each node gets the average Z value of its
+      # neighbouring water cells.
+      mesh = DfsuGridMesh(dfs2);
 
-      # First custom block (index 0) contains the M21_MISC values,
-      # where the 4th (index 3) is the land value
-      landValue = dfs2.FileInfo.CustomBlocks[0][3];
-
-      #-----------------------------------------
-      # Find out which elements in the dfs2 grid that is not a land value
-      # and include all those elements and their surrounding nodes in mesh
-
-      # Arrays indicating if element and node in grid is used or not in mesh
-      elmts = np.zeros((xCount, yCount), dtype=bool);
-      nodes = np.zeros((xCount + 1, yCount + 1), dtype=np.int32);
-
-      # Loop over all elements in 2D grid
-      for l in range(yCount):
-        for k in range(xCount):
-          # If bathymetry is not land value, use element.
-          if (bathymetry[k + l * xCount] != landValue):
-            # element [l,k] is used, and also the 4 nodes around it
-            elmts[k  , l  ] = True;
-            nodes[k  , l  ] = 1;
-            nodes[k+1, l  ] = 1;
-            nodes[k  , l+1] = 1;
-            nodes[k+1, l+1] = 1;
-            
-      #-----------------------------------------
-      # Create new mest nodes
-
-      # Cartography object can convert grid (x,y) to projection (east,north)
-      proj = dfs2.FileInfo.Projection;
-      cart = Cartography(proj.WKTString, proj.Longitude, proj.Latitude, proj.Orientation);
-
-      # New mesh nodes
-      X = [];
-      Y = [];
-      Zf = [];   # values for dfsu file
-      Zd = []; # values for mesh file
-      Code = [];
-
-      # Loop over all nodes
-      nodesCount = 0;
-      for l in range(yCount+1):
-        for k in range(xCount+1):
-          # Check if node is included in mesh
-          if (nodes[k, l] > 0):
-            # Convert from mesh (x,y) to projection (east,north)
-            east, north = cart.Xy2Proj((k - 0.5) * dx + x0, (l - 0.5) * dy + y0);
-
-            # Average Z on node from neighbouring grid cell values, cell value is used
-            # unless they are outside grid or has land values
-            z = 0;
-            zCount = 0;
-            if (k > 0 and l > 0           and bathymetry[k-1 + (l-1) * xCount] != landValue):
-              zCount+=1;                 z += bathymetry[k-1 + (l-1) * xCount];
-            if (k < xCount and l > 0      and bathymetry[k   + (l-1) * xCount] != landValue):
-              zCount+=1;                 z += bathymetry[k   + (l-1) * xCount];
-            if (k > 0 and l < yCount      and bathymetry[k-1 + (l  ) * xCount] != landValue):
-              zCount+=1;                 z += bathymetry[k-1 + (l  ) * xCount]; 
-            if (k < xCount and l < yCount and bathymetry[k   + (l  ) * xCount] != landValue):
-              zCount+=1;                 z += bathymetry[k   + (l  ) * xCount]; 
-
-            if (zCount > 0):
-              z /= zCount;
-            else:
-              z = landValue;
-
-            # Store new node number and add node
-            nodesCount += 1;
-            nodes[k, l] = nodesCount; # this is the node number to use in the element table
-            X.append(east);
-            Y.append(north);
-            Zf.append(z);
-            Zd.append(z);
-            Code.append(0 if zCount == 4 else 1); # Land boundary if zCount < 4
-            
-      # New mesh elements
-      elmttableList = [];
-
-      for l in range(yCount):
-        for k in range(xCount):
-          # Check if element is included in mesh
-          if (elmts[k, l]):
-            # For this element, add the four surrounding nodes,
-            # counter-clockwise order
-            newNodes = np.zeros(4, dtype=np.int32);
-            newNodes[0] = nodes[k  , l  ];
-            newNodes[1] = nodes[k+1, l  ];
-            newNodes[2] = nodes[k+1, l+1];
-            newNodes[3] = nodes[k  , l+1];
-            elmttableList.append(newNodes);
-
-      # Copy to np array
-      elmttable2 = np.zeros(len(elmttableList), dtype=object);
-      for i in range(len(elmttableList)):
-        elmttable2[i] = elmttableList[i];
-            
 #      #-----------------------------------------
 #      # Create mesh
-#      # Create 2D dfsu file
 #      builder = MeshBuilder();
 #
 #      # Setup header and geometry
-#      builder.SetNodes(X.ToArray(), Y.ToArray(), Zd.ToArray(), Code.ToArray());
-#      builder.SetElements(elmttable2.ToArray());
+#      builder.SetNodes(mesh.X, mesh.Y, mesh.Z, mesh.Code);
+#      builder.SetElements(mesh.ElementTable);
 #      builder.SetProjection(dfs2.FileInfo.Projection);
 #
 #      # Create new file
-#      mesh = builder.CreateMesh();
-#      mesh.Write(meshFilename);
+#      meshFile = builder.CreateMesh();
+#      meshFile.Write(meshFilename);
 
-  
       #-----------------------------------------
-      # Create dfsu file
-      # dfs2 time axis
-      timeAxis = dfs2.FileInfo.TimeAxis;
-
-      # Create 2D dfsu file
-      builder = DfsuBuilder.Create(DfsuFileType.Dfsu2D);
-
-      # Setup header and geometry
-      builder.SetNodes(np.array(X), np.array(Y), np.array(Zf, dtype=np.float32), np.array(Code, dtype=np.int32));
-      builder.SetElements(elmttable2);
-      builder.SetProjection(dfs2.FileInfo.Projection);
-      builder.SetTimeInfo(timeAxis.StartDateTime, timeAxis.TimeStepInSeconds());
-      builder.SetZUnit(eumUnit.eumUmeter);
+      # Create dfsu file, copying the values of the mesh elements for all item-timesteps
+      mesh.WriteDfsu(dfsuFilename);
 
-      # Add dynamic items, copying from dfs2 file
-      for i in range(len(dfs2.ItemInfo)):
-        itemInfo = dfs2.ItemInfo[i];
-        builder.AddDynamicItem(itemInfo.Name, itemInfo.Quantity);
-    
-      # Create new file
-      dfsu = builder.CreateFile(dfsuFilename);
-
-      # Add dfs2 data to dfsu file
-      dfsuData = np.zeros(dfsu.NumberOfElements, dtype=np.float32);
-      for i in range(dfs2.FileInfo.TimeAxis.NumberOfTimeSteps):
-        for j in range(len(dfs2.ItemInfo)):
-          # Read dfs2 grid data
-          itemData = dfs2.ReadItemTimeStep(j + 1, i, reshape=True);
-          # Extract 2D grid data to dfsu data array
-          lk = 0;
-          for l in range(yCount):
-            for k in range(xCount):
-              if (elmts[k, l]):
-                dfsuData[lk] = itemData.Data[k, l];
-                lk += 1
-          # write data
-          dfsu.WriteItemTimeStepNext(itemData.Time, dfsuData);
-      dfsu.Close();
-  
       dfs2.Close();
 
     #/ Extract sub-area of dfsu (2D) file to a new dfsu file
@@ -616,110 +337,11 @@ class ExamplesDfsu:
 
       dfsu = DfsFileFactory.DfsuFileOpen(sourceFilename);
 
-      # Node coordinates
-      X = dfsu.X;
-      Y = dfsu.Y;
-      Z = dfsu.Z;
-      Code = dfsu.Code;
-
-      # Loop over all elements, and all its nodes: If one node is inside
-      # region, element (and nodes) are to be included in new mesh
-      elmtsIncluded = [];
-      nodesIncluded = np.zeros(dfsu.NumberOfNodes, dtype=bool);
-      for i in range(dfsu.NumberOfElements):
-        # Nodes of element
-        nodes = dfsu.ElementTable[i];
-
-        # Check if one of the nodes of the element is inside region
-        elmtIncluded = False;
-        for j in range(nodes.size):
-          node = nodes[j] - 1;
-          if (x1 <= X[node] and X[node] <= x2 and y1 <= Y[node] and Y[node] <= y2):
-            elmtIncluded = True;
-    
-        if (elmtIncluded):
-          # Add element to list of included elements
-          elmtsIncluded.append(i);
-          # Mark all nodes of element as included
-          for j in range(nodes.size):
-            node = nodes[j] - 1;
-            nodesIncluded[node] = True;
-            
-      # array containing numbers of existing nodes in new mesh (indices)
-      renumber = np.zeros(dfsu.NumberOfNodes, dtype=int);
-
-      # new mesh nodes
-      X2 = [];
-      Y2 = [];
-      Z2 = [];
-      Code2 = [];
-      nodeIds = [];
-
-      i2 = 0;
-      for i in range(dfsu.NumberOfNodes):
-        if (nodesIncluded[i]):
-          X2.append(X[i]);
-          Y2.append(Y[i]);
-          Z2.append(Z[i]);
-          Code2.append(Code[i]);
-          nodeIds.append(dfsu.NodeIds[i]);
-          # Node with index i will get index i2 in new mesh
-          renumber[i] = i2;
-          i2 += 1;
-      
-      # New mesh elements
-      elmttable2 = np.zeros(len(elmtsIncluded), dtype=object);
-      elmtIds    = np.zeros(len(elmtsIncluded), dtype=np.int32);
-      for i in range(len(elmtsIncluded)):
-        # Add new element
-        elmt = elmtsIncluded[i];
-        nodes = dfsu.ElementTable[elmt];
-        # newNodes must be renumbered
-        newNodes = np.zeros(nodes.size, dtype=np.int32);
-        for j in range(nodes.size):
-          # Do the renumbering of nodes from existing mesh to new mesh
-          newNodes[j] = renumber[nodes[j] - 1] + 1;
-        elmttable2[i] = newNodes;
-        elmtIds[i] = dfsu.ElementIds[elmt];
-  
-      # Create 2D dfsu file
-      builder = DfsuBuilder.Create(DfsuFileType.Dfsu2D);
-
-      # Setup header and geometry
-      X2    = np.array(X2,    dtype=np.float64)
-      Y2    = np.array(Y2,    dtype=np.float64)
-      Z2    = np.array(Z2,    dtype=np.float32)
-      Code2 = np.array(Code2, dtype=np.int32)
-
-      builder.SetNodes(X2, Y2, Z2, Code2);
-      #builder.SetNodeIds(nodeIds.ToArray());
-      builder.SetElements(elmttable2);
-      builder.SetElementIds(elmtIds); # retain original element id's
-      builder.SetProjection(dfsu.Projection);
-      builder.SetTimeInfo(dfsu.StartDateTime, dfsu.TimeStepInSeconds);
-      if (dfsu.ZUnit == eumUnit.eumUUnitUndefined):
-        builder.SetZUnit(eumUnit.eumUmeter);
-      else:
-        builder.SetZUnit(dfsu.ZUnit);
+      # If one node of an element is inside region, element (and all 
+      # its nodes) are to be included in new mesh
+      subset = dfsu.Subset(bbox = (x1, y1, x2, y2));
 
-      # Add dynamic items, copying from source
-      for i in range(len(dfsu.ItemInfo)):
-        itemInfo = dfsu.ItemInfo[i];
-        builder.AddDynamicItem(itemInfo.Name, itemInfo.Quantity);
-  
-      # Create new file
-      dfsuOut = builder.CreateFile(outputFilename);
-
-      # Add new data
-      data2 = np.zeros(len(elmtsIncluded), dtype=np.float32);
-      for i in range(dfsu.NumberOfTimeSteps):
-        for j in range(len(dfsu.ItemInfo)):
-          # Read data from existing dfsu
-          itemData = dfsu.ReadItemTimeStep(j + 1, i);
-          # Extract value for elements in new mesh
-          for k in range(len(elmtsIncluded)):
-            data2[k] = itemData.Data[elmtsIncluded[k]];
-          # write data
-          dfsuOut.WriteItemTimeStepNext(itemData.Time, data2);
-      dfsuOut.Close();
+      # Create new file, with the geometry of the subset, and copy
+      # the values of the subset elements for all item-timesteps
+      subset.WriteDfsu(outputFilename);
       dfsu.Close();
@@ -95,6 +95,28 @@ class Dfs0Tests(unittest.TestCase):
         Dfs0Tests.CreateNeqCalTimeTest(False, bulkWrite=True);
 
 
+    def test_TimeIndex(self):
+        for filename in ["testdata/TemporalNeqTime.dfs0", "testdata/TemporalEqTime.dfs0", "testdata/Rain_instantaneous.dfs0"]:
+            dfsFile = DfsFileFactory.DfsGenericOpen(filename);
+            numItems = len(dfsFile.ItemInfo)
+            times = []
+            itemData = dfsFile.ReadItemTimeStepNext();
+            while (itemData is not None):
+                if (itemData.ItemNumber == 1):
+                    times.append(itemData.Time)
+                itemData = dfsFile.ReadItemTimeStepNext();
+
+            # Position in the middle, must be restored after reading times
+            dfsFile.ReadItemTimeStep(numItems, 1);
+            timeIndex = dfsFile.TimeIndex
+            assert_allclose(times, timeIndex, 1e-9);
+            assert_equal(dfsFile.FileInfo.TimeAxis.NumberOfTimeSteps, len(timeIndex));
+            Assert.IsTrue(dfsFile.TimeIndex is timeIndex);
+            itemData = dfsFile.ReadItemTimeStepNext();
+            assert_equal(1, itemData.ItemNumber);
+            assert_allclose(times[2], itemData.Time, 1e-9);
+            dfsFile.Close();
+
     # Create a file matching the TemporalEqCal.dfs0 file, and tests its content
     def test_CreateNeqCalFileTest(self):
         Dfs0Tests.CreateNeqCalTimeTest(True);
@@ -1,14 +1,41 @@
+import os
 import unittest
 from datetime import datetime
 from mikecore.DfsFileFactory import *
 from mikecore.DfsBuilder import *
 from mikecore.DfsFactory import *
 from mikecore.DfsFile import *
+from mikecore.Dfs2Reprojector import Dfs2Reprojector
+from mikecore.Projections import Cartography
 from mikecore.eum import *
 from numpy.testing import *
 from tests.examples_dfs2 import *
 from tests.test_util import *
 
+def CreateMixedTypesDfs2(filename):
+    """Create a 4x4 dfs2 file with a float and a double item, with delete values, and 2 timesteps"""
+    factory = DfsFactory();
+    builder = DfsBuilder.Create("", "", 0);
+    builder.SetDataType(1);
+    builder.SetGeographicalProjection(factory.CreateProjectionGeoOrigin("UTM-33", 12.438741600559766, 55.225707842436385, 327.0));
+    builder.SetTemporalAxis(factory.CreateTemporalEqCalendarAxis(eumUnit.eumUsec, datetime(1993, 12, 2, 0, 0, 0), 0, 86400));
+    builder.SetSpatialAxis(factory.CreateAxisEqD2(eumUnit.eumUmeter, 4, 0, 900, 4, 0, 900));
+    builder.AddCreateDynamicItem("Float item", eumQuantity.Create(eumItem.eumIWaterLevel, eumUnit.eumUmeter), DfsSimpleType.Float, DataValueType.Instantaneous);
+    builder.AddCreateDynamicItem("Double item", eumQuantity.Create(eumItem.eumIWaterLevel, eumUnit.eumUmeter), DfsSimpleType.Double, DataValueType.Instantaneous);
+    builder.CreateFile(filename);
+    file = builder.GetFile();
+
+    floatData = np.arange(16, dtype=np.float32);
+    floatData[0] = file.FileInfo.DeleteValueFloat;
+    doubleData = 1.0 + np.arange(16) * 1e-10;
+    # Lower left 2x2 cells of the double item have no values
+    doubleData[[0, 1, 4, 5]] = file.FileInfo.DeleteValueDouble;
+    for i in range(2):
+        file.WriteItemTimeStepNext(0, floatData);
+        file.WriteItemTimeStepNext(0, doubleData);
+    file.Close();
+    return floatData, doubleData
+
 
 class Dfs2Tests(unittest.TestCase):
     '''
@@ -62,6 +89,46 @@ class Dfs2Tests(unittest.TestCase):
         FileOresundBathy900Dfs2.DynamicItemTester(dfsFile.ItemInfo);
         FileOresundBathy900Dfs2.ReadTester(dfsFile);
 
+    def test_MemoryMapTest(self):
+        filename = "testdata/OresundHD.dfs2";
+        dfsFile = DfsFileFactory.DfsGenericOpen(filename);
+        numTimeSteps = dfsFile.FileInfo.TimeAxis.NumberOfTimeSteps
+
+        for item in dfsFile.ItemInfo:
+            view = dfsFile.GetItemMemoryMap(item.ItemNumber)
+            Assert.IsNotNull(view)
+            Assert.AreEqual((numTimeSteps, item.ElementCount), view.shape)
+            Assert.IsFalse(view.flags.writeable)
+            for i in range(numTimeSteps):
+                assert_array_equal(dfsFile.ReadItemTimeStep(item.ItemNumber, i).Data, view[i])
+
+        # File pointer is kept
+        dfsFile.ReadItemTimeStep(2, 1)
+        dfsFile.GetItemMemoryMap(1)
+        itemData = dfsFile.ReadItemTimeStepNext()
+        Assert.AreEqual(3, itemData.ItemNumber)
+        Assert.AreEqual(1, itemData.TimeStepIndex)
+
+        data = dfsFile.ReadItemTimeSteps(1, [0, numTimeSteps - 1], memoryMap = True)
+        Assert.AreEqual((2, dfsFile.ItemInfo[0].ElementCount), data.shape)
+        assert_array_equal(dfsFile.ReadItemTimeStep(1, numTimeSteps - 1).Data, data[1])
+        assert_array_equal(data, dfsFile.ReadItemTimeSteps(1, [0, numTimeSteps - 1]))
+        dfsFile.Close();
+
+        # Files opened for editing are not memory mapped, reading each item-timestep instead
+        editFilename = "testdata/testtmp/test_memorymap_OresundHD.dfs2";
+        testUtil.copy_file(filename, editFilename);
+        dfsFile = DfsFileFactory.DfsGenericOpenEdit(editFilename);
+        Assert.IsNull(dfsFile.GetItemMemoryMap(1))
+        assert_array_equal(data, dfsFile.ReadItemTimeSteps(1, [0, -1], memoryMap = True))
+        dfsFile.Close();
+
+        # Close releases the memory map, such that the file can be deleted, also on Windows
+        dfsFile = DfsFileFactory.DfsGenericOpen(editFilename);
+        Assert.IsNotNull(dfsFile.GetItemMemoryMap(1))
+        dfsFile.Close();
+        os.remove(editFilename);
+
     def test_ReadLanduseTest(self):
         filename = "testdata/Landuse.dfs2";
         # Load as Dfs2File
@@ -806,6 +873,148 @@ class FileLanduseDfs2:
         assert_equal(2, data2D[21,64]);
         assert_equal(1, data2D[21,65]);
 
+    def test_ResampleOresundHDTest(self):
+
+        sourceFilename = "testdata/OresundHD.dfs2";
+        filename = "testdata/testtmp/test_resample_OresundHD.dfs2";
+
+        source = DfsFileFactory.Dfs2FileOpen(sourceFilename);
+        axis = source.SpatialAxis;
+        projection = source.FileInfo.Projection;
+        deleteValue = source.FileInfo.DeleteValueFloat;
+        numberOfTimeSteps = source.FileInfo.TimeAxis.NumberOfTimeSteps;
+
+        # Half resolution, target cell centers at the common corner of 2x2 source cells
+        xCount = axis.XCount // 2;
+        yCount = axis.YCount // 2;
+        reproj = Dfs2Reprojector(source, filename);
+        reproj.SetTarget(projection.WKTString, projection.Longitude, projection.Latitude, projection.Orientation,
+                         xCount, axis.X0 + 0.5*axis.Dx, 2*axis.Dx, yCount, axis.Y0 + 0.5*axis.Dy, 2*axis.Dy);
+        reproj.Interpolate = True;
+        weights = reproj.Weights;
+        Assert.AreEqual(xCount*yCount, weights.TargetCount);
+        reproj.Process();
+
+        sourceData = source.ReadItemTimeStep(1, 2).Data.reshape((axis.YCount, axis.XCount));
+        source.Close();
+        blocks = sourceData[:2*yCount, :2*xCount].reshape(yCount, 2, xCount, 2);
+        allValues = np.all(blocks != deleteValue, axis=(1,3)).ravel();
+
+        file = DfsFileFactory.Dfs2FileOpen(filename);
+        Assert.AreEqual(xCount, file.SpatialAxis.XCount);
+        Assert.AreEqual(2*axis.Dx, file.SpatialAxis.Dx);
+        Assert.AreEqual(numberOfTimeSteps, file.FileInfo.TimeAxis.NumberOfTimeSteps);
+        data = file.ReadItemTimeStep(1, 2).Data;
+        file.Close();
+
+        # Bilinear interpolation at the corner is the mean of the 4 cells
+        assert_allclose(blocks.mean(axis=(1,3)).ravel()[allValues], data[allValues], rtol=1e-6);
+        # Cells with no source values are delete values
+        noValues = np.all(blocks == deleteValue, axis=(1,3)).ravel();
+        assert np.all(data[noValues] == deleteValue);
+
+        # Same grid using nearest cell value reproduces the source data
+        source = DfsFileFactory.Dfs2FileOpen(sourceFilename);
+        reproj = Dfs2Reprojector(source);
+        assert_array_equal(sourceData.ravel(), reproj.Regrid(source.ReadItemTimeStep(1, 2).Data));
+        source.Close();
+
+    def test_ResampleMixedTypesTest(self):
+
+        sourceFilename = "testdata/testtmp/test_resample_mixed_source.dfs2";
+        filename = "testdata/testtmp/test_resample_mixed.dfs2";
+        floatData, doubleData = CreateMixedTypesDfs2(sourceFilename);
+        deleteFloat = DfsFile.DefaultDeleteValueFloat;
+        deleteDouble = DfsFile.DefaultDeleteValueDouble;
+
+        # Half resolution, target cell centers at the common corner of 2x2 source cells
+        source = DfsFileFactory.Dfs2FileOpen(sourceFilename);
+        projection = source.FileInfo.Projection;
+        reproj = Dfs2Reprojector(source, filename);
+        reproj.SetTarget(projection.WKTString, projection.Longitude, projection.Latitude, projection.Orientation,
+                         2, 450, 1800, 2, 450, 1800);
+        reproj.Interpolate = True;
+        reproj.Process();
+        source.Close();
+
+        def blockMeans(data, deleteValue):
+            blocks = data.reshape(2, 2, 2, 2);
+            valid = blocks != deleteValue;
+            with np.errstate(invalid='ignore'):
+                means = (np.where(valid, blocks, 0).sum(axis=(1,3)) / valid.sum(axis=(1,3))).ravel();
+            means[np.isnan(means)] = deleteValue;
+            return means;
+
+        file = DfsFileFactory.Dfs2FileOpen(filename);
+        Assert.AreEqual(DfsSimpleType.Float, file.ItemInfo[0].DataType);
+        Assert.AreEqual(DfsSimpleType.Double, file.ItemInfo[1].DataType);
+        for i in range(2):
+            data = file.ReadItemTimeStep(1, i).Data;
+            Assert.AreEqual(np.float32, data.dtype);
+            assert_allclose(blockMeans(floatData, deleteFloat), data, rtol=1e-6);
+            data = file.ReadItemTimeStep(2, i).Data;
+            Assert.AreEqual(np.float64, data.dtype);
+            # Double precision is kept, and double delete values are not interpolated
+            assert_allclose(blockMeans(doubleData, deleteDouble), data, rtol=1e-14);
+            Assert.AreEqual(deleteDouble, data[0]);
+        file.Close();
+
+    def test_SampleMixedTypesTest(self):
+
+        filename = "testdata/testtmp/test_sample_mixed.dfs2";
+        floatData, doubleData = CreateMixedTypesDfs2(filename);
+
+        file = DfsFileFactory.Dfs2FileOpen(filename);
+        axis = file.SpatialAxis;
+        projection = file.FileInfo.Projection;
+        cart = Cartography(projection.WKTString, projection.Longitude, projection.Latitude, projection.Orientation);
+        # Common corner of the lower left 2x2 cells, and of the upper right 2x2 cells
+        lon, lat = cart.Xy2GeoArray(axis.X0 + np.array([0.5, 2.5])*axis.Dx, axis.Y0 + np.array([0.5, 2.5])*axis.Dy);
+
+        bilinear = file.Sample(lon, lat, method = "bilinear");
+        file.Close();
+        Assert.AreEqual(np.float64, bilinear.dtype);
+        # Delete value of the float item is not used
+        assert_allclose(np.mean(floatData[[1, 4, 5]]), bilinear[:, 0, 0], rtol=1e-6);
+        # Double item keeps its precision, and double delete values are not interpolated
+        assert_allclose(np.mean(doubleData[[10, 11, 14, 15]]), bilinear[:, 1, 1], rtol=1e-14);
+        assert np.all(bilinear[:, 1, 0] == file.FileInfo.DeleteValueDouble);
+
+    def test_SampleOresundHDTest(self):
+
+        file = DfsFileFactory.Dfs2FileOpen("testdata/OresundHD.dfs2");
+        axis = file.SpatialAxis;
+        projection = file.FileInfo.Projection;
+        deleteValue = file.FileInfo.DeleteValueFloat;
+
+        # Points at a number of cell centers, and one point far outside the grid
+        j = np.array([0, 10, 30, 40, axis.XCount-1]);
+        k = np.array([0, 20, 27, 60, axis.YCount-1]);
+        cart = Cartography(projection.WKTString, projection.Longitude, projection.Latitude, projection.Orientation);
+        lon, lat = cart.Xy2GeoArray(axis.X0 + j*axis.Dx, axis.Y0 + k*axis.Dy);
+        lon = np.append(lon, 0.0);
+        lat = np.append(lat, 0.0);
+
+        nearest = file.Sample(lon, lat, items = [1, 2], timesteps = [0, 5]);
+        Assert.AreEqual((2, 2, 6), nearest.shape);
+        bilinear = file.Sample(lon, lat, items = [1, 2], timesteps = [0, 5], method = "bilinear");
+        for ti, timestep in enumerate([0, 5]):
+            for ii, item in enumerate([1, 2]):
+                data = file.ReadItemTimeStep(item, timestep).Data;
+                assert_array_equal(data[j + k*axis.XCount], nearest[ti, ii, :5]);
+                assert_allclose(data[j + k*axis.XCount], bilinear[ti, ii, :5], rtol=1e-5, atol=1e-6);
+        assert np.all(nearest[:, :, 5] == deleteValue);
+        assert np.all(bilinear[:, :, 5] == deleteValue);
+
+        # Bilinear between two cells, with delete values not used
+        lon, lat = cart.Xy2GeoArray(axis.X0 + np.array([30.5])*axis.Dx, axis.Y0 + np.array([27.0])*axis.Dy);
+        data = file.ReadItemTimeStep(1, 0).Data;
+        values = data[[30 + 27*axis.XCount, 31 + 27*axis.XCount]];
+        values = values[values != deleteValue];
+        assert_allclose(values.mean(), file.Sample(lon, lat, [1], [0], "bilinear")[0, 0, 0], rtol=1e-4);
+
+        file.Close();
+
   #endregion
 
 
@@ -0,0 +1,93 @@
+import asyncio
+import unittest
+import numpy as np
+from mikecore.DfsFileFactory import DfsFileFactory
+from mikecore.DfsAsync import DfsAsyncReader
+from tests.test_util import *
+
+class Test_dfs_async(unittest.TestCase):
+
+    def test_ConcurrentReads(self):
+        filename = "testdata/OresundHD.dfs2"
+        dfsFile = DfsFileFactory.DfsGenericOpen(filename)
+        numItems = len(dfsFile.ItemInfo)
+        numTimeSteps = dfsFile.FileInfo.TimeAxis.NumberOfTimeSteps
+        expected = [dfsFile.ReadItemTimeStep(itemNumber, timestepIndex).Data
+                    for timestepIndex in range(numTimeSteps) for itemNumber in range(1, numItems + 1)]
+        expectedItem = dfsFile.ReadItemTimeSteps(2)
+        dfsFile.Close()
+
+        async def run():
+            async with DfsAsyncReader(maxWorkers = 4) as reader:
+                asyncFile = await reader.OpenAsync(filename)
+                assert len(asyncFile.ItemInfo) == numItems
+                assert asyncFile.FileInfo.TimeAxis.NumberOfTimeSteps == numTimeSteps
+
+                requests = [asyncFile.ReadItemTimeStepAsync(itemNumber, timestepIndex)
+                            for timestepIndex in range(numTimeSteps) for itemNumber in range(1, numItems + 1)]
+                itemDatas = await asyncio.gather(*requests, asyncFile.ReadItemTimeStepsAsync(2))
+                for i in range(len(expected)):
+                    np.testing.assert_array_equal(expected[i], itemDatas[i].Data)
+                np.testing.assert_array_equal(expectedItem, itemDatas[-1])
+
+                # Open files are reused, at most one for each worker thread
+                assert reader.Pool.OpenCount <= 4
+                asyncFile = await reader.OpenAsync(filename)
+                assert reader.Pool.OpenCount <= 4
+
+                # A failing request does not affect other requests
+                with self.assertRaises(Exception):
+                    await asyncFile.ReadItemTimeStepAsync(1, numTimeSteps)
+                itemData = await asyncFile.ReadItemTimeStepAsync(1, 0)
+                np.testing.assert_array_equal(expected[0], itemData.Data)
+            assert reader.Pool.IdleCount == 0
+
+        asyncio.run(run())
+
+    def test_Dfs0Reads(self):
+        filename = "testdata/TemporalNeqTime.dfs0"
+        dfsFile = DfsFileFactory.DfsGenericOpen(filename)
+        expectedData = dfsFile.ReadDfs0DataDouble()
+        expectedTimes = dfsFile.TimeIndex
+        dfsFile.Close()
+
+        async def run():
+            async with DfsAsyncReader(maxWorkers = 2) as reader:
+                asyncFile = await reader.OpenAsync(filename)
+                data, times = await asyncio.gather(asyncFile.ReadDfs0DataDoubleAsync(), asyncFile.ReadTimeIndexAsync())
+                np.testing.assert_array_equal(expectedData, data)
+                np.testing.assert_array_equal(expectedTimes, times)
+
+        asyncio.run(run())
+
+    def test_PooledFilePointer(self):
+        filename = "testdata/TemporalNeqTime.dfs0"
+        dfsFile = DfsFileFactory.DfsGenericOpen(filename)
+        expected = [dfsFile.ReadItemTimeStep(1, i).Data for i in range(3)]
+        # The bulk read moves the file pointer to the end of the file, also when positioned at the first item-timestep
+        dfsFile.Reset()
+        expectedData = dfsFile.ReadDfs0DataDouble()
+        np.testing.assert_array_equal(expected[0], dfsFile.ReadItemTimeStep(1, 0).Data)
+        dfsFile.ReadDfs0DataDouble()
+        Assert.IsNull(dfsFile.ReadItemTimeStepNext())
+        dfsFile.Close()
+
+        async def run():
+            # One worker and one idle file, all requests use the same pooled file
+            async with DfsAsyncReader(maxWorkers = 1, maxIdleHandles = 1) as reader:
+                asyncFile = await reader.OpenAsync(filename)
+                for i in range(3):
+                    data = await asyncFile.ReadDfs0DataDoubleAsync()
+                    np.testing.assert_array_equal(expectedData, data)
+                    itemData = await asyncFile.ReadItemTimeStepAsync(1, i)
+                    np.testing.assert_array_equal(expected[i], itemData.Data)
+                    # A file pointer moved by a request does not leak to the next request
+                    itemData = await asyncFile.RunAsync(lambda dfsFile: dfsFile.ReadItemTimeStepNext())
+                    Assert.AreEqual(1, itemData.ItemNumber)
+                    Assert.AreEqual(0, itemData.TimeStepIndex)
+                Assert.AreEqual(1, reader.Pool.OpenCount)
+
+        asyncio.run(run())
+
+if __name__ == '__main__':
+    unittest.main()
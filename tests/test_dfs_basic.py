@@ -1,3 +1,6 @@
+import gc
+import sys
+import pytest
 from mikecore.DfsDLL import DfsDLL
 from mikecore.DfsFile import TimeAxisType, DfsFile, DfsDLLUtil
 from mikecore.DfsFileFactory import DfsFileFactory
@@ -52,3 +55,107 @@ def test_error_reporting():
     except Exception as e:
         print('Exception:', e)
 
+
+
+def test_probe():
+    import pickle
+    from mikecore.DfsuFile import DfsuFileType
+
+    dfs = DfsFileFactory.DfsGenericOpen("testdata/OresundHD.dfsu")
+    summary = DfsFileFactory.Probe("testdata/OresundHD.dfsu")
+
+    assert summary.FileTitle == dfs.FileInfo.FileTitle
+    assert summary.DfsuFileType == DfsuFileType.Dfsu2D
+    assert summary.NumberOfTimeSteps == dfs.FileInfo.TimeAxis.NumberOfTimeSteps
+    assert summary.ProjectionWKT == dfs.FileInfo.Projection.WKTString
+    assert summary.ItemNames == [item.Name for item in dfs.ItemInfo]
+    assert summary.ItemElementCounts == [item.ElementCount for item in dfs.ItemInfo]
+    assert (summary.CustomBlocks[0].Values == dfs.FileInfo.CustomBlocks[0].Values).all()
+    dfs.Close()
+
+    summary = pickle.loads(pickle.dumps(summary))
+    assert summary.ItemQuantities[0].Item == dfs.ItemInfo[0].Quantity.Item
+    assert summary.TimeAxis.StartDateTime == dfs.FileInfo.TimeAxis.StartDateTime
+
+    summary = DfsFileFactory.Probe("testdata/TemporalEqCal.dfs0")
+    assert summary.DfsuFileType is None
+    assert summary.TimeAxis.TimeAxisType == TimeAxisType.CalendarEquidistant
+    assert summary.ItemNames[0] == "WaterLevel item"
+
+
+def test_instrumentation():
+
+    dfs = DfsFileFactory.DfsGenericOpen("testdata/OresundHD.dfs2")
+    assert dfs.Stats is None
+
+    calls = []
+    stats = dfs.EnableInstrumentation(lambda name, seconds, nbytes: calls.append((name, nbytes)))
+    assert dfs.Stats is stats
+
+    nbytes = 0
+    data = dfs.ReadItemTimeStepNext()
+    while data is not None:
+        nbytes += data.Data.nbytes
+        data = dfs.ReadItemTimeStepNext()
+    dfs.ReadItemTimeStep(2, 1)
+    nbytes += 4 * dfs.ItemInfo[1].ElementCount
+
+    assert stats.BytesRead == nbytes
+    assert stats.BytesWritten == 0
+    assert stats.Seeks == 2
+    assert stats.NativeCalls["dfsFindBlockDynamic"] == 1
+    assert stats.NativeCalls["dfsFindItemDynamic"] == 1
+    assert 0 < stats.NativeTime < stats.ElapsedTime
+    assert sum(n for name, n in calls) == nbytes
+    assert stats.ToDict()["bytesRead"] == nbytes
+
+    # Repositioning at the current item-timestep is not a seek
+    dfs.ReadItemTimeStep(1, 0)
+    stats.Reset()
+    dfs.ReadItemTimeStep(2, 0)
+    assert stats.Seeks == 0
+
+    dfs.DisableInstrumentation()
+    assert dfs.Stats is None
+    dfs.ReadItemTimeStep(1, 0)
+    dfs.Close()
+
+
+def test_forward_read():
+
+    dfs = DfsFileFactory.DfsGenericOpen("testdata/OresundHD.dfs2")
+    numItems = len(dfs.ItemInfo)
+    stats = dfs.EnableInstrumentation()
+
+    # Short forward positioning reads the item-timesteps in between
+    dfs.ReadItemTimeStep(1, 0)
+    data = dfs.ReadItemTimeStep(numItems, 0).Data.copy()
+    assert stats.Seeks == 1
+    assert stats.ForwardReads == 1
+
+    # Same data when always seeking
+    dfs.MaxForwardReadBytes = 0
+    dfs.ReadItemTimeStep(1, 0)
+    assert (dfs.ReadItemTimeStep(numItems, 0).Data == data).all()
+    assert stats.Seeks == 3
+    assert stats.ForwardReads == 1
+    dfs.Close()
+
+
+def test_failed_init_and_open(monkeypatch):
+    # Close, called from __del__, must not fail for a partially created or opened file
+    unraisable = []
+    monkeypatch.setattr(sys, "unraisablehook", unraisable.append)
+
+    def failingInit(*args):
+        raise OSError("Could not load library")
+    with monkeypatch.context() as m:
+        m.setattr(DfsDLL, "Init", failingInit)
+        with pytest.raises(OSError):
+            DfsFile()
+    gc.collect()
+
+    with pytest.raises(Exception):
+        DfsFileFactory.DfsGenericOpen("testdata/doesnotexist.dfs0")
+    gc.collect()
+    assert unraisable == []
@@ -43,6 +43,23 @@ class Test_dfs_custom_block(unittest.TestCase):
 
         dfsFile.Close()
 
+    def test_ViewLifetime(self):
+        dfsFile = DfsFileFactory.DfsGenericOpen("testdata/OresundHD.dfs2")
+        customBlock = dfsFile.FileInfo.CustomBlocks[0];
+        customBlockCopy = customBlock.Copy()
+
+        # Values is a read-only view on native memory while the file is open
+        assert not customBlock.Values.flags.writeable
+        assert customBlockCopy.Values.flags.writeable
+        with self.assertRaises(ValueError):
+            customBlock[3] = 0
+
+        # After close values are still valid
+        dfsFile.Close()
+        assert_equal(327, customBlock.Values[0])
+        assert_equal(10, customBlock.Values[3])
+        assert_array_equal(customBlockCopy.Values, customBlock.Values)
+
     def test_UpdateCustomBlockDataTest(self):
 
         originalFilename = "testdata/OresundHD.dfs2";
@@ -2,6 +2,7 @@ import unittest
 from mikecore.DfsFileFactory import DfsFileFactory
 from mikecore.DfsFile import *
 from numpy.testing import *
+from tests.test_util import *
 
 class Test_dfs_static_item(unittest.TestCase):
 
@@ -123,6 +124,31 @@ class Test_dfs_static_item(unittest.TestCase):
         assert 1697 == staticItem.Data[10906]
         assert 2056 == staticItem.Data[10907]
 
+    def test_static_item_native_memory(self):
+        # In read mode the native static vector is released as soon as the data is copied
+        with DfsFileFactory.DfsGenericOpen("testdata/OresundHD.dfsu") as dfsFile:
+            staticItem = dfsFile.ReadStaticItem(2)
+            assert staticItem.VectorPointer is None
+            assert "X-coord" == staticItem.Name
+            assert 2057 == staticItem.SpatialAxis.XCount
+        assert dfsFile.filePointer.value is None
+        assert_allclose(359978.8, staticItem.Data[0])
+        # Closing twice is fine
+        dfsFile.Close()
+
+        # In edit mode the static item keeps the native static vector until the file is closed
+        filename = "testdata/testtmp/test_static_item_OresundHD.dfsu"
+        testUtil.copy_file("testdata/OresundHD.dfsu", filename)
+        with DfsFileFactory.DfsGenericOpenEdit(filename) as dfsFile:
+            staticItem = dfsFile.ReadStaticItem(4)
+            assert staticItem.VectorPointer is not None
+            data = staticItem.Data + 1
+            dfsFile.WriteStaticItemData(staticItem, data)
+        assert staticItem.VectorPointer is None
+
+        with DfsFileFactory.DfsGenericOpen(filename) as dfsFile:
+            assert_array_equal(data, dfsFile.ReadStaticItem(4).Data)
+
 
 
 
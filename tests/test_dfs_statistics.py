@@ -0,0 +1,115 @@
+import unittest
+import numpy as np
+from numpy.testing import *
+from mikecore.DfsFileFactory import DfsFileFactory
+from mikecore.DfsStatistics import DfsStatistics, DfsItemStatistics, DfsItemHistogram
+from tests.test_util import *
+
+def ReadItemAllTimeSteps(filename, itemNumber):
+    dfsFile = DfsFileFactory.DfsGenericOpen(filename)
+    res = np.array([dfsFile.ReadItemTimeStep(itemNumber, i).Data for i in range(dfsFile.FileInfo.TimeAxis.NumberOfTimeSteps)])
+    deleteValue = dfsFile.FileInfo.DeleteValueFloat
+    dfsFile.Close()
+    return np.ma.masked_equal(res, deleteValue).astype(np.float64)
+
+class Test_dfs_statistics(unittest.TestCase):
+
+    def test_StatisticsDfsu(self):
+        filename = "testdata/OresundHD.dfsu"
+        stats = DfsStatistics.Calculate(filename, thresholds = [0.1])
+
+        data = ReadItemAllTimeSteps(filename, 1)
+        itemStats = stats.ItemStatistics[0]
+        Assert.AreEqual(data.shape[0], stats.NumberOfTimeSteps)
+        assert_allclose(data.min(axis=0), itemStats.GetStatistic("Min"))
+        assert_allclose(data.max(axis=0), itemStats.GetStatistic("Max"))
+        assert_allclose(data.mean(axis=0), itemStats.GetStatistic("Mean"), rtol=1e-6)
+        assert_allclose(data.std(axis=0), itemStats.GetStatistic("Std"), rtol=1e-5, atol=1e-6)
+        assert_array_equal(data.argmax(axis=0), itemStats.GetStatistic("TimeStepOfMax"))
+        assert_array_equal((data > 0.1).sum(axis=0), itemStats.ExceedanceCount[0])
+
+        # Updating chunks of elements in parallel gives the same result
+        statsParallel = DfsStatistics.Calculate(filename, thresholds = [0.1], numberOfThreads = 4)
+        for name in DfsItemStatistics.StatisticNames:
+            assert_array_equal(itemStats.GetStatistic(name), statsParallel.ItemStatistics[0].GetStatistic(name))
+
+    def test_StatisticsMerge(self):
+        filename = "testdata/OresundHD.dfs2"
+        dfsFile = DfsFileFactory.DfsGenericOpen(filename)
+        stats = DfsStatistics(dfsFile, [1]).Compute()
+        # Merging statistics of the same file twice gives the same mean and std, but twice the count
+        merged = DfsStatistics(dfsFile, [1]).Compute().Merge(DfsStatistics(dfsFile, [1]).Compute())
+        dfsFile.Close()
+
+        itemStats = stats.ItemStatistics[0]
+        mergedStats = merged.ItemStatistics[0]
+        assert stats.ItemStatistics[1] is None
+        assert_array_equal(2 * itemStats.Count, mergedStats.Count)
+        assert_allclose(itemStats.GetStatistic("Mean"), mergedStats.GetStatistic("Mean"))
+        assert_allclose(itemStats.GetStatistic("Std"), mergedStats.GetStatistic("Std"), atol=1e-6)
+
+        # Cells without values get delete values
+        data = ReadItemAllTimeSteps(filename, 1)
+        noValues = data.count(axis=0) == 0
+        assert np.all(itemStats.GetStatistic("Max")[noValues] == itemStats.DeleteValue)
+
+    def test_StatisticsWriteDfsFile(self):
+        filename = "testdata/OresundHD.dfsu"
+        outFilename = "testdata/testtmp/test_statistics_OresundHD.dfsu"
+        dfsFile = DfsFileFactory.DfsGenericOpen(filename)
+        stats = DfsStatistics(dfsFile, thresholds = [0.1]).Compute()
+        stats.WriteDfsFile(outFilename, ("Max", "Mean"))
+        dfsFile.Close()
+
+        dfsuFile = DfsFileFactory.DfsuFileOpen(outFilename)
+        Assert.AreEqual(3 * len(stats.ItemStatistics), len(dfsuFile.ItemInfo))
+        Assert.AreEqual(1, dfsuFile.NumberOfTimeSteps)
+        Assert.AreEqual(3636, dfsuFile.NumberOfElements)
+        assert dfsuFile.ItemInfo[0].Name.startswith("Max ")
+        assert_allclose(stats.ItemStatistics[0].GetStatistic("Max"), dfsuFile.ReadItemTimeStep(1, 0).Data)
+        assert_allclose(stats.ItemStatistics[0].ExceedanceCount[0], dfsuFile.ReadItemTimeStep(3, 0).Data)
+        dfsuFile.Close()
+
+    def test_StatisticsWriteDfsFile3D(self):
+        filename = "testdata/OdenseHD3D.dfsu"
+        outFilename = "testdata/testtmp/test_statistics_OdenseHD3D.dfsu"
+        dfsFile = DfsFileFactory.DfsGenericOpen(filename)
+        zValues = dfsFile.ReadItemTimeStep(1, 0).Data.copy()
+        # Statistics of an item, without the Z item
+        stats = DfsStatistics(dfsFile, [2]).Compute()
+        stats.WriteDfsFile(outFilename, ("Max",))
+        dfsFile.Close()
+
+        dfsuFile = DfsFileFactory.DfsuFileOpen(outFilename)
+        Assert.AreEqual(2, len(dfsuFile.ItemInfo))
+        assert_allclose(zValues, dfsuFile.ReadItemTimeStep(1, 0).Data)
+        assert_allclose(stats.ItemStatistics[1].GetStatistic("Max"), dfsuFile.ReadItemTimeStep(2, 0).Data)
+        dfsuFile.Close()
+
+    def test_StatisticsQuantiles(self):
+        filename = "testdata/OresundHD.dfsu"
+        data = ReadItemAllTimeSteps(filename, 1)
+        minValue = data.min()
+        maxValue = data.max()
+        stats = DfsStatistics.Calculate(filename, [1], histogramRanges = {1: (minValue, maxValue)}, numberOfBins = 200)
+        binWidth = stats.ItemHistograms[0].BinWidth
+
+        # Quantiles are within one bin of the exact quantiles
+        p90 = stats.GetStatistic(1, "P90")
+        assert_allclose(np.quantile(data, 0.9, axis=0), p90, atol=binWidth)
+        assert_allclose(np.quantile(data, 0.5, axis=0), stats.GetStatistic(1, "P50"), atol=binWidth)
+
+        # Histograms of chunks of timesteps can be merged
+        dfsFile = DfsFileFactory.DfsGenericOpen(filename)
+        histogram = DfsItemHistogram(data.shape[1], dfsFile.FileInfo.DeleteValueFloat, minValue, maxValue, 200)
+        otherHistogram = DfsItemHistogram(data.shape[1], dfsFile.FileInfo.DeleteValueFloat, minValue, maxValue, 200)
+        for i in range(data.shape[0]):
+            itemData = dfsFile.ReadItemTimeStep(1, i)
+            (histogram if i % 2 == 0 else otherHistogram).Update(itemData.Data)
+        dfsFile.Close()
+        histogram.Merge(otherHistogram)
+        assert_array_equal(stats.ItemHistograms[0].Counts, histogram.Counts)
+        assert_array_equal(p90, histogram.Quantile(0.9))
+
+if __name__ == '__main__':
+    unittest.main()
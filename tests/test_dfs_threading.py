@@ -0,0 +1,71 @@
+import glob
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from mikecore.DfsFileFactory import DfsFileFactory
+from mikecore.DfsFile import _dfsSimpleTypeSize
+
+def ReadAllData(filename):
+    """Read all static and dynamic data of a file, returning the raw bytes"""
+    res = []
+    dfsFile = DfsFileFactory.DfsGenericOpen(filename)
+    while True:
+        staticItem = dfsFile.ReadStaticItemNext()
+        if staticItem is None:
+            break
+        res.append(staticItem.Data.tobytes())
+    while True:
+        itemData = dfsFile.ReadItemTimeStepNext()
+        if itemData is None:
+            break
+        res.append((itemData.ItemNumber, itemData.TimeStepIndex, itemData.Time, itemData.Data.tobytes()))
+    dfsFile.Close()
+    return res
+
+class Test_dfs_threading(unittest.TestCase):
+
+    def test_ConcurrentReadDistinctFiles(self):
+        filenames = sorted(glob.glob("testdata/*.dfs*"))
+        assert len(filenames) > 0
+
+        serial = [ReadAllData(filename) for filename in filenames]
+
+        # Every file is read several times, each time on its own DfsFile object
+        repeats = 4
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            concurrent = list(executor.map(ReadAllData, filenames * repeats))
+
+        for i in range(len(concurrent)):
+            assert serial[i % len(filenames)] == concurrent[i], filenames[i % len(filenames)]
+
+    def test_ReadAhead(self):
+        filename = "testdata/OresundHD.dfs2"
+        serial = ReadAllData(filename)
+        serial = [entry for entry in serial if isinstance(entry, tuple)]
+
+        dfsFile = DfsFileFactory.DfsGenericOpen(filename)
+        numItems = len(dfsFile.ItemInfo)
+        res = []
+        with dfsFile.ReadAhead(depth = 3) as readAhead:
+            assert readAhead.Depth == 3
+            for step in readAhead:
+                assert len(step) == numItems
+                for itemData in step:
+                    res.append((itemData.ItemNumber, itemData.TimeStepIndex, itemData.Time, itemData.Data.tobytes()))
+        assert serial == res
+
+        # Read ahead does not change the file pointer of the file itself
+        itemData = dfsFile.ReadItemTimeStepNext()
+        assert itemData.ItemNumber == 1 and itemData.TimeStepIndex == 0
+
+        # Memory limit of two time steps, one being processed and one read ahead
+        stepBytes = sum(item.ElementCount * _dfsSimpleTypeSize[item.DataType] for item in dfsFile.ItemInfo)
+        readAhead = dfsFile.ReadAhead(depth = 8, maxBytes = 2 * stepBytes, startTimeStepIndex = 2)
+        assert readAhead.Depth == 1
+        step = next(readAhead)
+        assert step[0].TimeStepIndex == 2
+        readAhead.Close()
+        assert not readAhead._thread.is_alive()
+        dfsFile.Close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -27,6 +27,19 @@ class Dfsu2DTests(unittest.TestCase):
       dfsuFilename = "testdata/testtmp/test_OresundHD.dfs2.dfsu";
       ExamplesDfsu.CreateDfsuFromDfs2(dfs2Filename, meshFilename, dfsuFilename);
 
+      dfs2 = DfsFileFactory.Dfs2FileOpen(dfs2Filename);
+      bathymetry = dfs2.ReadStaticItemNext().Data;
+      landValue = dfs2.FileInfo.CustomBlocks[0][3];
+      data = dfs2.ReadItemTimeStep(1, 3).Data;
+      dfs2.Close();
+
+      dfsu = DfsFileFactory.DfsuFileOpen(dfsuFilename);
+      water = bathymetry != landValue;
+      Assert.AreEqual(np.count_nonzero(water), dfsu.NumberOfElements);
+      assert np.all(dfsu.ElementType == 25);
+      assert_array_equal(data[water], dfsu.ReadItemTimeStep(1, 3).Data);
+      dfsu.Close();
+
     def test_ExtractSubareaDfsu2D(self):
       sourceFilename = "testdata/OresundHD.dfsu";
       outputFilename = "testdata/testtmp/test_extract_OresundHD.dfsu";
@@ -105,6 +118,116 @@ class Dfsu2DTests(unittest.TestCase):
       FileOdenseHD2DDfsu.DfsuFileInfoTester(dfsFile);
       FileOdenseHD2DDfsu.DfsFileInfoTester(dfsFile);
 
+    def test_LazyGeometryTest(self):
+      filename = "testdata/OresundHD.dfsu";
+
+      dfsFile = DfsFileFactory.DfsGenericOpen(filename);
+      x = dfsFile.ReadStaticItem(2).Data
+      itemData1 = dfsFile.ReadItemTimeStep(1, 0)
+      itemData2 = dfsFile.ReadItemTimeStepNext()
+      itemData3 = dfsFile.ReadItemTimeStepNext()
+      dfsFile.Close()
+
+      # Number of nodes and elements are available before reading geometry
+      dfsuFile = DfsFileFactory.DfsuFileOpen(filename);
+      Assert.AreEqual(2057, dfsuFile.NumberOfNodes)
+      Assert.AreEqual(3636, dfsuFile.NumberOfElements)
+
+      # Reading geometry in the middle of reading dynamic data must not move the file pointer
+      assert_array_equal(itemData1.Data, dfsuFile.ReadItemTimeStepNext().Data)
+      assert_array_equal(itemData2.Data, dfsuFile.ReadItemTimeStepNext().Data)
+      assert_array_equal(x, dfsuFile.X)
+      assert_array_equal(itemData3.Data, dfsuFile.ReadItemTimeStepNext().Data)
+      Assert.AreEqual(2057, dfsuFile.NumberOfNodes)
+      Assert.AreEqual(3636, dfsuFile.NumberOfElements)
+      Assert.AreEqual(3636, len(dfsuFile.ElementTable))
+      dfsuFile.Close()
+
+      # Geometry can be read after the file has been closed
+      dfsuFile = DfsFileFactory.DfsuFileOpen(filename);
+      dfsuFile.Close()
+      assert_array_equal(x, dfsuFile.X)
+      Assert.AreEqual(3636, len(dfsuFile.ElementTable))
+
+    def test_SubsetTest(self):
+      filename = "testdata/OresundHD.dfsu";
+      x1, y1, x2, y2 = 340000, 6160000, 360000, 6180000
+
+      dfsu = DfsFileFactory.DfsuFileOpen(filename);
+
+      # Element is included if one of its nodes is inside the box
+      elmtsIncluded = [];
+      for i in range(dfsu.NumberOfElements):
+        nodes = dfsu.ElementTable[i] - 1;
+        if (np.any((x1 <= dfsu.X[nodes]) & (dfsu.X[nodes] <= x2) & (y1 <= dfsu.Y[nodes]) & (dfsu.Y[nodes] <= y2))):
+          elmtsIncluded.append(i);
+
+      subset = dfsu.Subset(bbox = (x1, y1, x2, y2));
+      assert_array_equal(elmtsIncluded, subset.ElementIndices)
+
+      # A polygon equal to the box gives the same subset, so does the element mask
+      polygon = np.array([[x1, y1], [x2, y1], [x2, y2], [x1, y2]])
+      assert_array_equal(elmtsIncluded, dfsu.Subset(polygon = polygon).ElementIndices)
+      mask = np.zeros(dfsu.NumberOfElements, dtype=bool)
+      mask[elmtsIncluded] = True
+      assert_array_equal(elmtsIncluded, dfsu.Subset(elements = mask).ElementIndices)
+
+      # Renumbered element table refers to the same node coordinates
+      for i in range(subset.NumberOfElements):
+        nodes = dfsu.ElementTable[subset.ElementIndices[i]] - 1
+        assert_array_equal(dfsu.X[nodes], subset.X[subset.ElementTable[i] - 1])
+        assert_array_equal(dfsu.Y[nodes], subset.Y[subset.ElementTable[i] - 1])
+
+      outputFilename = "testdata/testtmp/test_subset_OresundHD.dfsu";
+      subset.WriteDfsu(outputFilename);
+
+      dfsuOut = DfsFileFactory.DfsuFileOpen(outputFilename);
+      Assert.AreEqual(subset.NumberOfNodes, dfsuOut.NumberOfNodes)
+      Assert.AreEqual(subset.NumberOfElements, dfsuOut.NumberOfElements)
+      Assert.AreEqual(dfsu.NumberOfTimeSteps, dfsuOut.NumberOfTimeSteps)
+      for j in range(len(dfsu.ItemInfo)):
+        itemData = dfsu.ReadItemTimeStep(j + 1, 2)
+        itemDataOut = dfsuOut.ReadItemTimeStep(j + 1, 2)
+        assert_array_equal(itemData.Data[elmtsIncluded], itemDataOut.Data)
+      dfsuOut.Close()
+      dfsu.Close()
+
+    def test_ElementCenterCoordinatesTest(self):
+      dfsu = DfsFileFactory.DfsuFileOpen("testdata/OresundHD.dfsu");
+      xc, yc, zc = dfsu.CalculateElementCenterCoordinates()
+      nodes = dfsu.ElementTable[0] - 1
+      assert_allclose(np.mean(dfsu.X[nodes]), xc[0])
+      assert_allclose(np.mean(dfsu.Y[nodes]), yc[0])
+      assert_allclose(np.mean(dfsu.Z[nodes]), zc[0], rtol=1e-6)
+      dfsu.Close()
+
+    def test_ElementToNodeValuesTest(self):
+      dfsu = DfsFileFactory.DfsuFileOpen("testdata/OresundHD.dfsu");
+      data = dfsu.ReadItemTimeStep(1, 3).Data
+      nodeValues = dfsu.ElementToNodeValues(data)
+      Assert.AreEqual(dfsu.NumberOfNodes, nodeValues.size)
+      Assert.IsTrue(dfsu.GetElementToNodeWeights() is dfsu.GetElementToNodeWeights())
+
+      # Node values are between the min and max of the elements around the node
+      nodesPerElmt, connectivity = dfsu.GetConnectivityArrays()
+      elmtIndex = np.repeat(np.arange(dfsu.NumberOfElements), nodesPerElmt)
+      nodeMin = np.full(dfsu.NumberOfNodes, np.inf)
+      nodeMax = np.full(dfsu.NumberOfNodes, -np.inf)
+      np.minimum.at(nodeMin, connectivity - 1, data[elmtIndex])
+      np.maximum.at(nodeMax, connectivity - 1, data[elmtIndex])
+      assert np.all(nodeValues >= nodeMin - 1e-5)
+      assert np.all(nodeValues <= nodeMax + 1e-5)
+
+      # Delete values are not used, nodes with only delete values get delete values
+      data[:] = 1.0
+      data[0] = dfsu.DeleteValueFloat
+      nodeValues = dfsu.ElementToNodeValues(data)
+      nodesOfFirst = dfsu.ElementTable[0] - 1
+      onlyFirst = np.bincount(connectivity - 1, minlength=dfsu.NumberOfNodes)[nodesOfFirst] == 1
+      assert np.all(nodeValues[nodesOfFirst[onlyFirst]] == dfsu.DeleteValueFloat)
+      assert np.all(nodeValues[nodesOfFirst[~onlyFirst]] == 1.0)
+      dfsu.Close()
+
 #    def test_UpdateGeometryOresundHDTest(self):
 #      sourceFilename = "testdata/OresundHD.dfsu";
 #      filename = "testdata/testtmp/test_copy_OresundHD.dfsu";
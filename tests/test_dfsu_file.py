@@ -156,6 +156,86 @@ class DfsuFileTests(unittest.TestCase):
         Assert.AreEqual(3700, len(topLayerIndices));
         Assert.AreEqual(3700, len(topLayerIndices2));
 
+    def test_ReadLayer3DSigmaZOresundTest(self):
+      filename = "testdata/Oresund3DSigmaZ.dfsu";
+      dfsFile = DfsFileFactory.DfsuFileOpen(filename);
+      layers = dfsFile.Layers
+      topLayerElements = DfsuUtil.FindTopLayerElements(dfsFile.ElementTable)
+      assert_array_equal(topLayerElements, layers.TopLayerElements)
+      Assert.AreEqual(3700, layers.NumberOfColumns)
+      Assert.AreEqual(DfsuUtil.FindMaxNumberOfLayers(topLayerElements), layers.NumberOfLayers)
+
+      itemData = dfsFile.ReadItemTimeStep(2, 1)
+      top = dfsFile.ReadLayer(2, "top", 1)
+      assert_array_equal(itemData.Data[topLayerElements], top)
+      assert_array_equal(top, dfsFile.ReadLayer(2, -1, [0, 1])[1])
+      assert_array_equal(top, dfsFile.ReadLayer(2, layers.NumberOfLayers, 1))
+
+      # Bottom layer exists only in the deepest columns
+      bottom = dfsFile.ReadLayer(2, 1, 1)
+      deepest = layers.LayersInColumn == layers.NumberOfLayers
+      assert_array_equal(itemData.Data[layers.BottomLayerElements[deepest]], bottom[deepest])
+      assert np.all(bottom[~deepest] == dfsFile.DeleteValueFloat)
+
+      # A z coordinate just below the surface is in the top layer element
+      zData = dfsFile.ReadItemTimeStep(1, 1).Data
+      zBottom, zTop = layers.ElementFaceZ(zData)
+      z = float(np.min(zTop[topLayerElements]) - 1e-3)
+      atZ = dfsFile.ReadLayer(2, z, 1)
+      inTop = zBottom[topLayerElements] < z
+      assert_array_equal(top[inTop], atZ[inTop])
+
+      filename2 = "testdata/testtmp/test_layer_Oresund3DSigmaZ.dfsu";
+      dfsFile.WriteLayerDfsu(filename2, "top")
+      dfsu2File = DfsFileFactory.DfsuFileOpen(filename2);
+      Assert.AreEqual(DfsuFileType.Dfsu2D, dfsu2File.DfsuFileType)
+      Assert.AreEqual(3700, dfsu2File.NumberOfElements)
+      Assert.AreEqual(len(dfsFile.ItemInfo) - 1, len(dfsu2File.ItemInfo))
+      Assert.AreEqual(dfsFile.NumberOfTimeSteps, dfsu2File.NumberOfTimeSteps)
+      assert_array_equal(top, dfsu2File.ReadItemTimeStep(1, 1).Data)
+      dfsu2File.Close()
+      dfsFile.Close()
+
+    def test_ColumnStatistic3DSigmaZOresundTest(self):
+      filename = "testdata/Oresund3DSigmaZ.dfsu";
+      dfsFile = DfsFileFactory.DfsuFileOpen(filename);
+      layers = dfsFile.Layers
+
+      zData = dfsFile.ReadItemTimeStep(1, 1).Data
+      data = dfsFile.ReadItemTimeStep(2, 1).Data
+      thickness = layers.ElementThickness(zData)
+
+      mean = dfsFile.ReadColumnStatistic(2, "mean", 1)
+      minValues = dfsFile.ReadColumnStatistic(2, "min", [1])[0]
+      maxValues = dfsFile.ReadColumnStatistic(2, "max", 1)
+
+      # Compare with reductions column by column
+      for column in (0, 23, 1000, 3699):
+        elmts = layers.ColumnElements(column)
+        assert_allclose(np.sum(data[elmts] * thickness[elmts]) / np.sum(thickness[elmts]), mean[column], rtol=1e-5)
+        Assert.AreEqual(np.min(data[elmts]), minValues[column])
+        Assert.AreEqual(np.max(data[elmts]), maxValues[column])
+
+        # Profile at element center of top element of column
+        x, y, z = dfsFile.CalculateElementCenterCoordinates()
+        top = layers.TopLayerElements[column]
+        Assert.AreEqual(column, layers.FindColumn(x[top], y[top]))
+        zProfile, profile = dfsFile.ReadProfile(2, x[top], y[top], 1)
+        assert_array_equal(data[elmts], profile)
+        assert np.all(np.diff(zProfile) > 0)
+
+      dfsFile.Close()
+
+    def test_ColumnStatisticVerticalProfileTest(self):
+      filename = "testdata/VerticalProfileSigmaZ.dfsu";
+      dfsFile = DfsFileFactory.DfsuFileOpen(filename);
+      layers = dfsFile.Layers
+      data = dfsFile.ReadItemTimeStep(2, 0).Data
+      maxValues = dfsFile.ReadColumnStatistic(2, "max", 0)
+      Assert.AreEqual(layers.NumberOfColumns, maxValues.size)
+      Assert.AreEqual(np.max(data), np.max(maxValues))
+      dfsFile.Close()
+
     #endregion
 
     #region 3D dfsu with only sigma, but mixed triangle-quads
@@ -1,6 +1,8 @@
 import unittest
 from tests.test_util import *
+from enum import IntEnum
 from mikecore.eum import *
+from mikecore.TableEnum import TableEnum
 
 
 class TestEUM(unittest.TestCase):
@@ -87,3 +89,40 @@ class TestEUM(unittest.TestCase):
         Assert.AreEqual(np.array([0.5, 1, 2, 3.280839895]), array, 1e-6)
 
 
+
+    def test_enums(self):
+        # Lookup by name and by value returns the same member
+        Assert.IsTrue(eumItem.eumIWaterLevel is eumItem(100000))
+        Assert.IsTrue(eumItem.eumIWaterLevel is eumItem["eumIWaterLevel"])
+        Assert.IsTrue(eumUnit.eumUmeter is eumUnit(eumUnit.eumUmeter))
+        Assert.AreEqual("eumIWaterLevel", eumItem(100000).name)
+        Assert.AreEqual(1000, eumUnit.eumUmeter.value)
+
+        # Members are ints
+        Assert.IsTrue(isinstance(eumUnit.eumUmeter, int))
+        Assert.AreEqual(1000, eumUnit.eumUmeter)
+        Assert.AreEqual(1001, eumUnit.eumUmeter + 1)
+        Assert.AreEqual("1000", str(eumUnit.eumUmeter))
+        Assert.AreEqual("<eumUnit.eumUmeter: 1000>", repr(eumUnit.eumUmeter))
+        Assert.IsTrue(eumUnit.eumUmeter in eumUnit)
+        # As for Enum, plain int values are not members
+        Assert.IsFalse(1000 in eumUnit)
+        Assert.IsFalse(eumUnit.eumUmeter in eumItem)
+        Assert.IsTrue(isinstance(eumUnit.eumUmeter, TableEnum))
+        Assert.IsFalse(isinstance(eumUnit.eumUmeter, IntEnum))
+
+        # All members in value order
+        items = list(eumItem)
+        Assert.AreEqual(len(eumItem), len(items))
+        Assert.AreEqual(eumItem.eumIItemUndefined, items[0])
+        Assert.IsTrue(all(items[i] < items[i+1] for i in range(len(items)-1)))
+
+        with self.assertRaises(ValueError):
+            eumItem(12345)
+        with self.assertRaises(AttributeError):
+            eumItem.eumINoSuchItem
+        with self.assertRaises(KeyError):
+            eumItem["eumINoSuchItem"]
+
+        import pickle
+        Assert.IsTrue(eumItem.eumIDischarge is pickle.loads(pickle.dumps(eumItem.eumIDischarge)))
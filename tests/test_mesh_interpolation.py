@@ -0,0 +1,66 @@
+import unittest
+import numpy as np
+from numpy.testing import *
+from mikecore.DfsFileFactory import DfsFileFactory
+from mikecore.MeshFile import MeshFile
+from mikecore.MeshInterpolation import MeshInterpolator, MeshElementSearcher
+from mikecore.DfsuFile import DfsuUtil
+from tests.test_util import *
+
+class Test_mesh_interpolation(unittest.TestCase):
+
+    def test_NearestSubset(self):
+        dfsu = DfsFileFactory.DfsuFileOpen("testdata/OresundHD.dfsu")
+        subset = dfsu.Subset(bbox = (340000, 6160000, 360000, 6180000))
+        data = dfsu.ReadItemTimeStep(1, 3).Data
+
+        # Element centers of the subset are inside the same element of the source
+        interpolator = MeshInterpolator.Create(dfsu, subset, "nearest")
+        assert_array_equal(subset.ExtractItemData(data), interpolator.Apply(data, dfsu.DeleteValueFloat))
+
+        # Weights are reused for the same geometries
+        Assert.IsTrue(interpolator.Weights is MeshInterpolator.Create(dfsu, subset, "nearest").Weights)
+
+        # The subset does not cover all of the source, those elements get delete values
+        reverse = MeshInterpolator.Create(subset, dfsu, "nearest").Apply(subset.ExtractItemData(data), dfsu.DeleteValueFloat)
+        inSubset = np.zeros(dfsu.NumberOfElements, dtype=bool)
+        inSubset[subset.ElementIndices] = True
+        assert_array_equal(data[inSubset], reverse[inSubset])
+        assert np.all(reverse[~inSubset] == dfsu.DeleteValueFloat)
+        dfsu.Close()
+
+    def test_BarycentricMesh(self):
+        mesh = MeshFile.ReadMesh("testdata/Oresund.mesh")
+        # Interpolating to the nodes of the same mesh returns the node values
+        interpolator = MeshInterpolator.Create(mesh, mesh, "barycentric", targetNodes = True)
+        assert_allclose(mesh.Z, interpolator.Apply(np.asarray(mesh.Z)), rtol=1e-10, atol=1e-8)
+
+        # Linear functions are reproduced exactly at element centers
+        x = np.asarray(mesh.X)
+        y = np.asarray(mesh.Y)
+        elementNodes = DfsuUtil.ElementNodeMatrix(*DfsuUtil.ElementTableToArrays(mesh.ElementTable))
+        valid = elementNodes >= 0
+        xc = np.where(valid, x[elementNodes], 0).sum(axis=1) / valid.sum(axis=1)
+        yc = np.where(valid, y[elementNodes], 0).sum(axis=1) / valid.sum(axis=1)
+        values = MeshInterpolator.Create(mesh, mesh, "barycentric").Apply(2*x - 3*y)
+        assert_allclose(2*xc - 3*yc, values, rtol=1e-10)
+
+    def test_BarycentricElementValues(self):
+        dfsu = DfsFileFactory.DfsuFileOpen("testdata/OresundHD.dfsu")
+        data = dfsu.ReadItemTimeStep(1, 3).Data
+        # Element values are interpolated to the nodes before the barycentric interpolation
+        interpolator = MeshInterpolator.Create(dfsu, dfsu, "barycentric", targetNodes = True, elementValues = True)
+        assert_allclose(dfsu.ElementToNodeValues(data), interpolator.Apply(data, dfsu.DeleteValueFloat), rtol=1e-5)
+        dfsu.Close()
+
+    def test_ElementSearcher(self):
+        dfsu = DfsFileFactory.DfsuFileOpen("testdata/OresundHD.dfsu")
+        nodesPerElmt, connectivity = dfsu.GetConnectivityArrays()
+        searcher = MeshElementSearcher(dfsu.X, dfsu.Y, DfsuUtil.ElementNodeMatrix(nodesPerElmt, connectivity))
+        xc, yc, zc = dfsu.CalculateElementCenterCoordinates()
+        assert_array_equal(np.arange(dfsu.NumberOfElements), searcher.FindElements(xc, yc))
+        Assert.AreEqual(-1, searcher.FindElements([0.0], [0.0])[0])
+        dfsu.Close()
+
+if __name__ == '__main__':
+    unittest.main()